@@ -5,10 +5,13 @@
 
     Note:
         This .py file takes quite some time to run so if you wish to run this file, do expect to wait a few minutes.
+        The tables are measured with benchmark.py, which can also be run on its own for a single configuration.
 """
 
 __author__ = 'Benjamin Leong Tjen Ho'
+from benchmark import benchmark, hash_counts, load_corpus, standard_deviation
 from hash_table import LinearProbePotionTable
+from primes import previous_prime
 
 # small_list = ['corny', 'troll', 'vodka', 'tease', 'banal', 'ricer', 'frosh', 'dingo', 'mated', 'fangs']
 # The small list was initially planned to be used but in the end was scrapped as it's input size is too insignificant
@@ -569,33 +572,23 @@ large_list = ['which', 'there', 'their', 'about', 'would', 'these', 'other', 'wo
               'roble', 'rumba', 'biffy', 'pupal']
 input_size_pairs = {10: 19, 330: 659, 5757: 11503}
 input_list_pairs = {330: medium_list, 5757: large_list}
+corpus_path = 'words.txt'
 
 
 def analyse(b: int, input_size: int):
     tablesize, input_list = input_size_pairs[input_size], input_list_pairs[input_size]
 
-    good_list, bad_list = [0] * tablesize, [0] * tablesize
+    good_results = benchmark(input_list, True, tablesize_override=tablesize)
+    bad_results = benchmark(input_list, False, tablesize_override=tablesize)
+    good_stats, bad_stats = table_statistics(good_results), table_statistics(bad_results)
 
-    good_table = LinearProbePotionTable(input_size, True, tablesize)
-    bad_table = LinearProbePotionTable(input_size, False, tablesize)
-
-    for table, good in [(good_table, True), (bad_table, False)]:
-        for key in input_list:
-            table.insert(key, key)
-            good_list[good_hash(key, tablesize, b)] += 1
-            bad_list[bad_hash(key, tablesize)] += 1
+    good_list = hash_counts(input_list, lambda key, size: good_hash(key, size, b), tablesize)
+    bad_list = hash_counts(input_list, bad_hash, tablesize)
 
     good_range, bad_range = max(good_list) - min(good_list), max(bad_list) - min(bad_list)
     good_sd, bad_sd = standard_deviation(good_list), standard_deviation(bad_list)
 
-    return good_table.statistics(), good_range, good_sd, bad_table.statistics(), bad_range, bad_sd
-
-
-def standard_deviation(input_list: list[int]) -> float:
-    sigma_x = sum(input_list)
-    sigma_x2 = sum([x ** 2 for x in input_list])
-    n = len(input_list)
-    return (sigma_x2 / n - (sigma_x / n) ** 2) ** 0.5
+    return good_stats, good_range, good_sd, bad_stats, bad_range, bad_sd
 
 
 def good_hash(key_val: str, tablesize: int, b: int) -> int:
@@ -627,34 +620,63 @@ def bad_hash(key_val: str, tablesize: int) -> int:
     return ord(key_val[0]) * 2 % tablesize
 
 
-b_val_list = [12, 23, 27183, 27179]
-input_list = [330, 5757]
-for i, b_val in enumerate(b_val_list):
-    for j, input_ in enumerate(input_list):
+def table_statistics(results: dict) -> tuple:
+    # The statistics of a table, in the order of LinearProbePotionTable.statistics()
+    return results["conflict_count"], results["probe_total"], results["probe_max"], results["rehash_count"]
+
+
+def analyse_probe_strategies(corpus: list[str], good: bool) -> dict:
+    # The table is sized to the largest prime below twice the corpus, as in input_size_pairs
+    tablesize = previous_prime(2 * len(corpus))
+
+    strategy_stats = {}
+    for strategy in LinearProbePotionTable.PROBE_STRATEGIES:
+        strategy_stats[strategy] = table_statistics(benchmark(corpus, good, strategy, tablesize))
+    return strategy_stats
 
-        good_stats, good_range, good_sd, bad_stats, bad_range, bad_sd = analyse(b_val, input_)
-        good_c_count, good_p_total, good_p_max = good_stats
-        bad_c_count, bad_p_total, bad_p_max = bad_stats
 
+if __name__ == '__main__':
+    b_val_list = [12, 23, 27183, 27179]
+    input_list = [330, 5757]
+    for i, b_val in enumerate(b_val_list):
+        for j, input_ in enumerate(input_list):
+
+            good_stats, good_range, good_sd, bad_stats, bad_range, bad_sd = analyse(b_val, input_)
+            good_c_count, good_p_total, good_p_max, _ = good_stats
+            bad_c_count, bad_p_total, bad_p_max, _ = bad_stats
+
+            print("".join(['==============================================',
+                           '\nTEST CASE #' + str(sum([i * len(input_list), j, 1])),
+                           '\nb = ', str(b_val), ' | tablesize = ', str(input_size_pairs[input_]),
+                           ' | input size = ', str(input_),
+                           '\n----------------------------------------------',
+                           '\nGOOD TABLE',
+                           '\n----------------------------------------------',
+                           '\nconflict_count:      ', str(good_c_count),
+                           '\nprobe_total:         ', str(good_p_total),
+                           '\nprobe_max:           ', str(good_p_max),
+                           '\nrange of hash count: ', str(good_range),
+                           '\nstandard deviation:  ', f'{good_sd:.2f}',
+                           '\n----------------------------------------------',
+                           '\nBAD TABLE',
+                           '\n----------------------------------------------',
+                           '\nconflict_count:      ', str(bad_c_count),
+                           '\nprobe_total:         ', str(bad_p_total),
+                           '\nprobe_max:           ', str(bad_p_max),
+                           '\nrange of hash count: ', str(bad_range),
+                           '\nstandard deviation:  ', f'{bad_sd:.2f}',
+                           '\n==============================================\n'
+                           ]))
+
+    # Comparing the probe strategies on the corpus, to measure how much primary clustering each of them avoids
+    corpus = load_corpus(corpus_path)
+    for j, good in enumerate([True, False]):
         print("".join(['==============================================',
-                       '\nTEST CASE #' + str(sum([i * len(input_list), j, 1])),
-                       '\nb = ', str(b_val), ' | tablesize = ', str(input_size_pairs[input_]),
-                       ' | input size = ', str(input_),
-                       '\n----------------------------------------------',
-                       '\nGOOD TABLE',
-                       '\n----------------------------------------------',
-                       '\nconflict_count:      ', str(good_c_count),
-                       '\nprobe_total:         ', str(good_p_total),
-                       '\nprobe_max:           ', str(good_p_max),
-                       '\nrange of hash count: ', str(good_range),
-                       '\nstandard deviation:  ', f'{good_sd:.2f}',
-                       '\n----------------------------------------------',
-                       '\nBAD TABLE',
+                       '\nPROBE STRATEGY CASE #' + str(j + 1),
+                       '\n', 'GOOD' if good else 'BAD', ' TABLE | corpus = ', corpus_path,
+                       ' | tablesize = ', str(previous_prime(2 * len(corpus))), ' | input size = ', str(len(corpus)),
                        '\n----------------------------------------------',
-                       '\nconflict_count:      ', str(bad_c_count),
-                       '\nprobe_total:         ', str(bad_p_total),
-                       '\nprobe_max:           ', str(bad_p_max),
-                       '\nrange of hash count: ', str(bad_range),
-                       '\nstandard deviation:  ', f'{bad_sd:.2f}',
-                       '\n==============================================\n'
-                       ]))
+                       '\nstrategy   conflicts  probe_total  probe_max  rehashes']))
+        for strategy, stats in analyse_probe_strategies(corpus, good).items():
+            print("".join([strategy.ljust(11), *[str(stat).ljust(11) for stat in stats]]).rstrip())
+        print('==============================================\n')
@@ -0,0 +1,555 @@
+""" AVL Tree ADT
+
+Defines an AVL tree whose nodes are kept in a pool of parallel arrays instead of one Python object per node.
+A node is an index into the columns of the pool: its key is a float in an array('d'), and its children, height and
+subtree size are integers in array('i') columns. Only the items are kept in a list, as they are arbitrary Python
+objects. The first slot of the pool is a sentinel, NIL, standing for a missing child: its height is -1 and its size 0,
+so the height and size of a child are read from the columns without checking for NIL first.
+The slots of deleted nodes are chained into a free list through their left column, and reused by later inserts.
+"""
+__docformat__ = 'reStructuredText'
+
+from array import array
+from heapq import merge
+from operator import itemgetter
+from typing import TypeVar, Generic, Iterator
+
+from avl import sorted_pairs
+from node import TreeNode
+
+I = TypeVar('I')
+
+
+class ArrayAVLTree(Generic[I]):
+    """ Array Based AVL Tree
+
+    A self-balancing binary search tree with float keys, sharing the interface of AVLTree used by Game: __setitem__,
+    __delitem__, __getitem__, __contains__, __len__, iteration over the keys in order and the order statistics:
+    kth_largest(), kth_smallest(), select(), rank() and count_range().
+    As there are no node objects, the tree holds no references between nodes for the garbage collector to follow,
+    copy() only copies the columns and clear() drops them.
+
+    attributes:
+        free (int): index of the first free slot of the pool, NIL if every slot is used
+        heights (array): height of the subtree of each node, a leaf having a height of 0 and NIL a height of -1
+        items (list): item of each node, None for a free slot or NIL
+        keys (array): key of each node
+        lefts (array): index of the left child of each node, or of the next free slot for a free slot
+        length (int): number of nodes in the tree
+        rights (array): index of the right child of each node
+        root (int): index of the root node, NIL when the tree is empty
+        sizes (array): number of nodes in the subtree of each node, 0 for NIL
+
+    Class Variables:
+        NIL (int): index of the sentinel slot, standing for a missing node
+    """
+    NIL = 0
+
+    def __init__(self) -> None:
+        """
+            Initialises an empty tree with an empty pool
+            :complexity: O(1)
+        """
+        self.clear()
+
+    def clear(self) -> None:
+        """
+            Removes every node of the tree, releasing the pool down to the NIL sentinel
+            :complexity: O(1), as the columns are replaced rather than emptied
+        """
+        self.keys = array('d', [0.0])
+        self.lefts = array('i', [self.NIL])
+        self.rights = array('i', [self.NIL])
+        self.heights = array('i', [-1])
+        self.sizes = array('i', [0])
+        self.items = [None]
+        self.root = self.NIL
+        self.free = self.NIL
+        self.length = 0
+
+    def copy(self) -> 'ArrayAVLTree[I]':
+        """
+            Returns a snapshot of the tree, sharing its items but none of its columns
+            :complexity: O(P) where P is the number of slots of the pool
+        """
+        snapshot = ArrayAVLTree()
+        snapshot.keys, snapshot.lefts, snapshot.rights = array('d', self.keys), array('i', self.lefts), \
+            array('i', self.rights)
+        snapshot.heights, snapshot.sizes, snapshot.items = array('i', self.heights), array('i', self.sizes), \
+            list(self.items)
+        snapshot.root, snapshot.free, snapshot.length = self.root, self.free, self.length
+        return snapshot
+
+    @classmethod
+    def from_sorted(cls, pairs: list[tuple[float, I]]) -> 'ArrayAVLTree[I]':
+        """
+            Creates a perfectly balanced tree holding (key, item) pairs, in linear time when they are sorted by key.
+        :complexity: O(n) when pairs is sorted, O(n log n) otherwise, where n = len(pairs)
+        :raises ValueError: When two pairs have the same key
+        :see: #self.bulk_load(pairs: list[tuple[float, I]])
+        """
+        tree = cls()
+        tree.bulk_load(pairs)
+        return tree
+
+    def bulk_load(self, pairs: list[tuple[float, I]]) -> None:
+        """
+            Adds (key, item) pairs to the tree, rebuilding it perfectly balanced in a single pass. The pairs are sorted
+            first unless they already are, then merged with the nodes of the tree in order. The merged pairs fill the
+            pool in order, so the free list is emptied, and the tree is built bottom-up from their middle.
+            The tree is left unchanged if a key is a duplicate, or cannot be stored as a float.
+        :complexity: O(n + m) when pairs is sorted, O(n + m log m) otherwise, where n is the number of nodes of the
+                        tree and m = len(pairs)
+        :raises ValueError: When two pairs have the same key, or a key is already in the tree
+        :raises OverflowError: When a key is too large for a float
+        :see: #AVLTree.bulk_load(pairs: list[tuple[K, I]])
+        """
+        pairs = sorted_pairs(pairs)
+        if self.root != self.NIL:
+            pairs = sorted_pairs(list(merge(self.__pairs(), pairs, key=itemgetter(0))))
+
+        # Converting the keys before the tree is cleared, so a key which is not a float leaves it unchanged
+        keys = array('d', [0.0])
+        keys.extend(key for key, _ in pairs)
+
+        self.clear()
+        self.keys = keys
+        self.items.extend(item for _, item in pairs)
+        self.lefts.extend([self.NIL] * len(pairs))
+        self.rights.extend([self.NIL] * len(pairs))
+        self.heights.extend([0] * len(pairs))
+        self.sizes.extend([1] * len(pairs))
+        self.root = self.__build(1, len(pairs))
+        self.length = len(pairs)
+
+    def is_empty(self) -> bool:
+        """
+            Checks to see if the tree is empty
+            :complexity: O(1)
+        """
+        return self.root == self.NIL
+
+    def __len__(self) -> int:
+        """ Returns the number of nodes in the tree. """
+        return self.length
+
+    def __contains__(self, key: float) -> bool:
+        """
+            Checks to see if the key is in the tree
+            :complexity: O(log n) where n is the number of nodes in the tree
+        """
+        return self.__find(key) != self.NIL
+
+    def __getitem__(self, key: float) -> I:
+        """
+            Attempts to get an item in the tree, it uses the Key to attempt to find it
+            :complexity: O(log n) where n is the number of nodes in the tree
+            :raises KeyError: When the key is not in the tree
+        """
+        index = self.__find(key)
+        if index == self.NIL:
+            raise KeyError('Key not found: {0}'.format(key))
+        return self.items[index]
+
+    def __iter__(self) -> Iterator[float]:
+        """
+            In-order iterator over the keys of the tree, using a stack of indices
+            :complexity: O(n) to iterate over the whole tree, where n is the number of nodes
+        """
+        stack = []
+        current = self.root
+        while current != self.NIL or len(stack) > 0:
+            while current != self.NIL:
+                stack.append(current)
+                current = self.lefts[current]
+            current = stack.pop()
+            yield self.keys[current]
+            current = self.rights[current]
+
+    def __setitem__(self, key: float, item: I) -> None:
+        """
+            Inserts an item into the tree with the key, rebalancing the tree along the path walked down.
+            The tree is left unchanged if the key is a duplicate.
+        :param key:         The key value to determine the location of the new node.
+        :param item:        The item that will be store in the new location.
+        :complexity:        O(log n), where n is the number of nodes in the tree.
+        :raises ValueError: When key is already in the tree
+
+        ----------------------------------------------------------------------------------------------------------------
+        METHODS CALLED                      | COMPLEXITY  |   REMARKS
+        ------------------------------------|-------------|-------------------------------------------------------------
+        ArrayAVLTree.__allocate()           | O(1)        |   Amortised, as the columns may grow
+        ArrayAVLTree.__rebalance_path()     | O(log n)    |   where n is the size of the tree
+        ------------------------------------|-------------|-------------------------------------------------------------
+        ----------------------------------------------------------------------------------------------------------------
+        """
+        # Walking down to the leaf position of the key, keeping the path taken
+        path = []
+        current = self.root
+        while current != self.NIL:
+            path.append(current)
+            if key < self.keys[current]:
+                current = self.lefts[current]
+            elif key > self.keys[current]:
+                current = self.rights[current]
+            else:  # key == self.keys[current]
+                raise ValueError('Inserting duplicate item')
+
+        new_node = self.__allocate(key, item)
+        self.length += 1
+        if len(path) == 0:
+            self.root = new_node
+            return
+
+        # Every node of the path has one more node in its subtree
+        for index in path:
+            self.sizes[index] += 1
+        if key < self.keys[path[-1]]:
+            self.lefts[path[-1]] = new_node
+        else:
+            self.rights[path[-1]] = new_node
+
+        self.root = self.__rebalance_path(path)
+
+    def __delitem__(self, key: float) -> None:
+        """
+            Deletes the node of the key from the tree, rebalancing the tree along the path walked down.
+            The slot of the node removed is added to the free list. The tree is left unchanged if key is not in it.
+        :param key:         The key value used to determine the location of the deleting node
+        :complexity:        O(log n), where n is the number of nodes in the tree.
+        :raises ValueError: When key is not in the tree
+
+        ----------------------------------------------------------------------------------------------------------------
+        METHODS CALLED                      | COMPLEXITY  |   REMARKS
+        ------------------------------------|-------------|-------------------------------------------------------------
+        ArrayAVLTree.__release()            | O(1)        |
+        ArrayAVLTree.__rebalance_path()     | O(log n)    |   where n is the size of the tree
+        ------------------------------------|-------------|-------------------------------------------------------------
+        ----------------------------------------------------------------------------------------------------------------
+        """
+        # Walking down to the node of the key, keeping the path taken
+        path = []
+        current = self.root
+        while current != self.NIL and key != self.keys[current]:
+            path.append(current)
+            current = self.lefts[current] if key < self.keys[current] else self.rights[current]
+
+        if current == self.NIL:  # key not found
+            raise ValueError('Deleting non-existent item')
+
+        # general case => the successor takes the place of the node, and is removed from the right subtree instead
+        if self.lefts[current] != self.NIL and self.rights[current] != self.NIL:
+            path.append(current)
+            succ = self.rights[current]
+            while self.lefts[succ] != self.NIL:
+                path.append(succ)
+                succ = self.lefts[succ]
+            self.keys[current] = self.keys[succ]
+            self.items[current] = self.items[succ]
+            current = succ
+
+        # The node removed has at most one child, which takes its place
+        child = self.rights[current] if self.lefts[current] == self.NIL else self.lefts[current]
+        self.__release(current)
+        self.length -= 1
+        if len(path) == 0:
+            self.root = child
+            return
+
+        # Every node of the path has one fewer node in its subtree
+        for index in path:
+            self.sizes[index] -= 1
+        if self.lefts[path[-1]] == current:
+            self.lefts[path[-1]] = child
+        else:
+            self.rights[path[-1]] = child
+
+        self.root = self.__rebalance_path(path)
+
+    def kth_largest(self, k: int) -> TreeNode:
+        """ Method to return the kth largest node in the entire tree.
+        :param k:           An integer that determines which node to be returned.
+                                (k=1 would return the largest.)
+        :return:            Returns a TreeNode holding the key and item of the kth largest node in the tree.
+        :complexity:        O(log n) where n is the number of nodes in the tree.
+        :pre:               Input k must be a positive integer.
+        :raises TypeError:  When input k is not an integer.
+        :raises ValueError: When input k is not positive, or larger than the number of nodes in the tree.
+        """
+        # Checking pre condition(s)
+        if isinstance(k, bool) or not isinstance(k, int):
+            raise TypeError("".join(["Parameter k must be an integer: k = ", str(k)]))
+        elif k <= 0:
+            raise ValueError("".join(["Parameter k must be a positive integer: k = ", str(k)]))
+
+        # Traversing the tree, using the size of the right subtree of each node to choose a side
+        current = self.root
+        while current != self.NIL:
+            right_size = self.sizes[self.rights[current]]
+            if k == right_size + 1:
+                return TreeNode(self.keys[current], self.items[current])
+            elif k > right_size + 1:
+                k -= right_size + 1
+                current = self.lefts[current]
+            else:
+                current = self.rights[current]
+        raise ValueError("kth largest node does not exist.")
+
+    def kth_smallest(self, k: int) -> TreeNode:
+        """ Method to return the kth smallest node in the entire tree.
+        :param k:           An integer that determines which node to be returned.
+                                (k=1 would return the smallest.)
+        :return:            Returns a TreeNode holding the key and item of the kth smallest node in the tree.
+        :complexity:        O(log n) where n is the number of nodes in the tree.
+        :pre:               Input k must be a positive integer.
+        :raises TypeError:  When input k is not an integer.
+        :raises ValueError: When input k is not positive, or larger than the number of nodes in the tree.
+        """
+        # Checking pre condition(s)
+        if isinstance(k, bool) or not isinstance(k, int):
+            raise TypeError("".join(["Parameter k must be an integer: k = ", str(k)]))
+        elif k <= 0:
+            raise ValueError("".join(["Parameter k must be a positive integer: k = ", str(k)]))
+
+        # Traversing the tree, using the size of the left subtree of each node to choose a side
+        current = self.root
+        while current != self.NIL:
+            left_size = self.sizes[self.lefts[current]]
+            if k == left_size + 1:
+                return TreeNode(self.keys[current], self.items[current])
+            elif k > left_size + 1:
+                k -= left_size + 1
+                current = self.rights[current]
+            else:
+                current = self.lefts[current]
+        raise ValueError("kth smallest node does not exist.")
+
+    def select(self, index: int) -> tuple[float, I]:
+        """ Method to return the key and item of the node at an index of the keys in order, the inverse of rank().
+        :param index:       The number of keys smaller than the key selected. (index=0 selects the smallest key.)
+        :return:            Returns a (key, item) tuple.
+        :complexity:        O(log n) where n is the number of nodes in the tree.
+        :pre:               Input index must be an integer from 0 to len(self) - 1.
+        :raises TypeError:  When input index is not an integer.
+        :raises IndexError: When input index is out of range.
+        """
+        # Checking pre condition(s)
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise TypeError("".join(["Parameter index must be an integer: index = ", str(index)]))
+        elif not 0 <= index < len(self):
+            raise IndexError("".join(["Parameter index is out of range: index = ", str(index)]))
+
+        node = self.kth_smallest(index + 1)
+        return node.key, node.item
+
+    def rank(self, key: float) -> int:
+        """ Method to return the number of keys in the tree smaller than key, which need not be in the tree.
+        :complexity: O(log n) where n is the number of nodes in the tree.
+        """
+        return self.__count_below(key, False)
+
+    def count_range(self, low: float, high: float) -> int:
+        """ Method to return the number of keys in the tree from low to high, both included, 0 if low > high.
+        :complexity: O(log n) where n is the number of nodes in the tree.
+        """
+        if low > high:
+            return 0
+        return self.__count_below(high, True) - self.__count_below(low, False)
+
+    # Private Method
+    def __count_below(self, key: float, inclusive: bool) -> int:
+        """
+            Counts the keys of the tree smaller than key, or smaller than or equal to it when inclusive, walking down
+            the path to key and adding up the sizes of the subtrees left of it.
+        :complexity: O(log n) where n is the number of nodes in the tree
+        """
+        count = 0
+        current = self.root
+        while current != self.NIL:
+            if key < self.keys[current] or (key == self.keys[current] and not inclusive):
+                current = self.lefts[current]
+            else:
+                count += self.sizes[self.lefts[current]] + 1
+                if key == self.keys[current]:
+                    return count
+                current = self.rights[current]
+        return count
+
+    # Private Method
+    def __pairs(self) -> Iterator[tuple[float, I]]:
+        """
+            In-order iterator over the (key, item) pairs of the tree, using a stack of indices.
+        :complexity: O(n) to iterate over the whole tree, where n is the number of nodes
+        """
+        stack = []
+        current = self.root
+        while current != self.NIL or len(stack) > 0:
+            while current != self.NIL:
+                stack.append(current)
+                current = self.lefts[current]
+            current = stack.pop()
+            yield self.keys[current], self.items[current]
+            current = self.rights[current]
+
+    # Private Method
+    def __build(self, low: int, high: int) -> int:
+        """
+            Links the slots from low to high, both included, into a perfectly balanced subtree rooted at their middle.
+            The slots must hold keys in order. The recursion is only as deep as the height of the tree built.
+        :complexity: O(high - low)
+        :return: Returns the index of the root of the subtree, NIL if low > high
+        """
+        if low > high:
+            return self.NIL
+
+        middle = (low + high) // 2
+        left, right = self.__build(low, middle - 1), self.__build(middle + 1, high)
+        self.lefts[middle], self.rights[middle] = left, right
+        self.heights[middle] = max(self.heights[left], self.heights[right]) + 1
+        self.sizes[middle] = high - low + 1
+        return middle
+
+    # Private Method
+    def __find(self, key: float) -> int:
+        """
+            Find the index of the node of this key.
+        :complexity: O(log n) where n is the number of nodes in the tree
+        :return: Returns the index of the node, NIL if the key is not in the tree
+        """
+        current = self.root
+        while current != self.NIL and key != self.keys[current]:
+            current = self.lefts[current] if key < self.keys[current] else self.rights[current]
+        return current
+
+    # Private Method
+    def __allocate(self, key: float, item: I) -> int:
+        """
+            Takes a slot for a new leaf from the free list, or from the end of the columns when none is free.
+        :complexity: O(1) amortised
+        :return: Returns the index of the new node
+        """
+        if self.free != self.NIL:
+            index = self.free
+            # Storing the key first, so a key which is not a float raises before the slot leaves the free list
+            self.keys[index] = key
+            self.free = self.lefts[index]
+            self.lefts[index] = self.rights[index] = self.NIL
+            self.heights[index] = 0
+            self.sizes[index] = 1
+            self.items[index] = item
+        else:
+            index = len(self.keys)
+            self.keys.append(key)
+            self.lefts.append(self.NIL)
+            self.rights.append(self.NIL)
+            self.heights.append(0)
+            self.sizes.append(1)
+            self.items.append(item)
+        return index
+
+    # Private Method
+    def __release(self, index: int) -> None:
+        """
+            Adds the slot of a removed node to the free list, dropping its item.
+        :complexity: O(1)
+        """
+        self.items[index] = None
+        self.lefts[index] = self.free
+        self.free = index
+
+    # Private Method
+    def __update(self, index: int) -> None:
+        """
+            Recompute the height and subtree size of a node from its children.
+        :complexity: O(1)
+        """
+        heights, sizes = self.heights, self.sizes
+        left, right = self.lefts[index], self.rights[index]
+        heights[index] = max(heights[left], heights[right]) + 1
+        sizes[index] = sizes[left] + sizes[right] + 1
+
+    # Private Method
+    def __left_rotate(self, current: int) -> int:
+        """
+            Perform left rotation of the sub-tree of current, whose right child becomes the new root.
+        :complexity: O(1)
+        :return: Returns the new root of the subtree
+        :see: #AVLTree.left_rotate(current: AVLTreeNode)
+        """
+        child = self.rights[current]
+        self.rights[current] = self.lefts[child]
+        self.lefts[child] = current
+        self.__update(current)
+        self.__update(child)
+        return child
+
+    # Private Method
+    def __right_rotate(self, current: int) -> int:
+        """
+            Perform right rotation of the sub-tree of current, whose left child becomes the new root.
+        :complexity: O(1)
+        :return: Returns the new root of the subtree
+        :see: #AVLTree.right_rotate(current: AVLTreeNode)
+        """
+        child = self.lefts[current]
+        self.lefts[current] = self.rights[child]
+        self.rights[child] = current
+        self.__update(current)
+        self.__update(child)
+        return child
+
+    # Private Method
+    def __rebalance(self, current: int) -> int:
+        """
+            Rebalance the sub-tree of current if necessary.
+        :complexity: O(1)
+        :return: Returns the new root of the subtree
+        :see: #AVLTree.rebalance(current: AVLTreeNode)
+        """
+        heights = self.heights
+        left, right = self.lefts[current], self.rights[current]
+        balance = heights[right] - heights[left]
+
+        # If it is right heavy
+        if balance >= 2:
+            if heights[self.lefts[right]] > heights[self.rights[right]]:
+                self.rights[current] = self.__right_rotate(right)
+            return self.__left_rotate(current)
+
+        # If it is left heavy
+        elif balance <= -2:
+            if heights[self.rights[left]] > heights[self.lefts[left]]:
+                self.lefts[current] = self.__left_rotate(left)
+            return self.__right_rotate(current)
+
+        # If it does not need balancing, it returns itself
+        return current
+
+    # Private Method
+    def __rebalance_path(self, path: list[int]) -> int:
+        """
+            Unwinds the path walked down by an insert or a delete, from the deepest node up, updating the height of
+            each node and rebalancing its subtree. The new root of each subtree is linked to the node above it.
+            It stops as soon as a subtree keeps its root and its height, as the nodes above it are then unchanged.
+        :complexity: O(log n), where n is the number of nodes of the tree
+        :pre: path must be non-empty, start at the root, and its nodes must be linked as they were walked down
+        :return: Returns the new root of the tree
+        """
+        heights, lefts, rights = self.heights, self.lefts, self.rights
+        subtree_root = self.NIL
+        for position in range(len(path) - 1, -1, -1):
+            index = path[position]
+            if subtree_root != self.NIL:  # the subtree below has a new root after rebalancing
+                if lefts[index] == path[position + 1]:
+                    lefts[index] = subtree_root
+                else:
+                    rights[index] = subtree_root
+
+            height = heights[index]
+            heights[index] = max(heights[lefts[index]], heights[rights[index]]) + 1
+            subtree_root = self.__rebalance(index)
+            if subtree_root == index:
+                if heights[index] == height:
+                    return self.root
+                subtree_root = self.NIL  # the node above still links to index
+        return path[0] if subtree_root == self.NIL else subtree_root
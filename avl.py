@@ -1,11 +1,14 @@
 """ AVL Tree implemented on top of the standard BST.
 Updated by: Lee Sing Yuan, Loh Zhun Guan
 """
+from __future__ import annotations
 
 __author__ = 'Alexey Ignatiev'
 __docformat__ = 'reStructuredText'
 
-from typing import TypeVar, Generic, Union
+from heapq import merge
+from operator import itemgetter
+from typing import TypeVar, Generic, Iterator, Union
 
 from bst import BinarySearchTree
 from node import AVLTreeNode
@@ -16,9 +19,26 @@ NoneType = type(None)
 Numeric = (int, float)
 
 
+def sorted_pairs(pairs: list[tuple[K, I]]) -> list[tuple[K, I]]:
+    """ Sorts (key, item) pairs by key, unless they are sorted already, and checks that the keys are unique.
+    :param pairs:       The (key, item) pairs, which are not modified.
+    :return:            Returns the pairs sorted by key, pairs itself when it was sorted already
+    :complexity:        O(n) when pairs is sorted, O(n log n) otherwise, where n = len(pairs)
+    :raises ValueError: When two pairs have the same key
+    """
+    if any(pairs[i][0] > pairs[i + 1][0] for i in range(len(pairs) - 1)):
+        pairs = sorted(pairs, key=itemgetter(0))
+
+    if any(pairs[i][0] == pairs[i + 1][0] for i in range(len(pairs) - 1)):
+        raise ValueError('Inserting duplicate item')
+    return pairs
+
+
 class AVLTree(BinarySearchTree, Generic[K, I]):
     """ Self-balancing binary search tree using rebalancing by sub-tree
         rotations of Adelson-Velsky and Landis (AVL).
+        Every node keeps the size of its subtree, for the order statistics: kth_smallest(), kth_largest(), select(),
+        rank() and count_range() all walk down a single path of the tree.
     """
 
     def __init__(self) -> None:
@@ -28,6 +48,84 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         """
         BinarySearchTree.__init__(self)
 
+    @classmethod
+    def from_sorted(cls, pairs: list[tuple[K, I]]) -> AVLTree[K, I]:
+        """
+            Creates a perfectly balanced tree holding (key, item) pairs, in linear time when they are sorted by key.
+        :param pairs:       The (key, item) pairs of the tree, preferably sorted by key.
+        :return:            Returns the new tree
+        :complexity:        O(n) when pairs is sorted, O(n log n) otherwise, where n = len(pairs)
+        :raises ValueError: When two pairs have the same key
+        :see: #self.bulk_load(pairs: list[tuple[K, I]])
+        """
+        tree = cls()
+        tree.bulk_load(pairs)
+        return tree
+
+    def bulk_load(self, pairs: list[tuple[K, I]]) -> None:
+        """
+            Adds (key, item) pairs to the tree, rebuilding it perfectly balanced in a single pass instead of inserting
+            and rotating one node at a time. The pairs are sorted first unless they already are, then merged with the
+            nodes of the tree in order, and the tree is built bottom-up from the middle of the merged pairs.
+            The tree is left unchanged if a key is a duplicate.
+
+        :param pairs:       The (key, item) pairs added to the tree, preferably sorted by key.
+        :complexity:        O(n + m) when pairs is sorted, O(n + m log m) otherwise, where n is the number of nodes
+                                of the tree and m = len(pairs)
+        :raises ValueError: When two pairs have the same key, or a key is already in the tree
+
+        ----------------------------------------------------------------------------------------------------------------
+        METHODS CALLED                    | COMPLEXITY  |   REMARKS
+        ----------------------------------|-------------|---------------------------------------------------------------
+        sorted_pairs()                    | O(m log m)  |   O(m) when pairs is sorted already
+        heapq.merge()                     | O(n + m)    |
+        AVLTree.__build()                 | O(n + m)    |
+        ----------------------------------|-------------|---------------------------------------------------------------
+        ----------------------------------------------------------------------------------------------------------------
+        """
+        pairs = sorted_pairs(pairs)
+        if self.root is not None:
+            pairs = sorted_pairs(list(merge(self.__pairs(), pairs, key=itemgetter(0))))
+
+        self.root = self.__build(pairs, 0, len(pairs) - 1)
+        self.length = len(pairs)
+
+    # Private Method
+    def __pairs(self) -> Iterator[tuple[K, I]]:
+        """
+            In-order iterator over the (key, item) pairs of the tree, using a stack of nodes.
+        :complexity: O(n) to iterate over the whole tree, where n is the number of nodes
+        """
+        stack = []
+        current = self.root
+        while current is not None or len(stack) > 0:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.key, current.item
+            current = current.right
+
+    # Private Method
+    def __build(self, pairs: list[tuple[K, I]], low: int, high: int) -> Union[AVLTreeNode, NoneType]:
+        """
+            Builds a perfectly balanced subtree of the sorted pairs from index low to high, both included, rooted at
+            their middle pair. The recursion is only as deep as the height of the tree built.
+        :complexity: O(high - low)
+        :return: Returns the root of the subtree, None if low > high
+        """
+        if low > high:
+            return None
+
+        middle = (low + high) // 2
+        node = AVLTreeNode(*pairs[middle])
+        node.left = self.__build(pairs, low, middle - 1)
+        node.right = self.__build(pairs, middle + 1, high)
+        node.height = max(self.__height(node.left), self.__height(node.right)) + 1
+        node.right_count = high - middle
+        node.size = high - low + 1
+        return node
+
     def get_height(self, current: AVLTreeNode) -> int:
         """
             Get the height of a node. Return current.height if current is 
@@ -83,6 +181,9 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             Attempts to insert an item into the tree, it uses the Key to insert
             it. After insertion, performs sub-tree rotation whenever it becomes
             unbalanced.
+            The tree is walked down iteratively, keeping the nodes passed on a stack, which is then unwound to update
+            the heights, right counts and sizes and to rebalance each subtree.
+            The tree is left unchanged if key is a duplicate.
 
         :param current:     The root of the current subtree.
         :param key:         The key value to determine the location of the new node.
@@ -90,22 +191,15 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         :return:            Returns the new root of the subtree.
         :complexity:        O(log n), where n is the number of nodes rooted by current.
         :pre:               Input current must be an AVLTreeNode or None
-        :pre:               Input key must be Numeric.
-        :raises TypeError:  When current is not an AVLTreeNode or key is not Numeric
+        :raises TypeError:  When current is not an AVLTreeNode
+        :raises ValueError: When key is already in the subtree
 
         ----------------------------------------------------------------------------------------------------------------
         METHODS CALLED                    | COMPLEXITY  |   REMARKS
         ----------------------------------|-------------|---------------------------------------------------------------
         isinstance()                      | O(IsIns)    |   Unknown complexity for built-in function. Assume to be O(1).
-        AVLTree.insert_aux()              | O(log n)    |   where n is the size of the tree
-        AVLTree.get_height()              | O(1)        |
-        AVLTree.rebalance()               | O(1)        |
+        AVLTree.__rebalance_path()        | O(log n)    |   where n is the size of the tree
         AVLTreeNode.__init__()            | O(1)        |
-        AVLTreeNode.get_right_count()     | O(1)        |
-        AVLTreeNode.set_height()          | O(1)        |
-        AVLTreeNode.set_right_count()     | O(1)        |
-        TreeNode.is_leaf()                | O(1)        |
-        max()                             | O(1)        |   Here, max() only compares two items --> O(1)
         ----------------------------------|-------------|---------------------------------------------------------------
         ----------------------------------------------------------------------------------------------------------------
         """
@@ -113,51 +207,58 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         if not isinstance(current, AVLTreeNode) and not isinstance(current, NoneType):
             raise TypeError("".join(["Parameter current must be an AVLTreeNode or None: current = ", str(current)]))
 
-        if current is None:  # base case: at the leaf
-            new_node = AVLTreeNode(key, item)
-            current = new_node
-            self.length += 1
-
-        elif key < current.key:  # If the key is smaller, it should go to the left.
-            current.left = self.insert_aux(current.left, key, item)
-
-        elif key > current.key:  # If the key is larger, it should go to the right.
-            current.set_right_count(current.get_right_count() + 1)
-            current.right = self.insert_aux(current.right, key, item)
-
-        else:  # key == current.key
-            raise ValueError('Inserting duplicate item')
+        # Walking down to the leaf position of the key, keeping the path taken
+        path = []
+        node = current
+        while node is not None:
+            path.append(node)
+            if key < node.key:  # If the key is smaller, it should go to the left.
+                node = node.left
+            elif key > node.key:  # If the key is larger, it should go to the right.
+                node = node.right
+            else:  # key == node.key
+                raise ValueError('Inserting duplicate item')
+
+        new_node = AVLTreeNode(key, item)
+        new_node.height = 0
+        self.length += 1
+        if len(path) == 0:
+            return new_node
+
+        # Every node the new node is added below has one more node in its subtree, on its right if key is larger
+        for node in path:
+            node.size += 1
+            if key > node.key:
+                node.right_count += 1
+        if key < path[-1].key:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
 
-        # Updating current's height and then re-balancing if need be
-        current.set_height(max(self.get_height(current.left), self.get_height(current.right)) + 1)
-        return self.rebalance(current)
+        return self.__rebalance_path(path)
 
     def delete_aux(self, current: Union[AVLTreeNode, NoneType], key: K) -> Union[AVLTreeNode, NoneType]:
         """
             Attempts to delete an item from the tree, it uses the Key to
             determine the node to delete. After deletion,
             performs sub-tree rotation whenever it becomes unbalanced.
+            The tree is walked down iteratively, keeping the nodes passed on a stack, which is then unwound to update
+            the heights, right counts and sizes and to rebalance each subtree.
+            The tree is left unchanged if key is not in it.
 
         :param current:     The root of the current subtree.
         :param key:         The key value used to determine the location of the deleting node (if any)
         :return:            Returns the new root of the subtree.
         :complexity:        O(log n), where n = number of nodes in the subtree rooted by current.
-        :pre:
-        :raises TypeError:
+        :pre:               Input current must be an AVLTreeNode or None
+        :raises TypeError:  When current is not an AVLTreeNode
+        :raises ValueError: When key is not in the subtree
 
         ----------------------------------------------------------------------------------------------------------------
         METHODS CALLED                    | COMPLEXITY  |   REMARKS
         ----------------------------------|-------------|---------------------------------------------------------------
         isinstance()                      | O(IsIns)    |   Unknown complexity for built-in function. Assume to be O(1).
-        AVLTree.delete_aux()              | O(log n)    |   where n is the size of the tree
-        BinarySearchTree.get_successor()  | O(log n)    |   where n = number of nodes of the subtree rooted by the input
-        AVLTree.get_height()              | O(1)        |
-        AVLTree.rebalance()               | O(1)        |
-        AVLTreeNode.get_right_count()     | O(1)        |
-        AVLTreeNode.set_height()          | O(1)        |
-        AVLTreeNode.set_right_count()     | O(1)        |
-        TreeNode.is_leaf()                | O(1)        |
-        max()                             | O(1)        |   Here, max() only compares two items --> O(1)
+        AVLTree.__rebalance_path()        | O(log n)    |   where n is the size of the tree
         ----------------------------------|-------------|---------------------------------------------------------------
         ----------------------------------------------------------------------------------------------------------------
         """
@@ -165,40 +266,66 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         if not isinstance(current, AVLTreeNode) and not isinstance(current, NoneType):
             raise TypeError("".join(["Parameter current must be an AVLTreeNode or None: current = ", str(current)]))
 
-        # Proceed with deletion
-        if current is None:  # key not found
+        # Walking down to the node of the key, keeping the path taken
+        path = []
+        node = current
+        while node is not None and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        if node is None:  # key not found
             raise ValueError('Deleting non-existent item')
 
-        elif key < current.key:
-            current.left = self.delete_aux(current.left, key)
-
-        elif key > current.key:
-            current.set_right_count(current.get_right_count() - 1)
-            current.right = self.delete_aux(current.right, key)
-
-        else:  # we found our key => do actual deletion
-            if self.is_leaf(current):
-                self.length -= 1
-                return None
-            elif current.left is None:
-                self.length -= 1
-                return current.right
-            elif current.right is None:
-                self.length -= 1
-                return current.left
-
-            # general case => find a successor
-            succ = self.get_successor(current)
-            current.key = succ.key
-            current.item = succ.item
-            current.right = self.delete_aux(current.right, succ.key)
-
-            # Updating current's right count
-            current.set_right_count(current.get_right_count() - 1)
-
-        # Updating current's height and then re-balancing if need be
-        current.set_height(max(self.get_height(current.left), self.get_height(current.right)) + 1)
-        return self.rebalance(current)
+        # general case => the successor takes the place of the node, and is removed from the right subtree instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            succ = node.right
+            while succ.left is not None:
+                path.append(succ)
+                succ = succ.left
+            node.key = succ.key
+            node.item = succ.item
+            node = succ
+
+        # The node removed has at most one child, which takes its place
+        child = node.right if node.left is None else node.left
+        self.length -= 1
+        if len(path) == 0:
+            return child
+
+        # Every node the removed node was below has one fewer node in its subtree, on its right if it came from there
+        for parent, below in zip(path, path[1:] + [node]):
+            parent.size -= 1
+            if parent.right is below:
+                parent.right_count -= 1
+        if path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        return self.__rebalance_path(path)
+
+    # Private Method
+    def __rebalance_path(self, path: list[AVLTreeNode]) -> AVLTreeNode:
+        """
+            Unwinds the path walked down by an insert or a delete, from the deepest node up, updating the height of
+            each node and rebalancing its subtree. The new root of each subtree is linked to the node above it.
+        :complexity: O(log n), where n is the number of nodes of the tree
+        :pre: path must be non-empty, and its nodes must be linked as they were walked down
+        :return: Returns the new root of the subtree at the top of the path
+        """
+        subtree_root = None
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            if subtree_root is not None:  # the subtree below may have a new root after rebalancing
+                if node.left is path[index + 1]:
+                    node.left = subtree_root
+                else:
+                    node.right = subtree_root
+
+            node.height = max(self.__height(node.left), self.__height(node.right)) + 1
+            subtree_root = self.__rebalance(node)
+        return subtree_root
 
     def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
         """
@@ -225,12 +352,7 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         METHODS CALLED                  |   COMPLEXITY  |   REMARKS
         --------------------------------|---------------|---------------------------------------------------------------
         isinstance()                    |   O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1)
-        AVLTree.get_height()            |   O(1)        |
-        AVLTreeNode.get_right_count()   |   O(1)        |
-        AVLTreeNode.set_height()        |   O(1)        |
-        AVLTreeNode.set_right_count()   |   O(1)        |
-        TreeNode.is_leaf()              |   O(1)        |
-        max()                           |   O(1)        |   Here, max() only compares two items.
+        AVLTree.__left_rotate()         |   O(1)        |
         --------------------------------|---------------|---------------------------------------------------------------
         ----------------------------------------------------------------------------------------------------------------
         """
@@ -238,21 +360,30 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         if not isinstance(current, AVLTreeNode):
             raise TypeError("".join(["Parameter current must be an AVLTreeNode: current = ", str(current)]))
 
+        return self.__left_rotate(current)
+
+    # Private Method
+    def __left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Perform left rotation of the sub-tree, without checking current.
+        :complexity: O(1)
+        :see: #self.left_rotate(current: AVLTreeNode)
+        """
         # The swapping child node
         child_node = current.right
 
         # The current's right child is then the child's left child
         current.right = child_node.left
-        current.set_right_count(current.get_right_count() - child_node.get_right_count() - 1)
+        current.right_count -= child_node.right_count + 1
 
         # The child node's new left child will be current
         child_node.left = current
 
-        # Giving them their new heights
-        current.set_height(
-            0 if current.is_leaf() else max(self.get_height(current.left), self.get_height(current.right)) + 1)
-        child_node.set_height(
-            0 if child_node.is_leaf() else max(self.get_height(child_node.left), self.get_height(child_node.right)) + 1)
+        # Giving them their new heights and sizes
+        current.height = max(self.__height(current.left), self.__height(current.right)) + 1
+        child_node.height = max(self.__height(child_node.left), self.__height(child_node.right)) + 1
+        current.size = self.__size(current.left) + self.__size(current.right) + 1
+        child_node.size = self.__size(child_node.left) + self.__size(child_node.right) + 1
         return child_node
 
     def right_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
@@ -279,12 +410,7 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         METHODS CALLED                  |   COMPLEXITY  |   REMARKS
         --------------------------------|---------------|---------------------------------------------------------------
         isinstance()                    |   O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1)
-        AVLTree.get_height()            |   O(1)        |
-        AVLTreeNode.get_right_count()   |   O(1)        |
-        AVLTreeNode.set_height()        |   O(1)        |
-        AVLTreeNode.set_right_count()   |   O(1)        |
-        TreeNode.is_leaf()              |   O(1)        |
-        max()                           |   O(1)        |   Here, max() only compares two items.
+        AVLTree.__right_rotate()        |   O(1)        |
         --------------------------------|---------------|---------------------------------------------------------------
         ----------------------------------------------------------------------------------------------------------------
         """
@@ -292,6 +418,15 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         if not isinstance(current, AVLTreeNode):
             raise TypeError("".join(["Parameter current must be an AVLTreeNode: current = ", str(current)]))
 
+        return self.__right_rotate(current)
+
+    # Private Method
+    def __right_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Perform right rotation of the sub-tree, without checking current.
+        :complexity: O(1)
+        :see: #self.right_rotate(current: AVLTreeNode)
+        """
         # The swapping child node
         child_node = current.left
 
@@ -300,11 +435,13 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
 
         # The child node's new right child will be current
         child_node.right = current
-        child_node.set_right_count(child_node.get_right_count() + current.get_right_count() + 1)
+        child_node.right_count += current.right_count + 1
 
-        # Giving them their new heights
-        current.set_height(max(self.get_height(current.left), self.get_height(current.right)) + 1)
-        child_node.set_height(max(self.get_height(child_node.left), self.get_height(child_node.right)) + 1)
+        # Giving them their new heights and sizes
+        current.height = max(self.__height(current.left), self.__height(current.right)) + 1
+        child_node.height = max(self.__height(child_node.left), self.__height(child_node.right)) + 1
+        current.size = self.__size(current.left) + self.__size(current.right) + 1
+        child_node.size = self.__size(child_node.left) + self.__size(child_node.right) + 1
         return child_node
 
     def rebalance(self, current: AVLTreeNode) -> AVLTreeNode:
@@ -326,10 +463,7 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         METHODS CALLED          |   COMPLEXITY  |   REMARKS
         ------------------------|---------------|--------------------------------------------------------------
         isinstance()            |   O(IsIns)    |   Unknown complexity for built-in function. Assume to be O(1)
-        AVLTree.get_balance()   |   O(1)        |
-        AVLTree.get_height()    |   O(1)        |
-        AVLTree.left_rotate()   |   O(1)        |
-        AVLTree.right_rotate()  |   O(1)        |
+        AVLTree.__rebalance()   |   O(1)        |
         ------------------------|---------------|--------------------------------------------------------------
         -------------------------------------------------------------------------------------------------------
         """
@@ -337,24 +471,54 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         if not isinstance(current, AVLTreeNode):
             raise TypeError("".join(["Parameter current must be an AVLTreeNode: current = ", str(current)]))
 
+        return self.__rebalance(current)
+
+    # Private Method
+    def __rebalance(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Rebalance the sub-tree of current if necessary, without checking current.
+        :complexity: O(1)
+        :see: #self.rebalance(current: AVLTreeNode)
+        """
+        balance = self.__height(current.right) - self.__height(current.left)
+
         # Re-balancing
         # If it is right heavy
-        if self.get_balance(current) >= 2:
+        if balance >= 2:
             child = current.right
-            if self.get_height(child.left) > self.get_height(child.right):
-                current.right = self.right_rotate(child)
-            return self.left_rotate(current)
+            if self.__height(child.left) > self.__height(child.right):
+                current.right = self.__right_rotate(child)
+            return self.__left_rotate(current)
 
         # If it is left heavy
-        elif self.get_balance(current) <= -2:
+        elif balance <= -2:
             child = current.left
-            if self.get_height(child.right) > self.get_height(child.left):
-                current.left = self.left_rotate(child)
-            return self.right_rotate(current)
+            if self.__height(child.right) > self.__height(child.left):
+                current.left = self.__left_rotate(child)
+            return self.__right_rotate(current)
 
         # If it does not need balancing, it returns itself
         return current
 
+    # Private Method
+    @staticmethod
+    def __height(current: Union[AVLTreeNode, NoneType]) -> int:
+        """
+            Get the height of a node, -1 if it is None, without checking current.
+        :complexity: O(1)
+        :see: #self.get_height(current: AVLTreeNode)
+        """
+        return -1 if current is None else current.height
+
+    # Private Method
+    @staticmethod
+    def __size(current: Union[AVLTreeNode, NoneType]) -> int:
+        """
+            Get the number of nodes in the subtree of a node, 0 if it is None, without checking current.
+        :complexity: O(1)
+        """
+        return 0 if current is None else current.size
+
     def kth_largest(self, k: int) -> AVLTreeNode:
         """ Method to return the kth largest node in the entire AVL Tree.
         :param k:           An integer that determines which node to be returned.
@@ -369,8 +533,7 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         METHODS CALLED              |   COMPLEXITY  |   REMARKS
         ----------------------------|---------------|----------------------------------------------------------------
         isinstance()                |   O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
-        AVLTree.kth_largest_aux()   |   O(1)        |   Get's called a maximum of log n times,
-                                    |               |       where n is the number of nodes in the AVLTree.
+        AVLTree.kth_largest_aux()   |   O(log n)    |   where n is the number of nodes in the AVLTree.
         ----------------------------|---------------|----------------------------------------------------------------
         -------------------------------------------------------------------------------------------------------------
         """
@@ -385,12 +548,14 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
 
     def kth_largest_aux(self, current: AVLTreeNode, k: int) -> AVLTreeNode:
         """ Auxiliary function for kth_largest() method.
-        :param current:     The current node in the AVL Tree being traversed.
+            Walks down the tree iteratively, using the right count of each node to choose a side.
+        :param current:     The root of the subtree in which the kth largest node is searched.
         :param k:           Is the current value of k.
-        :return:            The kth largest node in the AVL Tree.
+        :return:            The kth largest node in the subtree.
+        :complexity:        O(log n) where n is the number of nodes in the subtree.
         :pre:               Input k must be a positive integer.
         :raises TypeError:  When input k is not an integer.
-        :raises ValueError: When input k is not positive.
+        :raises ValueError: When input k is not positive, or larger than the number of nodes in the subtree.
 
         -------------------------------------------------------------------------------------------------
         METHODS CALLED  |   COMPLEXITY  |   REMARKS
@@ -404,17 +569,114 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             raise TypeError("".join(["Parameter k must be an integer: k = ", str(k)]))
         elif k <= 0:
             raise ValueError("".join(["Parameter k must be a positive integer: k = ", str(k)]))
-        if not isinstance(current, AVLTreeNode):
-            raise ValueError(
-                "".join(["Parameter current must be an AVLTreeNode: current = ", str(current), ", k = ", str(k)]))
 
         # Traversing the AVL Tree
-        if k == current.right_count + 1:
-            return current
-        elif k > current.right_count + 1:
-            k -= current.right_count + 1
-            return self.kth_largest_aux(current.left, k)
-        elif k <= current.right_count:
-            return self.kth_largest_aux(current.right, k)
-        else:
-            raise ValueError("kth largest node does not exist.")
+        while current is not None:
+            if k == current.right_count + 1:
+                return current
+            elif k > current.right_count + 1:
+                k -= current.right_count + 1
+                current = current.left
+            else:
+                current = current.right
+        raise ValueError("kth largest node does not exist.")
+
+    def kth_smallest(self, k: int) -> AVLTreeNode:
+        """ Method to return the kth smallest node in the entire AVL Tree.
+        :param k:           An integer that determines which node to be returned.
+                                (k=1 would return the smallest.)
+        :return:            Returns the kth smallest element in the tree.
+        :complexity:        O(log n) where n is the number of nodes in the AVL Tree.
+        :pre:               Input k must be a positive integer.
+        :raises TypeError:  When input k is not an integer.
+        :raises ValueError: When input k is not positive, or larger than the number of nodes in the tree.
+
+        -------------------------------------------------------------------------------------------------------------
+        METHODS CALLED              |   COMPLEXITY  |   REMARKS
+        ----------------------------|---------------|----------------------------------------------------------------
+        isinstance()                |   O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
+        ----------------------------|---------------|----------------------------------------------------------------
+        -------------------------------------------------------------------------------------------------------------
+        """
+        # Checking pre condition(s)
+        if isinstance(k, bool) or not isinstance(k, int):
+            raise TypeError("".join(["Parameter k must be an integer: k = ", str(k)]))
+        elif k <= 0:
+            raise ValueError("".join(["Parameter k must be a positive integer: k = ", str(k)]))
+
+        # Traversing the AVL Tree, using the size of the left subtree of each node to choose a side
+        current = self.root
+        while current is not None:
+            left_size = self.__size(current.left)
+            if k == left_size + 1:
+                return current
+            elif k > left_size + 1:
+                k -= left_size + 1
+                current = current.right
+            else:
+                current = current.left
+        raise ValueError("kth smallest node does not exist.")
+
+    def select(self, index: int) -> tuple[K, I]:
+        """ Method to return the key and item of the node at an index of the keys in order, the inverse of rank().
+        :param index:       The number of keys smaller than the key selected. (index=0 selects the smallest key.)
+        :return:            Returns a (key, item) tuple.
+        :complexity:        O(log n) where n is the number of nodes in the AVL Tree.
+        :pre:               Input index must be an integer from 0 to len(self) - 1.
+        :raises TypeError:  When input index is not an integer.
+        :raises IndexError: When input index is out of range.
+
+        -------------------------------------------------------------------------------------------------------------
+        METHODS CALLED              |   COMPLEXITY  |   REMARKS
+        ----------------------------|---------------|----------------------------------------------------------------
+        isinstance()                |   O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
+        AVLTree.kth_smallest()      |   O(log n)    |   where n is the number of nodes in the AVLTree.
+        ----------------------------|---------------|----------------------------------------------------------------
+        -------------------------------------------------------------------------------------------------------------
+        """
+        # Checking pre condition(s)
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise TypeError("".join(["Parameter index must be an integer: index = ", str(index)]))
+        elif not 0 <= index < len(self):
+            raise IndexError("".join(["Parameter index is out of range: index = ", str(index)]))
+
+        node = self.kth_smallest(index + 1)
+        return node.key, node.item
+
+    def rank(self, key: K) -> int:
+        """ Method to return the number of keys in the tree smaller than key, which need not be in the tree.
+        :param key:     The key ranked.
+        :return:        Returns the number of keys smaller than key.
+        :complexity:    O(log n) where n is the number of nodes in the AVL Tree.
+        """
+        return self.__count_below(key, False)
+
+    def count_range(self, low: K, high: K) -> int:
+        """ Method to return the number of keys in the tree from low to high, both included.
+        :param low:     The smallest key counted.
+        :param high:    The largest key counted.
+        :return:        Returns the number of keys in [low, high], 0 if low is larger than high.
+        :complexity:    O(log n) where n is the number of nodes in the AVL Tree.
+        """
+        if low > high:
+            return 0
+        return self.__count_below(high, True) - self.__count_below(low, False)
+
+    # Private Method
+    def __count_below(self, key: K, inclusive: bool) -> int:
+        """
+            Counts the keys of the tree smaller than key, or smaller than or equal to it when inclusive, walking down
+            the path to key and adding up the sizes of the subtrees left of it.
+        :complexity: O(log n) where n is the number of nodes in the AVL Tree
+        """
+        count = 0
+        current = self.root
+        while current is not None:
+            if key < current.key or (key == current.key and not inclusive):
+                current = current.left
+            else:
+                count += self.__size(current.left) + 1
+                if key == current.key:
+                    return count
+                current = current.right
+        return count
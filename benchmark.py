@@ -0,0 +1,137 @@
+""" Hash Table Benchmark
+
+Measures how well a hash function spreads a corpus of potion names over a potion table, and how fast the table is.
+A benchmark inserts every name of the corpus, then looks every one of them up, and reports as JSON:
+    ○ the throughput of the inserts and of the lookups, in operations per second
+    ○ the statistics of the table after the inserts (conflict_count, probe_total, probe_max and rehash_count)
+    ○ the standard deviation and the range of the number of names hashed to each position
+
+Usage:
+    python benchmark.py --corpus words.txt --hash bad --probe-strategy double --max-load-factor 0.5
+"""
+__docformat__ = 'reStructuredText'
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from game import Game
+
+
+def load_corpus(path: str) -> list[str]:
+    """ Reads a corpus of potion names, one per line, skipping the empty lines.
+    :param path:    The path of the corpus file, such as words.txt.
+    :return:        Returns the names of the corpus, in the order of the file
+    :complexity:    O(S) where S is the size of the file
+    """
+    with open(path, encoding="utf-8") as corpus_file:
+        return [line.strip() for line in corpus_file if line.strip()]
+
+
+def standard_deviation(input_list: list[int]) -> float:
+    """ Population standard deviation of a list of counts.
+    :complexity: O(N) where N is len(input_list)
+    """
+    sigma_x = sum(input_list)
+    sigma_x2 = sum([x ** 2 for x in input_list])
+    n = len(input_list)
+    return (sigma_x2 / n - (sigma_x / n) ** 2) ** 0.5
+
+
+def hash_counts(keys: list[str], hash_function: Callable[[str, int], int], tablesize: int) -> list[int]:
+    """ Counts the keys hashed to each position of a table.
+    :param keys:            The keys hashed.
+    :param hash_function:   A function taking a key and a tablesize, and returning a position below tablesize.
+    :param tablesize:       The number of positions.
+    :return:                Returns the number of keys hashed to each position
+    :complexity:            O(N * K + M) where N is len(keys), K is the size of the keys and M is tablesize
+    """
+    counts = [0] * tablesize
+    for key in keys:
+        counts[hash_function(key, tablesize)] += 1
+    return counts
+
+
+def benchmark(keys: list[str], good_hash: bool = True, probe_strategy: str = "linear", tablesize_override: int = -1,
+              max_load_factor: float = 1.0, table_type: str = "linear",
+              hash_function: Callable[[str, int], int] = None) -> dict:
+    """ Inserts every key into a new table, then looks every key up, timing both passes.
+    :param keys:                The corpus of potion names.
+    :param good_hash:           Whether the table uses good_hash() or bad_hash().
+    :param probe_strategy:      The probe sequence of the table, one of its PROBE_STRATEGIES.
+    :param tablesize_override:  The tablesize of the table, or -1 to size it from the number of keys.
+    :param max_load_factor:     The load factor which an insert may not push the table past.
+    :param table_type:          A key of Game.TABLE_TYPES, the type of table benchmarked.
+    :param hash_function:       A function taking a key and a tablesize and returning a position below tablesize,
+                                    used by the table instead of good_hash() or bad_hash() when given.
+    :return:                    Returns a dictionary of the parameters and results of the benchmark, which can be
+                                    dumped as JSON. The statistics are taken before the lookups, which probe as well.
+    :complexity:                O(N * (K + P)) where N is len(keys), K is the size of the keys and P is the
+                                    average probe length
+    :raises ValueError:         When table_type is not a key of Game.TABLE_TYPES, or keys is empty.
+    """
+    if table_type not in Game.TABLE_TYPES:
+        raise ValueError("".join(["Parameter table_type must be one of ", ", ".join(Game.TABLE_TYPES),
+                                  ": table_type = ", str(table_type)]))
+    elif len(keys) == 0:
+        raise ValueError("Parameter keys must not be empty.")
+
+    table = Game.TABLE_TYPES[table_type](len(keys), good_hash, tablesize_override, max_load_factor, 0, probe_strategy)
+    if hash_function is not None:
+        table.hash = lambda key: hash_function(key, table.get_table_size())
+
+    start = time.perf_counter()
+    for key in keys:
+        table.insert(key, key)
+    insert_time = time.perf_counter() - start
+    conflict_count, probe_total, probe_max, rehash_count = table.statistics()
+
+    start = time.perf_counter()
+    for key in keys:
+        table[key]
+    lookup_time = time.perf_counter() - start
+
+    counts = hash_counts(keys, lambda key, _: table.hash(key), table.get_table_size())
+    return {
+        "corpus_size": len(keys),
+        "table_type": table_type,
+        "hash": "custom" if hash_function is not None else "good" if good_hash else "bad",
+        "probe_strategy": probe_strategy,
+        "table_size": table.get_table_size(),
+        "max_load_factor": max_load_factor,
+        "load_factor": len(table) / table.get_table_size(),
+        "inserts_per_second": len(keys) / max(insert_time, 1e-9),
+        "lookups_per_second": len(keys) / max(lookup_time, 1e-9),
+        "conflict_count": conflict_count,
+        "probe_total": probe_total,
+        "probe_max": probe_max,
+        "rehash_count": rehash_count,
+        "distribution_sd": standard_deviation(counts),
+        "distribution_range": max(counts) - min(counts),
+    }
+
+
+def main(argv: list[str] = None) -> dict:
+    """ Runs a benchmark from the command line arguments, and prints its results as JSON.
+    :param argv:    The command line arguments, sys.argv[1:] when None.
+    :return:        Returns the results printed
+    """
+    parser = argparse.ArgumentParser(description="Benchmark a hash function and probe strategy on a potion table.")
+    parser.add_argument("--corpus", default="words.txt", help="file of potion names, one per line")
+    parser.add_argument("--hash", choices=["good", "bad"], default="good", help="hash function of the table")
+    parser.add_argument("--probe-strategy", default="linear", help="probe sequence of the table")
+    parser.add_argument("--tablesize", type=int, default=-1, help="tablesize of the table, -1 to size it")
+    parser.add_argument("--max-load-factor", type=float, default=1.0,
+                        help="load factor past which an insert grows the table")
+    parser.add_argument("--table-type", choices=list(Game.TABLE_TYPES), default="linear", help="type of table")
+    args = parser.parse_args(argv)
+
+    results = benchmark(load_corpus(args.corpus), args.hash == "good", args.probe_strategy, args.tablesize,
+                        args.max_load_factor, args.table_type)
+    print(json.dumps(results, indent=4))
+    return results
+
+
+if __name__ == '__main__':
+    main()
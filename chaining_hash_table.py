@@ -0,0 +1,213 @@
+""" Hash Table ADT
+
+Defines a Hash Table using Separate Chaining for conflict resolution.
+Each slot of the table holds a compact array based list (bucket) of the (key, data, fingerprint) tuples hashed to it,
+so a full table still accepts new keys, with the buckets growing longer instead.
+The table grows to a larger prime size once its load factor passes max_load_factor, until it reaches MAX_SIZE.
+"""
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar
+
+from array_list import ArrayList
+from hash_table import LinearProbePotionTable
+from primes import MAX_SIZE
+
+T = TypeVar('T')
+
+
+class ChainingPotionTable(LinearProbePotionTable[T]):
+    """
+    Chaining Potion Table
+
+    Shares the interface and the statistics of LinearProbePotionTable, where a probe is a step along a bucket:
+        ○ conflict_count counts the new keys added to a bucket which was not empty
+        ○ probe_total counts the pairs passed over while looking for a key
+        ○ probe_max is the length of the longest bucket a new key was added to
+    A deleted pair is removed from its bucket, so no tombstones are left. As in LinearProbePotionTable, the keys passed
+    in a bucket are only compared when their fingerprint matches the fingerprint of the key looked up.
+
+    attributes:
+        table (ArrayR): used to represent our internal array, holding None or an ArrayList bucket in each slot
+        (See the other attributes in LinearProbePotionTable)
+
+    Class Variables:
+        PROBE_STRATEGIES (tuple): a chaining table only looks at the slot a key hashes to
+    """
+    PROBE_STRATEGIES = ("linear",)
+
+    # Mutator Methods
+    def set_max_load_factor(self, max_load_factor: float) -> None:
+        """ Mutator for max_load_factor attribute of a ChainingPotionTable.
+            Unlike probing, chaining stays usable past a load factor of 1, so any positive value is accepted.
+        :param max_load_factor: The load factor which an insert may not push the table past.
+                                    Once it would, the table is resized to a larger prime size first.
+        :return:                None
+        :complexity:            O(1)
+        :pre:                   Input max_load_factor must be Numeric and larger than 0.
+        :raises TypeError:      When input max_load_factor is not Numeric.
+        :raises ValueError:     When input max_load_factor is not larger than 0.
+        """
+        # Checking pre condition(s)
+        if isinstance(max_load_factor, bool) or not isinstance(max_load_factor, (int, float)):
+            raise TypeError(
+                "".join(["Parameter max_load_factor must be Numeric: max_load_factor = ", str(max_load_factor)]))
+        elif not max_load_factor > 0:
+            raise ValueError(
+                "".join(["Parameter max_load_factor must be larger than 0: max_load_factor = ", str(max_load_factor)]))
+
+        # Initialising ChainingPotionTable's max_load_factor attribute
+        self.max_load_factor = max_load_factor
+
+    # Private Method
+    def __find(self, key: str) -> tuple:
+        """
+        Find the bucket of this key, and the index of the key in it.
+        :complexity best: O(K) the bucket is empty
+                          where K is the size of the key
+        :complexity worst: O(K + B) when the key is not in its bucket
+                           where B is the length of the bucket
+        :return: Returns a tuple of 2 values:
+                    ○ the position of the bucket of the key in the table
+                    ○ the index of the key in its bucket, -1 if the key is not in it
+        """
+        fingerprint = self.fingerprint(key)
+        position = self.hash(key)  # get the position using hash
+        bucket = self.table[position]
+
+        if bucket is not None:
+            for index in range(len(bucket)):  # start traversing the bucket
+                if bucket[index][2] == fingerprint and bucket[index][0] == key:  # found key
+                    self.probe_total += index
+                    return position, index
+            self.probe_total += len(bucket)
+
+        return position, -1
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+        :see: #self.__find(key: str)
+        """
+        return self.__find(key)[1] != -1
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :see: #self.__find(key: str)
+        :raises KeyError: when the item doesn't exist
+        """
+        position, index = self.__find(key)
+        if index == -1:
+            raise KeyError(key)
+        return self.table[position][index][1]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+        Get the item at a certain key, or default when the key is not in the Hash Table
+        :see: #self.__find(key: str)
+        """
+        position, index = self.__find(key)
+        return self.table[position][index][1] if index != -1 else default
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        The table is resized first when inserting a new key would push the load factor past max_load_factor.
+        Once the table has reached MAX_SIZE, new keys are still added to the buckets.
+        :complexity: O(K + B) amortised, where K is the size of the key and B is the length of its bucket
+        :see: #self.__find(key: str)
+        :see: #self._rehash(tablesize: int)
+        """
+        position, index = self.__find(key)
+
+        if index != -1:
+            self.table[position][index] = (key, data, self.fingerprint(key))
+            return
+
+        if len(self) + 1 > self.max_load_factor * len(self.table):
+            new_size = self.prime_below(min(len(self.table) * 2 + 1, MAX_SIZE))
+            if new_size > len(self.table):
+                self._rehash(new_size)
+                position = self.hash(key)
+
+        if self.table[position] is None:
+            self.table[position] = ArrayList(1)
+        bucket = self.table[position]
+
+        self.probe_max = max(len(bucket), self.probe_max)
+        self.conflict_count += len(bucket) > 0
+        bucket.append((key, data, self.fingerprint(key)))
+        self.count += 1
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete the (key, data) pair of key from our hash table.
+        The last pair of the bucket takes its place, so the rest of the bucket is not shuffled.
+        :complexity: O(K + B), where K is the size of the key and B is the length of its bucket
+        :see: #self.__find(key: str)
+        :raises KeyError: When the key is not in the table
+        """
+        position, index = self.__find(key)
+        if index == -1:
+            raise KeyError(key)
+
+        bucket = self.table[position]
+        bucket[index] = bucket[len(bucket) - 1]
+        bucket.delete_at_index(len(bucket) - 1)
+        if bucket.is_empty():
+            self.table[position] = None
+        self.count -= 1
+
+    # Protected Method
+    def _load(self, items: list[tuple[str, T]]) -> None:
+        """
+        Place every (key, data) pair of items into the table, which must already be large enough to hold them all.
+        The pairs are inserted one at a time, as each one is appended to its bucket anyway.
+        :complexity: O(N * K) when there are no conflicts, where N is the number of pairs and K is the size of the keys
+        :see: #self.__setitem__(key: str, data: T)
+        """
+        for key, data in items:
+            self[key] = data
+
+    # Protected Method
+    def _rehash(self, tablesize: int) -> None:
+        """
+        Resize the hash table to tablesize and add every (key, data) pair to its new bucket.
+        The pairs passed over while adding them are not counted in the statistics.
+        :complexity: O(N + M + P), where N is the old table size, M is tablesize and P is the number of pairs
+        """
+        old_table = self.table
+        self.table_size = tablesize
+        self.hash_cache.clear()
+        self.initalise_with_tablesize(tablesize)
+
+        for bucket in old_table:
+            if bucket is not None:
+                for index in range(len(bucket)):
+                    position = self.hash(bucket[index][0])
+                    if self.table[position] is None:
+                        self.table[position] = ArrayList(1)
+                    self.table[position].append(bucket[index])
+                    self.count += 1
+
+        self.rehash_count += 1
+
+    def is_full(self):
+        """
+        Returns whether the hash table is full, which a chaining table never is
+        :complexity: O(1)
+        """
+        return False
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular order)
+        :complexity: O(N + P) where N is the table size and P is the number of pairs
+        """
+        result = ""
+        for bucket in self.table:
+            if bucket is not None:
+                for index in range(len(bucket)):
+                    result += "(" + str(bucket[index][0]) + ", " + str(bucket[index][1]) + ")\n"
+        return result
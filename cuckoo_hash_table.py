@@ -0,0 +1,241 @@
+""" Hash Table ADT
+
+Defines a Hash Table using Cuckoo Hashing for conflict resolution.
+Every key can only be at one of two positions, given by two hash functions, so a lookup makes at most two probes.
+A new key evicts the key at its position, which moves to its other position, and so on.
+If the evictions do not end, the table is rebuilt with a new seed for the second hash function,
+and grows to a larger prime size when rebuilding does not help.
+"""
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar
+
+from hash_table import LinearProbePotionTable
+from primes import MAX_SIZE
+
+T = TypeVar('T')
+
+
+class CuckooPotionTable(LinearProbePotionTable[T]):
+    """
+    Cuckoo Potion Table
+
+    A read optimised table: the first position of a key is given by hash() (good_hash() or bad_hash()) and the second
+    one by second_hash(), a seeded FNV-1a hash. With bad_hash(), the first positions only take a few values, so the
+    table has to grow much larger before every key has a position.
+    Shares the interface and the statistics of LinearProbePotionTable:
+        ○ conflict_count counts the new keys which could not be placed at their first position
+        ○ probe_total counts the second positions looked at, and the keys evicted by inserts
+        ○ probe_max is the largest number of probes made by an insert
+        ○ rehash_count counts the resizes and the rebuilds with a new seed
+
+    attributes:
+        seed (int): the seed of second_hash(), changed whenever the table is rebuilt
+        (See the other attributes in LinearProbePotionTable)
+
+    Class Variables:
+        MAX_EVICTIONS (int): number of evictions an insert may make before the table is rebuilt
+        MAX_REBUILDS (int): number of seeds tried by rebuilds before the table grows
+        PROBE_STRATEGIES (tuple): a cuckoo table only looks at the two positions of a key
+        SIZE_FACTOR (int): tablesize of the table per potion, when the tablesize is not overridden
+    """
+    MAX_EVICTIONS = 100
+    MAX_REBUILDS = 8
+    PROBE_STRATEGIES = ("linear",)
+    SIZE_FACTOR = 3
+
+    def __init__(self, max_potions: int, good_hash: bool = True, tablesize_override: int = -1,
+                 max_load_factor: float = 1.0, hash_cache_size: int = 0, probe_strategy: str = "linear") -> None:
+        self.seed = 0
+        LinearProbePotionTable.__init__(self, max_potions, good_hash, tablesize_override, max_load_factor,
+                                        hash_cache_size, probe_strategy)
+
+    # Mutator Methods
+    def set_table_size(self, max_potions: int, tablesize_override: int) -> None:
+        """ Mutator for tablesize attribute of a CuckooPotionTable.
+            Cuckoo hashing with two positions per key only succeeds reliably below a load factor of 1/2, so unless it
+            is overridden, the tablesize is the largest prime below SIZE_FACTOR * max_potions.
+        :param max_potions:         The maximum number of potions that the hash table can hold.
+        :param tablesize_override:  The overriding tablesize value or -1.
+        :return:                    None
+        :complexity:                O(1)
+        :see: #LinearProbePotionTable.set_table_size(max_potions: int, tablesize_override: int)
+        """
+        LinearProbePotionTable.set_table_size(self, max_potions, tablesize_override)
+        if tablesize_override == -1:
+            self.table_size = self.prime_below(min(max_potions * self.SIZE_FACTOR, MAX_SIZE))
+
+    def second_hash(self, potion_name: str) -> int:
+        """ Method to produce the second hash value of an item, a 32 bit FNV-1a hash seeded with seed.
+        :param potion_name: The name of the Potion used as an input for the hash function.
+        :return:            Returns the second hash value of the Potion.
+        :complexity:        O(len(potion_name))
+        """
+        value = 2166136261 ^ self.seed
+        for char_value in map(ord, potion_name):
+            value = (value ^ char_value) * 16777619 & 0xFFFFFFFF
+        return value % self.table_size
+
+    # Private Method
+    def __find(self, key: str) -> int:
+        """
+        Find the position of this key in the hash table, looking at its two positions only.
+        :complexity: O(K) where K is the size of the key
+        :return: Returns the position of the key, -1 if the key is not in the table
+        """
+        position = self.hash(key)  # get the first position using hash
+        if self.table[position] is not None and self.table[position][0] == key:
+            return position
+
+        self.probe_total += 1
+        position = self.second_hash(key)
+        if self.table[position] is not None and self.table[position][0] == key:
+            return position
+        return -1
+
+    # Private Method
+    def __place(self, item: tuple, count_probes: bool) -> tuple:
+        """
+        Place a new (key, data) pair at one of its two positions, evicting the pairs in its way.
+        :complexity: O(K * E) where K is the size of the keys and E is MAX_EVICTIONS
+        :return: Returns None once every pair has a position, or the pair left without one after MAX_EVICTIONS
+        """
+        position = self.hash(item[0])
+        probe_local = 0
+
+        if self.table[position] is not None:
+            probe_local += 1
+            position = self.second_hash(item[0])
+
+            # Evicting the pairs in the way, each of them moving to its other position
+            while self.table[position] is not None and probe_local <= self.MAX_EVICTIONS:
+                item, self.table[position] = self.table[position], item
+                first_position = self.hash(item[0])
+                position = self.second_hash(item[0]) if position == first_position else first_position
+                probe_local += 1
+
+            if count_probes:
+                self.conflict_count += 1
+                self.probe_total += probe_local
+                self.probe_max = max(probe_local, self.probe_max)
+
+            if self.table[position] is not None:
+                return item
+
+        self.table[position] = item
+        self.count += 1
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+        :see: #self.__find(key: str)
+        """
+        return self.__find(key) != -1
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :complexity: O(K) where K is the size of the key
+        :see: #self.__find(key: str)
+        :raises KeyError: when the item doesn't exist
+        """
+        position = self.__find(key)
+        if position == -1:
+            raise KeyError(key)
+        return self.table[position][1]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+        Get the item at a certain key, or default when the key is not in the Hash Table
+        :see: #self.__find(key: str)
+        """
+        position = self.__find(key)
+        return self.table[position][1] if position != -1 else default
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        The table is resized first when inserting a new key would push the load factor past max_load_factor,
+        and rebuilt when the evictions of an insert do not end.
+        :complexity: O(K * E) amortised, where K is the size of the keys and E is MAX_EVICTIONS
+        :see: #self.__find(key: str)
+        :see: #self.__place(item: tuple, count_probes: bool)
+        :see: #self._rehash(tablesize: int, item: tuple)
+        :raises ValueError: When the pairs cannot be placed in a table of MAX_SIZE
+        """
+        position = self.__find(key)
+
+        if position != -1:
+            self.table[position] = (key, data)
+            return
+
+        if len(self) + 1 > self.max_load_factor * len(self.table):
+            new_size = self.prime_below(min(len(self.table) * 2 + 1, MAX_SIZE))
+            if new_size > len(self.table):
+                self._rehash(new_size)
+
+        item = self.__place((key, data), True)
+        if item is not None:
+            self._rehash(len(self.table), item)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete the (key, data) pair of key from our hash table.
+        :complexity: O(K) where K is the size of the key
+        :see: #self.__find(key: str)
+        :raises KeyError: When the key is not in the table
+        """
+        position = self.__find(key)
+        if position == -1:
+            raise KeyError(key)
+        self.table[position] = None
+        self.count -= 1
+
+    # Protected Method
+    def _load(self, items: list[tuple[str, T]]) -> None:
+        """
+        Place every (key, data) pair of items into the table, which must already be large enough to hold them all.
+        The pairs are inserted one at a time, as a new key may evict the keys already placed.
+        :complexity: O(N * K) when there are no conflicts, where N is the number of pairs and K is the size of the keys
+        :see: #self.__setitem__(key: str, data: T)
+        """
+        for key, data in items:
+            self[key] = data
+
+    # Protected Method
+    def _rehash(self, tablesize: int, item: tuple = None) -> None:
+        """
+        Rebuild the hash table with tablesize and place every (key, data) pair again, as well as item if given.
+        A new seed is tried whenever a pair cannot be placed, and the table grows after MAX_REBUILDS seeds.
+        The probes made while placing the pairs are not counted in the statistics.
+        :complexity: O(P * K * E) per seed tried, where P is the number of pairs, K is the size of the keys
+                     and E is MAX_EVICTIONS
+        :raises ValueError: When the pairs cannot be placed in a table of MAX_SIZE
+        """
+        items = [entry for entry in self.table if entry is not None]
+        if item is not None:
+            items.append(item)
+        rebuilds = 0
+
+        while True:
+            self.table_size = tablesize
+            self.hash_cache.clear()
+            self.initalise_with_tablesize(tablesize)
+
+            for entry in items:
+                if self.__place(entry, False) is not None:
+                    break
+            else:
+                break
+
+            # A pair was left without a position, so the second hash function is changed
+            self.seed += 1
+            rebuilds += 1
+            if rebuilds % self.MAX_REBUILDS == 0:
+                new_size = self.prime_below(min(tablesize * 2 + 1, MAX_SIZE))
+                if new_size <= tablesize:
+                    raise ValueError("Cannot place the items of the table in a table of MAX_SIZE.")
+                tablesize = new_size
+
+        self.rehash_count += 1
@@ -12,10 +12,21 @@ Description:
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, solve_game() falls back to the pure Python backend without it
+    np = None
+
 # for inventory for the day
+from array_avl import ArrayAVLTree
 from avl import AVLTree
-from hash_table import LinearProbePotionTable
+from chaining_hash_table import ChainingPotionTable
+from cuckoo_hash_table import CuckooPotionTable
+from hash_table import CompactLinearProbePotionTable, LinearProbePotionTable, RobinHoodPotionTable
 from node import AVLTreeNode
+from perfect_hash_table import PerfectHashPotionTable
 from potion import Potion
 from random_gen import RandomGen
 
@@ -29,36 +40,60 @@ class Game:
         inventory (AVLTree):                    An AVLTree to store (potion_name, quantity) tuples
                                                     with the potion's buy_price as the key.
                                                 Used for the utilization of kth largest.
+                                                An ArrayAVLTree when the game has a compact inventory.
         read_table (LinearProbePotionTable):    A hash table to contain the data of the Potions to be sold.
                                                 Used for the utilization of quick __setitem__() and __getitem__() speed.
+                                                A PerfectHashPotionTable when the potion data was frozen.
+        table_type (str):                       The key in TABLE_TYPES of the class used for read_table.
 
     Class Variables:
-        None
+        TABLE_TYPES (dict):                     The hash table classes read_table can be created with.
     """
+    TABLE_TYPES = {"linear": LinearProbePotionTable, "robin_hood": RobinHoodPotionTable,
+                   "chaining": ChainingPotionTable, "cuckoo": CuckooPotionTable,
+                   "compact": CompactLinearProbePotionTable}
 
-    def __init__(self, seed: int = 0) -> None:
+    def __init__(self, seed: int = 0, compact_inventory: bool = False) -> None:
         """ Basic Game object initialiser.
-        :param seed: The seed value used to create a random number generator.
-        :return:     None
-        :complexity: O(1)
+        :param seed:                The seed value used to create a random number generator.
+        :param compact_inventory:   Whether the inventory keeps its nodes in the arrays of an ArrayAVLTree, rather than
+                                        in one AVLTreeNode per potion.
+        :return:                    None
+        :complexity:                O(1)
+        :raises TypeError:          When compact_inventory is not a boolean.
         """
-        self.inventory: AVLTree[float, tuple[str, float]] = AVLTree()
+        if not isinstance(compact_inventory, bool):
+            raise TypeError("".join(["Parameter compact_inventory must be a boolean: compact_inventory = ",
+                                     str(compact_inventory)]))
+
+        self.inventory: AVLTree[float, tuple[str, float]] | ArrayAVLTree[tuple[str, float]] = \
+            ArrayAVLTree() if compact_inventory else AVLTree()
         self.rand: RandomGen = RandomGen(seed=seed)
+        self.table_type: str = "linear"
 
-    def set_read_table(self, max_potions: int, good_hash: bool = True, tablesize_override: int = -1) -> None:
+    def set_read_table(self, max_potions: int, good_hash: bool = True, tablesize_override: int = -1,
+                       max_load_factor: float = 1.0, table_type: str = None) -> None:
         """ Mutator for read_table attribute. Creates Hash Table
+            The table_type given is kept, so the tables created later by set_total_potion_data() are of the same type.
 
         :param max_potions:         An integer used as input to create a hash table.
         :param good_hash:           A boolean value used as input to create a hash table.
         :param tablesize_override:  An integer (-1 or greater) used as input to create a hash table.
+        :param max_load_factor:     A float in (0, 1] (any positive float for chaining) used as input to create a hash
+                                        table.
+        :param table_type:          A key of TABLE_TYPES, the type of hash table to create. None keeps the current type.
             (See details of parameters in LinearProbePotionTable.__init__() in hash_table.py)
         :return:                    None
         :complexity:                O(1). Because it is instantiation of class LinearProbePotionTable
         :pre:                       Input max_potions must be an integer.
         :pre:                       Input good_hash must be a boolean.
         :pre:                       Input tablesize_override must be an integer and tablesize_override >= -1.
-        :raises TypeError:          When max_potions or tablesize_override is not an integer or good_hash is not a boolean.
-        :raises ValueError:         When tablesize_override < -1.
+        :pre:                       Input max_load_factor must be Numeric and 0 < max_load_factor <= 1
+                                        (or 0 < max_load_factor for chaining).
+        :pre:                       Input table_type must be None or a key of TABLE_TYPES.
+        :raises TypeError:          When max_potions or tablesize_override is not an integer, good_hash is not a boolean
+                                        or table_type is not a string.
+        :raises ValueError:         When tablesize_override < -1 or table_type is not a key of TABLE_TYPES.
         """
         # Checking pre condition(s)
         if not isinstance(good_hash, bool):
@@ -71,26 +106,39 @@ class Game:
         elif tablesize_override < -1:
             raise ValueError("".join(
                 ["Parameter tablesize_override must be -1 or greater: tablesize_override = ", str(tablesize_override)]))
+        elif table_type is not None and not isinstance(table_type, str):
+            raise TypeError("".join(["Parameter table_type must be a string: table_type = ", str(table_type)]))
+        elif table_type is not None and table_type not in self.TABLE_TYPES:
+            raise ValueError("".join(
+                ["Parameter table_type must be one of ", ", ".join(self.TABLE_TYPES), ": table_type = ",
+                 str(table_type)]))
 
-        self.read_table: LinearProbePotionTable = LinearProbePotionTable(max_potions, good_hash, tablesize_override)
+        if table_type is not None:
+            self.table_type = table_type
+        self.read_table: LinearProbePotionTable = self.TABLE_TYPES[self.table_type](max_potions, good_hash,
+                                                                                    tablesize_override, max_load_factor)
 
-    def set_total_potion_data(self, potion_data: list[str, str, float]) -> None:
+    def set_total_potion_data(self, potion_data: list[str, str, float], frozen: bool = False) -> None:
         """ Sets the inventory of the vendors.
             Uses Hash Table ADT due to ability to set and get data quickly using hash functions.
+            As the potion data does not change during a game, it can be frozen into a minimal perfect hash table,
+            which has one slot per potion and finds each of them with one hash and one comparison.
+            Otherwise, the table of table_type is built at once from all of the potions, and sized once for them.
 
         :param potion_data: A list containing potion data to create empty potions to be stored in a hash table.
                                 The list will contain tuples in this format (str, str, float)
+        :param frozen:      Whether read_table is built as a PerfectHashPotionTable instead of a table of table_type.
         :complexity:        O(N) where n = len(potion_data).
-                                Because we call the mutator method N times
+                                Because we create N potions and place each of them in O(1)
                                 which means it is O(N) * O(1) = O(N)
 
         ----------------------------------------------------------------------------------------------------------------
         METHODS CALLED                  |   COMPLEXITY  |   REMARKS
         --------------------------------|---------------|---------------------------------------------------------------
         isinstance()                    |   O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1)
-        Game.set_read_table()           |   O(1)        |
-        LinearProbePotionTable.insert() |   O(1)        |
+        LinearProbePotionTable          |   O(N)        |   from_items(), when not frozen
         Potion.create_empty()           |   O(1)        |
+        PerfectHashPotionTable()        |   O(N)        |   Expected, when frozen: O(1) builds expected
         --------------------------------|---------------|---------------------------------------------------------------
         ----------------------------------------------------------------------------------------------------------------
         """
@@ -104,9 +152,11 @@ class Game:
         # Checking pre condition(s)
         if not isinstance(potion_data, list):
             raise TypeError("".join(["Parameter potion_data must be a list: potion_data = ", str(potion_data)]))
+        elif not isinstance(frozen, bool):
+            raise TypeError("".join(["Parameter frozen must be a boolean: frozen = ", str(frozen)]))
 
-        # This method inserts all of the data of the potions into the table using Potion.create_empty()
-        self.set_read_table(len(potion_data))
+        # This method creates all of the potions using Potion.create_empty(), then builds the table from all of them
+        potions = []
         for potion_type, name, buy_price in potion_data:
             # Checking pre condition of values in potion_data
             if not isinstance(potion_type, str):
@@ -122,7 +172,12 @@ class Game:
 
             # Creating empty potion to insert into data hash table
             potion = Potion.create_empty(potion_type, name, buy_price)
-            self.read_table.insert(name, potion)
+            potions.append((name, potion))
+
+        if frozen:
+            self.read_table = PerfectHashPotionTable(potions)
+        else:
+            self.read_table = self.TABLE_TYPES[self.table_type].from_items(potions)
 
     def add_potions_to_inventory(self, potion_name_amount_pairs: list[tuple[str, float]]) -> None:
         """ Updates the quantity of the potion object in the hash table and creates
@@ -130,13 +185,16 @@ class Game:
 
         :param potion_name_amount_pairs: A list containing potion names and their quantities as tuples.
         :return:                        None
-        :complexity:                    O(C x log(N))
+        :complexity:                    O(C x log(C) + N) when the potions outnumber those in the inventory,
+                                            O(C x log(N)) otherwise
                                             where C = len(potion_name_amount_pairs)
                                                   N = number of potions provided in set_total_potions_data()
         :pre:                           Input potion_name_amount_pairs needs to contain tuples which needs to be in the
                                             order of (str, float).
         :raises TypeError:              When the potion_name_amount_pairs is not a list or the tuples in the list is not
                                             in the order of (str, float)
+        :raises ValueError:             When two potions, or a potion and one already in the inventory, have the same
+                                            buy_price. No quantity is changed then.
 
         --------------------------------------------------------------------------------------------------
         ----------------------------------------|---------------|-----------------------------------------
@@ -147,6 +205,8 @@ class Game:
         LinearProbePotionTable.__getitem__()    |   O(1)        |
         Potion.get_buy_price()                  |   O(1)        |
         Potion.set_quantity()                   |   O(1)        |
+        AVLTree.bulk_load()                     | O(N + ClogC)  |   O(N + C) when the pairs are sorted.
+        BinarySearchTree.__setitem__()          |   O(log N)    |   Only when the inventory is the larger.
         max()                                   |   O(1)        |   Here, max() only compares two items.
         min()                                   |   O(1)        |   Here, min() only compares two items.
         ----------------------------------------|---------------|-----------------------------------------
@@ -157,7 +217,9 @@ class Game:
         # Type Hinting
         buy_price: float
         potion: Potion
+        potions: list[Potion]
         name: str
+        pairs: list[tuple[float, tuple[str, float]]]
         quantity: float
 
         # Checking pre condition(s)
@@ -165,6 +227,8 @@ class Game:
             raise TypeError("".join(["Parameter potion_name_amount_pairs must be a list: potion_name_amount_pairs = ",
                                      str(potion_name_amount_pairs)]))
 
+        potions, pairs = [], []
+
         # Go through the potion_name_amount_pairs --> O(C)
         for name, quantity in potion_name_amount_pairs:
             # Checking pre conditions for values in potion_name_amount_pairs
@@ -182,14 +246,25 @@ class Game:
 
             # Getting the potion's buy_price to use as a key
             buy_price = potion.get_buy_price()
+            potions.append(potion)
 
-            # Updating the quantity of the potion
-            potion.set_quantity(quantity)
-
-            # Add the (name, quantity) to the AVL with the buy_price as the key
+            # The (name, quantity) is added to the AVL with the buy_price as the key
             # This is so that in choose_potions_for_vendors(), the vendors will choose the
             #   kth currently most expensive potion based on the random number generated for them
-            self.inventory[buy_price] = (name, quantity)
+            pairs.append((buy_price, (name, quantity)))
+
+        # When the potions outnumber those already in the inventory, rebuilding it with them in O(N + C log C) is
+        #   cheaper than inserting them one at a time --> O(C log N)
+        # A duplicate buy_price raises a ValueError before any quantity is changed
+        if len(self.inventory) <= len(pairs):
+            self.inventory.bulk_load(pairs)
+        else:
+            for buy_price, item in pairs:
+                self.inventory[buy_price] = item
+
+        # Updating the quantity of each potion --> O(C)
+        for potion, (_, (_, quantity)) in zip(potions, pairs):
+            potion.set_quantity(quantity)
 
     def choose_potions_for_vendors(self, num_vendors: int) -> list:
         """ Return a list specifying what the vendors will sell. Creates
@@ -267,32 +342,40 @@ class Game:
 
         return result
 
-    def solve_game(self, potion_valuations: list[tuple[str, float]], starting_money: list[float]) -> list[float]:
+    def solve_game(self, potion_valuations: list[tuple[str, float]], starting_money: list[float],
+                   batch: bool = False, use_numpy: bool = False) -> list[float]:
         """ Method to find the most optimal ending amount for each day
-            corresponding to the amounts in the starting money input. Creates
-            an AVL for the utilization of the kth largest.
+            corresponding to the amounts in the starting money input. Ranks
+            the potions by yield with a single sort.
         :param potion_valuations:   A list of tuples containing the potions being sold
                                         and how much adventurers are willing to pay for them
         :param starting_money:      A list of starting amounts for each day
+        :param batch:               If True, starting_money is sorted once and swept together with the ranked
+                                        potions in a single merge pass instead of a binary search per day.
+        :param use_numpy:           If True and NumPy is installed, every day is answered at once by
+                                        Game.solve_game_numpy(). Without NumPy, this flag is ignored.
         :return:                    A list of ending amount for each day corresponding to starting_money
-        :complexity:                O(N log N + MN), M and N are defined in the note below.
+        :complexity:                O(N log N + M log N), M and N are defined in the note below.
+                                    O(N log N + M log M) in batch mode.
         :pre:                       Input potion_valuations must be a list.
         :pre:                       Tuples in input potion_valuations must be in the format (str, float).
         :pre:                       Input starting_money must be a list.
         :pre:                       Input starting_money must only contain floats.
+        :pre:                       Input batch must be a boolean.
+        :pre:                       Input use_numpy must be a boolean.
         :raises TypeError:          When any of the pre conditions fail.
+        :raises ValueError:         When a potion name appears more than once in potion_valuations, in either mode.
 
 
         -----------------------------------------------------------------------------------------------------
         METHODS CALLED                          |   COMPLEXITY  |   REMARKS
         ----------------------------------------|---------------|--------------------------------------------
-        AVLTree.kth_largest()                   |   O(log N)    |   Where N = number of nodes in profit_tree.
-        BinarySearchTree.__setitem__()          |   O(log N)    |   Where N = number of nodes in profit_tree.
-        LinearProbePotionTable.__getitem__()    |   O(1)        |
+        Game.rank_potions()                     |   O(N log N)  |
+        Game.__ending_amount()                  |   O(1)        |
+        Game.solve_game_numpy()                 |O(NlogN+MlogN) |   Only called when use_numpy is True.
+        bisect_right()                          |   O(log N)    |   Binary search over the cumulative costs.
+        sorted()                                |   O(M log M)  |   Only called in batch mode.
         List.append()                           |   O(1)        |
-        Potion.get_buy_price()                  |   O(1)        |
-        Potion.get_quantity()                   |   O(1)        |
-        min()                                   |   O(1)        |   Here, min() only compares 2 items.
         ----------------------------------------|---------------|--------------------------------------------
         -----------------------------------------------------------------------------------------------------
 
@@ -300,15 +383,15 @@ class Game:
             - In order to get the most optimised ending amount for each day, we need to find out which potion would give
                 us not only the greatest profit buy also at the cheapest cost.
             - Let's call this expression profit / buy_price as 'yield'.
-            - We calculate the yield of all the potions in potion_valuations.
-            - We then create an AVLTree to contain the potion's buy_price, selling price and quantity, using the yield
-                as their key.
-                - Uh-oh, yields are not unique! But their buy_prices are! So, we use a tuple as the key where the tuple
-                    is (yield, -buy_price). The buy_price is negative as we want to prioritise the cheapest potion with
-                    the greatest yield.
-            - Then, we loop through starting_money and start spending as much as we can, going from the potion with the
-                kth largest key to that of the smallest key. This is why we created an AVLTree, to use kth largest.
-            - For each iteration, we compile the money earned and add the final amount per day into a returning list.
+            - Game.rank_potions() orders the profitable potions from the greatest yield to the smallest yield and
+                precomputes the cumulative cost and cumulative revenue of buying every potion up to each rank.
+            - For each day, the potions bought in full are exactly those whose cumulative cost does not exceed the
+                starting money. A binary search on the cumulative costs finds how many of them there are.
+            - Whatever money is left is spent on the next ranked potion, which can only be partially bought.
+                So the ending amount is the cumulative revenue plus one partial-litre term.
+            - In batch mode, the days are visited from the smallest to the largest starting money instead.
+                The number of potions bought in full can then only grow, so a single pointer walks the cumulative
+                costs once for all of the days and the answers are written back at the days' original positions.
 
         Note:
             N = len(potion_valuations)
@@ -317,18 +400,15 @@ class Game:
         __author__ = 'Benjamin Leong Tjen Ho'
 
         # Type hinting
-        buy_price: float
-        i: int
-        num_of_litres: float
-        profit: float
-        profit_index: int
-        profit_per_day: float
-        profit_tree: AVLTree
-        quantity: float
+        buy_prices: list[float]
+        cumulative_cost: list[float]
+        cumulative_revenue: list[float]
+        num_bought: int
+        ranked: tuple[list[float], list[float], list[float], list[float]]
         returning_list: list[float]
+        sell_prices: list[float]
         start: float
 
-        profit_tree = AVLTree()
         returning_list = []
 
         # Checking pre condition(s)
@@ -341,6 +421,163 @@ class Game:
         elif any([isinstance(money, bool) or not isinstance(money, Numeric) for money in starting_money]):
             raise TypeError(
                 ["Parameter starting money must only contain floats: starting_money = ", str(starting_money)])
+        elif not isinstance(batch, bool):
+            raise TypeError("".join(["Parameter batch must be a boolean: batch = ", str(batch)]))
+        elif not isinstance(use_numpy, bool):
+            raise TypeError("".join(["Parameter use_numpy must be a boolean: use_numpy = ", str(use_numpy)]))
+
+        # The NumPy backend answers every day at once, when NumPy is available
+        if use_numpy and np is not None:
+            return self.solve_game_numpy(potion_valuations, starting_money)
+
+        # O(N log N) to rank the potions and build the cumulative arrays
+        ranked = self.rank_potions(potion_valuations)
+        buy_prices, sell_prices, cumulative_cost, cumulative_revenue = ranked
+
+        if batch:
+            returning_list = [0] * len(starting_money)
+            num_bought = 0
+
+            # O(M log M) to visit the days from the smallest to the largest starting money
+            for i in sorted(range(len(starting_money)), key=starting_money.__getitem__):
+                start = starting_money[i]
+
+                # The pointer only moves forward, so it walks the cumulative costs once in total --> O(N + M)
+                while num_bought < len(buy_prices) and cumulative_cost[num_bought + 1] <= start:
+                    num_bought += 1
+
+                returning_list[i] = self.__ending_amount(ranked, start, num_bought)
+
+            # Total is O(N log N + M log M)
+            return returning_list
+
+        # O(M) since it goes through starting_money
+        for start in starting_money:
+            # O(log N) to find how many of the ranked potions can be bought in full
+            num_bought = bisect_right(cumulative_cost, start) - 1
+            returning_list.append(self.__ending_amount(ranked, start, num_bought))
+        # O(M log N) here^
+
+        # Total is O(N log N + M log N)
+        return returning_list
+
+    @staticmethod
+    def __ending_amount(ranked: tuple[list[float], list[float], list[float], list[float]], start: float,
+                        num_bought: int) -> float:
+        """ Computes the ending amount of a day once the number of potions bought in full is known.
+        :param ranked:      The tuple of lists returned by Game.rank_potions().
+        :param start:       The starting money of the day.
+        :param num_bought:  The number of ranked potions whose cumulative cost does not exceed start.
+        :return:            The ending amount of the day.
+        :complexity:        O(1)
+        """
+        buy_prices, sell_prices, cumulative_cost, cumulative_revenue = ranked
+
+        # No money means nothing can be bought
+        if start <= 0:
+            return start
+
+        # Every potion was bought, so the leftover money is simply kept
+        elif num_bought == len(buy_prices):
+            return cumulative_revenue[num_bought] + (start - cumulative_cost[num_bought])
+
+        # The leftover money is spent on as many litres of the next potion as possible
+        return cumulative_revenue[num_bought] + \
+            (start - cumulative_cost[num_bought]) / buy_prices[num_bought] * sell_prices[num_bought]
+
+    def rank_potions(self, potion_valuations: list[tuple[str, float]]) -> \
+            tuple[list[float], list[float], list[float], list[float]]:
+        """ Ranks the profitable potions by yield and precomputes their cumulative cost and revenue.
+        :param potion_valuations:   A list of tuples containing the potions being sold
+                                        and how much adventurers are willing to pay for them
+        :return:                    A tuple of 4 lists:
+                                        ○ the buy_price of each ranked potion
+                                        ○ the sell_price of each ranked potion
+                                        ○ the cumulative cost of buying all of the first i ranked potions, at index i
+                                        ○ the cumulative revenue of selling all of the first i ranked potions, at index i
+        :complexity:                O(N log N), where N = len(potion_valuations)
+        :pre:                       Tuples in input potion_valuations must be in the format (str, float).
+        :raises TypeError:          When the tuples in potion_valuations are not in the format (str, float).
+
+        -----------------------------------------------------------------------------------------------------
+        METHODS CALLED                          |   COMPLEXITY  |   REMARKS
+        ----------------------------------------|---------------|--------------------------------------------
+        Game.profitable_potions()               |   O(N)        |
+        sorted()                                |   O(N log N)  |   The only step which is not linear.
+        List.append()                           |   O(1)        |
+        ----------------------------------------|---------------|--------------------------------------------
+        -----------------------------------------------------------------------------------------------------
+
+        Note:
+            The potions are sorted in descending order of (yield, -buy_price), where yield = profit / buy_price.
+            Yields are not unique, and the buy_price is negative as we want to prioritise
+                the cheapest potion with the greatest yield.
+            The cumulative lists start with 0, so they are one element longer than the buy_price list.
+        """
+        __author__ = 'Benjamin Leong Tjen Ho'
+
+        # Type hinting
+        buy_price: float
+        buy_prices: list[float]
+        cumulative_cost: list[float]
+        cumulative_revenue: list[float]
+        quantity: float
+        ranked: list[tuple[float, float, float]]
+        sell_prices: list[float]
+
+        # O(N log N) to sort the profitable potions once, from the greatest yield to the smallest yield
+        ranked = sorted(zip(*self.profitable_potions(potion_valuations)),
+                        key=lambda potion: ((potion[1] - potion[0]) / potion[0], -potion[0]), reverse=True)
+
+        buy_prices, sell_prices = [], []
+        cumulative_cost, cumulative_revenue = [0], [0]
+
+        # Walking the ranked potions once --> O(N)
+        for buy_price, sell_price, quantity in ranked:
+            buy_prices.append(buy_price)
+            sell_prices.append(sell_price)
+            cumulative_cost.append(cumulative_cost[-1] + quantity * buy_price)
+            cumulative_revenue.append(cumulative_revenue[-1] + quantity * sell_price)
+
+        return buy_prices, sell_prices, cumulative_cost, cumulative_revenue
+
+    def profitable_potions(self, potion_valuations: list[tuple[str, float]]) -> \
+            tuple[list[float], list[float], list[float]]:
+        """ Looks up the potions being sold and keeps only those which can be sold for a profit.
+        :param potion_valuations:   A list of tuples containing the potions being sold
+                                        and how much adventurers are willing to pay for them
+        :return:                    A tuple of 3 lists, the buy_price, sell_price and quantity of each
+                                        profitable potion, in the order of potion_valuations.
+        :complexity:                O(N), where N = len(potion_valuations)
+        :pre:                       Tuples in input potion_valuations must be in the format (str, float).
+        :pre:                       Each potion must be valued once in potion_valuations.
+        :raises TypeError:          When the tuples in potion_valuations are not in the format (str, float).
+        :raises ValueError:         When a potion name appears more than once in potion_valuations.
+
+        -----------------------------------------------------------------------------------------------------
+        METHODS CALLED                          |   COMPLEXITY  |   REMARKS
+        ----------------------------------------|---------------|--------------------------------------------
+        isinstance()                            |   O(IsIns)    |   Unknown complexity of built-in method.
+                                                |               |       Assumed to be O(1)
+        LinearProbePotionTable.__getitem__()    |   O(1)        |
+        List.append()                           |   O(1)        |
+        Potion.get_buy_price()                  |   O(1)        |
+        Potion.get_quantity()                   |   O(1)        |
+        ----------------------------------------|---------------|--------------------------------------------
+        -----------------------------------------------------------------------------------------------------
+        """
+        __author__ = 'Benjamin Leong Tjen Ho'
+
+        # Type hinting
+        buy_price: float
+        buy_prices: list[float]
+        names: set[str]
+        quantities: list[float]
+        quantity: float
+        sell_prices: list[float]
+
+        buy_prices, sell_prices, quantities = [], [], []
+        names = set()
 
         # Goes through potion_valuations --> O(N)
         for name, sell_price in potion_valuations:
@@ -352,38 +589,74 @@ class Game:
                 raise TypeError("".join(
                     ["Tuples in parameter potion_valuations must contain float at index 1: sell_price = ",
                      str(sell_price)]))
+            elif name in names:
+                raise ValueError("".join(
+                    ["Tuples in parameter potion_valuations must contain distinct potion names: name = ", name]))
+            names.add(name)
 
             potion = self.read_table[name]
             buy_price, quantity = potion.get_buy_price(), potion.get_quantity()
-            profit = sell_price - buy_price
 
-            # O(log N) to add items into the tree
-            if profit > 0:
-                profit_tree[(profit / buy_price, -buy_price)] = (buy_price, sell_price, quantity)
-        # O(N log N) here^
+            if sell_price - buy_price > 0:
+                buy_prices.append(buy_price)
+                sell_prices.append(sell_price)
+                quantities.append(quantity)
 
-        # O(M) since it goes through starting_money
-        for i, start in enumerate(starting_money):
-            profit_per_day, profit_index = 0, 0
+        return buy_prices, sell_prices, quantities
+
+    def solve_game_numpy(self, potion_valuations: list[tuple[str, float]], starting_money: list[float]) -> \
+            list[float]:
+        """ NumPy backend of solve_game(), answering every day of starting_money at once.
+        :param potion_valuations:   A list of tuples containing the potions being sold
+                                        and how much adventurers are willing to pay for them
+        :param starting_money:      A list of starting amounts for each day
+        :return:                    A list of ending amount for each day corresponding to starting_money
+        :complexity:                O(N log N + M log N), where N = len(potion_valuations)
+                                                                M = len(starting_money)
+        :pre:                       NumPy must be installed.
+        :raises ImportError:        When NumPy is not installed.
+        :raises ValueError:         When a potion name appears more than once in potion_valuations, as in solve_game().
 
-            # This loop will through the profit_tree
-            # But it may stop once there is no more money for the day
-            while profit_index < len(profit_tree) and start > 0:
-                buy, sell, quantity = profit_tree.kth_largest(profit_index + 1).item
-                profit_index += 1
+        -----------------------------------------------------------------------------------------------------
+        METHODS CALLED                          |   COMPLEXITY  |   REMARKS
+        ----------------------------------------|---------------|--------------------------------------------
+        Game.profitable_potions()               |   O(N)        |
+        numpy.lexsort()                         |   O(N log N)  |
+        numpy.cumsum()                          |   O(N)        |
+        numpy.searchsorted()                    |   O(M log N)  |
+        ----------------------------------------|---------------|--------------------------------------------
+        -----------------------------------------------------------------------------------------------------
+
+        Note:
+            The potions are ranked by yield from the greatest to the smallest, breaking ties with the cheapest
+                buy_price, which is the same order as the sort in Game.rank_potions().
+            A sentinel potion with a buy_price and sell_price of 1 is appended after the ranked potions, so that
+                the money left after buying every potion is kept as is by the partial-litre term.
+            Results match solve_game() within float tolerance, as the cumulative sums may be added up in a different
+                order.
+        """
+        __author__ = 'Benjamin Leong Tjen Ho'
 
-                # start / buy is how many litres that can be bought
-                num_of_litres = min(start / buy, quantity)
+        if np is None:
+            raise ImportError("NumPy is required for Game.solve_game_numpy()")
 
-                # The profit we make is how many litres * selling price
-                profit_per_day += num_of_litres * sell
+        buy_prices, sell_prices, quantities = map(
+            lambda values: np.asarray(values, dtype=float), self.profitable_potions(potion_valuations))
+        money = np.asarray(starting_money, dtype=float)
 
-                # Our amount is reduced by loss amount
-                start -= num_of_litres * buy
+        # Ranking the potions by the greatest yield, then by the cheapest buy_price
+        order = np.lexsort((buy_prices, -(sell_prices - buy_prices) / buy_prices))
+        buy_prices, sell_prices, quantities = buy_prices[order], sell_prices[order], quantities[order]
 
-            # The final amount is then added to start
-            returning_list.append(profit_per_day + start)
-        # O(MN) here^
+        cumulative_cost = np.concatenate(([0.0], np.cumsum(quantities * buy_prices)))
+        cumulative_revenue = np.concatenate(([0.0], np.cumsum(quantities * sell_prices)))
+        buy_prices, sell_prices = np.append(buy_prices, 1.0), np.append(sell_prices, 1.0)
 
-        # Total is O(N log N + MN)
-        return returning_list
+        # Number of ranked potions bought in full for every day at once
+        num_bought = np.maximum(np.searchsorted(cumulative_cost, money, side='right') - 1, 0)
+
+        ending = cumulative_revenue[num_bought] + \
+            (money - cumulative_cost[num_bought]) / buy_prices[num_bought] * sell_prices[num_bought]
+
+        # No money means nothing can be bought
+        return np.where(money <= 0, money, ending).tolist()
@@ -1,19 +1,30 @@
 """ Hash Table ADT
 
 Defines a Hash Table using Linear Probing for conflict resolution.
-It currently rehashes the primary cluster to handle deletion.
+It currently marks deleted slots with a tombstone to handle deletion,
+and compacts the tombstones away whenever the table is rehashed.
+The table grows to a larger prime size once its load factor passes max_load_factor.
+The probe sequence can be linear, quadratic or use double hashing (see PROBE_STRATEGIES).
+Each key is stored with a 32 bit fingerprint, so probing only compares the strings of keys with equal fingerprints.
+CompactLinearProbePotionTable is a variant which stores its slots as parallel arrays, with the fingerprint of each key.
+RobinHoodPotionTable is a variant which keeps the probe lengths of its keys close to each other.
 
 Updated by: Lim Jing Kai
 """
+from __future__ import annotations
+
 __author__ = 'Brendon Taylor, modified by Jackson Goerner'
 __docformat__ = 'reStructuredText'
 __modified__ = '21/05/2020'
 __since__ = '14/05/2020'
 
+import math
+from array import array
+from collections import OrderedDict
 from typing import TypeVar, Generic
 
 from potion import Potion
-from primes import largest_prime, MAX_SIZE
+from primes import largest_prime, previous_prime, CACHE_LIMIT, MAX_SIZE
 from referential_array import ArrayR
 
 T = TypeVar('T')
@@ -23,24 +34,100 @@ class LinearProbePotionTable(Generic[T]):
     """
     Linear Probe Potion Table
 
-    This potion table does not support deletion.
+    Positions are probed linearly by default. probe_strategy may instead be set to:
+        ○ "quadratic": the i-th probe is at hash + i^2
+        ○ "double":    the i-th probe is at hash + i * Potion.step_hash(key), a second independent hash of the key
+    A quadratic probe sequence may run out of empty slots before the table is full, the table then grows.
+
+    Each slot holds a (key, data, fingerprint) tuple. The fingerprint of a key does not depend on the tablesize, and
+    is compared before the key itself, so that the keys passed while probing are rarely compared character by
+    character, even when they share a long prefix such as "Potion of".
+
+    Deleted slots hold the DELETED tombstone, so that probe chains running through them are not cut short.
+    The tombstones are compacted away by the next resize, or once there are more than
+    MAX_DELETED_FACTOR * table_size of them.
+
+    The home positions of the most recently hashed potion names can be kept in an optional LRU cache of
+    hash_cache_size entries. The cache is cleared whenever the tablesize or the hash function changes.
 
     attributes:
+        cache_hits (int): number of hashes answered by the hash cache
+        cache_misses (int): number of hashes computed while the hash cache is enabled
         conflict_count (int):
         count (int): number of elements in the hash table
+        deleted_count (int): number of tombstones in the hash table
+        hash_cache (OrderedDict): potion names mapped to their home position, from the least recently used
+        hash_cache_size (int): maximum number of entries in the hash cache, 0 when it is disabled
+        max_load_factor (float): load factor which an insert may not push the table past without a resize
+        probe_strategy (str): the probe sequence used, one of PROBE_STRATEGIES
+        rehash_count (int): number of times the table has been resized
         table (ArrayR): used to represent our internal array
         table_size: current size of the hash table
+
+    Class Variables:
+        DELETED (tuple): tombstone of a deleted slot. Its key and fingerprint are None, so it never matches a potion.
+        FINGERPRINT_MASK (int): mask keeping the lowest 32 bits of the built-in hash of a key
+        MAX_DELETED_FACTOR (float): fraction of the table which tombstones may take up before being compacted
+        PROBE_STRATEGIES (tuple): the probe sequences which can be used
     """
+    DELETED = (None, None, None)
+    FINGERPRINT_MASK = 0xFFFFFFFF
+    MAX_DELETED_FACTOR = 0.25
+    PROBE_STRATEGIES = ("linear", "quadratic", "double")
 
-    def __init__(self, max_potions: int, good_hash: bool = True, tablesize_override: int = -1) -> None:
+    def __init__(self, max_potions: int, good_hash: bool = True, tablesize_override: int = -1,
+                 max_load_factor: float = 1.0, hash_cache_size: int = 0, probe_strategy: str = "linear") -> None:
         # Statistic setting
         self.conflict_count = 0
         self.probe_max = 0
         self.probe_total = 0
+        self.rehash_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
+        # Multipliers of good_hash() for the current tablesize
+        self.__hash_coefficients = []
+        self.__coefficients_table_size = 0
+
+        self.hash_cache = OrderedDict()
+        self.set_hash_cache_size(hash_cache_size)
         self.set_good_hash(good_hash)
+        self.set_max_load_factor(max_load_factor)
         self.set_table_size(max_potions, tablesize_override)
         self.initalise_with_tablesize(self.get_table_size())
+        self.set_probe_strategy(probe_strategy)
+
+    @classmethod
+    def from_items(cls, items, good_hash: bool = True, max_load_factor: float = 1.0, hash_cache_size: int = 0,
+                   probe_strategy: str = "linear") -> LinearProbePotionTable[T]:
+        """ Alternative constructor that builds a table holding every (key, data) pair of items.
+            The table is sized once for all of the pairs, so that it is never resized while they are loaded, and the
+            pairs are then placed directly instead of going through insert(). The statistics come out the same as
+            inserting the pairs one at a time into a table of that size. If a key appears several times, its last data
+            is kept.
+        :param items:           An iterable of (key, data) tuples, with a string key.
+        :param good_hash:       A boolean value stating if good_hash() or bad_hash() should be used.
+        :param max_load_factor: The load factor which an insert may not push the table past.
+        :param hash_cache_size: The maximum number of potion names whose home position is cached. 0 disables the cache.
+        :param probe_strategy:  The probe sequence to use, one of PROBE_STRATEGIES.
+            (See details of parameters in the mutator methods)
+        :return:                Returns the table built
+        :complexity:            O(N * K) when there are no conflicts, where N is the number of pairs and K is the size
+                                    of the keys
+        :raises TypeError:      When items is not iterable, or a parameter has the wrong type.
+        :raises ValueError:     When items is empty, or a parameter has an invalid value.
+        :see: #self._load(items: list[tuple[str, T]])
+        """
+        items = list(items)
+        table = cls(len(items), good_hash, -1, max_load_factor, hash_cache_size, probe_strategy)
+
+        # A load factor below 1 may need a larger table than the number of pairs gives
+        if len(items) > table.max_load_factor * len(table.table):
+            table.set_table_size(math.ceil(len(items) / table.max_load_factor), -1)
+            table.initalise_with_tablesize(table.get_table_size())
+
+        table._load(items)
+        return table
 
     # Mutator Methods
     def set_good_hash(self, good_hash: bool) -> None:
@@ -58,6 +145,81 @@ class LinearProbePotionTable(Generic[T]):
         # Initialising LinearProbePotionTable's is_good_hash attribute
         self.good_hash = good_hash
 
+        # The cached home positions were produced by the previous hash function
+        self.hash_cache.clear()
+
+    def set_hash_cache_size(self, hash_cache_size: int) -> None:
+        """ Mutator for hash_cache_size attribute of a LinearProbePotionTable.
+            The least recently used entries are evicted if the cache holds more than the new size.
+        :param hash_cache_size: The maximum number of potion names whose home position is cached. 0 disables the cache.
+        :return:                None
+        :complexity:            O(1) amortised
+        :pre:                   Input hash_cache_size must be a non-negative integer.
+        :raises TypeError:      When input hash_cache_size is not an integer.
+        :raises ValueError:     When input hash_cache_size is negative.
+        """
+        # Checking pre condition(s)
+        if isinstance(hash_cache_size, bool) or not isinstance(hash_cache_size, int):
+            raise TypeError(
+                "".join(["Parameter hash_cache_size must be an integer: hash_cache_size = ", str(hash_cache_size)]))
+        elif hash_cache_size < 0:
+            raise ValueError("".join(
+                ["Parameter hash_cache_size must be a non-negative integer: hash_cache_size = ",
+                 str(hash_cache_size)]))
+
+        # Initialising LinearProbePotionTable's hash_cache_size attribute
+        self.hash_cache_size = hash_cache_size
+        while len(self.hash_cache) > hash_cache_size:
+            self.hash_cache.popitem(last=False)
+
+    def set_probe_strategy(self, probe_strategy: str) -> None:
+        """ Mutator for probe_strategy attribute of a LinearProbePotionTable.
+            The items already in the table are placed again along the new probe sequence.
+        :param probe_strategy:  The probe sequence to use, one of PROBE_STRATEGIES.
+        :return:                None
+        :complexity:            O(1) when the table is empty or the strategy is unchanged,
+                                    otherwise the complexity of _rehash()
+        :pre:                   Input probe_strategy must be one of PROBE_STRATEGIES.
+        :raises TypeError:      When input probe_strategy is not a string.
+        :raises ValueError:     When input probe_strategy is not one of PROBE_STRATEGIES.
+        """
+        # Checking pre condition(s)
+        if not isinstance(probe_strategy, str):
+            raise TypeError(
+                "".join(["Parameter probe_strategy must be a string: probe_strategy = ", str(probe_strategy)]))
+        elif probe_strategy not in self.PROBE_STRATEGIES:
+            raise ValueError("".join(["Parameter probe_strategy must be one of ", ", ".join(self.PROBE_STRATEGIES),
+                                      ": probe_strategy = ", probe_strategy]))
+
+        # Initialising LinearProbePotionTable's probe_strategy attribute
+        if not self.is_empty() and probe_strategy != self.probe_strategy:
+            self.probe_strategy = probe_strategy
+            self._rehash(len(self.table))
+        self.probe_strategy = probe_strategy
+
+    def set_max_load_factor(self, max_load_factor: float) -> None:
+        """ Mutator for max_load_factor attribute of a LinearProbePotionTable.
+        :param max_load_factor: The load factor which an insert may not push the table past.
+                                    Once it would, the table is resized to a larger prime size first.
+                                    A value of 1 only resizes the table when it is full.
+        :return:                None
+        :complexity:            O(1)
+        :pre:                   Input max_load_factor must be Numeric, larger than 0 and smaller or equal to 1.
+        :raises TypeError:      When input max_load_factor is not Numeric.
+        :raises ValueError:     When input max_load_factor is not larger than 0 and smaller or equal to 1.
+        """
+        # Checking pre condition(s)
+        if isinstance(max_load_factor, bool) or not isinstance(max_load_factor, (int, float)):
+            raise TypeError(
+                "".join(["Parameter max_load_factor must be Numeric: max_load_factor = ", str(max_load_factor)]))
+        elif not 0 < max_load_factor <= 1:
+            raise ValueError("".join(
+                ["Parameter max_load_factor must be larger than 0 and smaller or equal to 1: max_load_factor = ",
+                 str(max_load_factor)]))
+
+        # Initialising LinearProbePotionTable's max_load_factor attribute
+        self.max_load_factor = max_load_factor
+
     def set_table_size(self, max_potions: int, tablesize_override: int) -> None:
         """ Mutator for tablesize attribute of a LinearProbePotionTable.
         :param max_potions:         The maximum number of potions that the hash table can hold.
@@ -84,9 +246,25 @@ class LinearProbePotionTable(Generic[T]):
                  str(tablesize_override)]))
 
         # Initialising LinearProbePotionTable's tablesize attribute
-        self.table_size = largest_prime(min(max_potions * 2, MAX_SIZE)) if tablesize_override == -1 \
+        self.table_size = self.prime_below(min(max_potions * 2, MAX_SIZE)) if tablesize_override == -1 \
             else tablesize_override
 
+        # The cached home positions were produced for the previous tablesize
+        self.hash_cache.clear()
+
+    @staticmethod
+    def prime_below(k: int) -> int:
+        """ Finds the prime table size to use for an upper limit k.
+        :param k:           The upper limit where the returning prime number must be lesser than (exclusive).
+        :return:            The largest prime number, strictly lesser than k.
+        :complexity:        O(log P) when k <= CACHE_LIMIT, where P is the number of cached primes.
+                            O(G log^3 k) otherwise, where G is the gap between k and the prime returned.
+        :see: #primes.largest_prime(k: int)
+        :see: #primes.previous_prime(k: int)
+        """
+        # The cached sieve is faster for small tables, Miller-Rabin needs no memory proportional to k for large tables
+        return largest_prime(k) if k <= CACHE_LIMIT else previous_prime(k)
+
     def get_good_hash(self) -> bool:
         """ Accessor for good_hash attribute of a LinearProbePotionTable.
         :return:        The good_hash attribute of a LinearProbePotionTable.
@@ -103,22 +281,75 @@ class LinearProbePotionTable(Generic[T]):
 
     def hash(self, potion_name: str) -> int:
         """ Method to produce the hash value of an item.
+            When the hash cache is enabled, the home position is looked up in it first.
         :param potion_name: The name of the Potion used as an input for the hash function.
         :return:            Returns the hash value of the Potion.
-        :complexity:        O(1)
+        :complexity:        O(len(potion_name))
+        :see: #self.hash_uncached(potion_name: str)
         """
-        hash_function = Potion.good_hash if self.good_hash else Potion.bad_hash
-        return hash_function(potion_name, self.get_table_size())
+        if self.hash_cache_size == 0:
+            return self.hash_uncached(potion_name)
+
+        position = self.hash_cache.get(potion_name)
+        if position is not None:
+            self.cache_hits += 1
+            self.hash_cache.move_to_end(potion_name)
+            return position
+
+        # Computing the home position and evicting the least recently used entry if the cache is full
+        self.cache_misses += 1
+        position = self.hash_uncached(potion_name)
+        self.hash_cache[potion_name] = position
+        if len(self.hash_cache) > self.hash_cache_size:
+            self.hash_cache.popitem(last=False)
+        return position
+
+    def hash_uncached(self, potion_name: str) -> int:
+        """ Method to produce the hash value of an item, without going through the hash cache.
+            The tablesize is checked once by set_table_size(), so the unchecked hash functions are used here.
+        :param potion_name: The name of the Potion used as an input for the hash function.
+        :return:            Returns the hash value of the Potion.
+        :complexity:        O(len(potion_name))
+        """
+        if not self.good_hash:
+            return Potion.bad_hash_unchecked(potion_name, self.table_size)
+
+        # The multipliers of good_hash() only depend on the tablesize, so they are computed once and reused
+        if len(potion_name) > len(self.__hash_coefficients) or self.__coefficients_table_size != self.table_size:
+            self.__hash_coefficients = Potion.good_hash_coefficients(
+                self.table_size, max(len(potion_name), 2 * len(self.__hash_coefficients)))
+            self.__coefficients_table_size = self.table_size
+        return Potion.good_hash_unchecked(potion_name, self.table_size, self.__hash_coefficients)
+
+    @classmethod
+    def fingerprint(cls, potion_name: str) -> int:
+        """ Method to produce the fingerprint of an item, the lowest 32 bits of its built-in hash.
+            Unlike hash(), it does not depend on the tablesize, so it is stored with the key and never recomputed.
+        :param potion_name: The name of the Potion used as an input for the fingerprint.
+        :return:            Returns the fingerprint of the Potion.
+        :complexity:        O(len(potion_name)) the first time, O(1) afterwards as strings cache their hash
+        """
+        return hash(potion_name) & cls.FINGERPRINT_MASK
 
     def statistics(self) -> tuple:
         """ "Accessor" of statistics of the table.
-        :return:     Returns a tuple of 3 values:
+        :return:     Returns a tuple of 4 values:
                         ○ the total number of conflicts (conflict_count)
                         ○ the total distance probed throughout the execution of the code (probe_total)
                         ○ the length of the longest probe chain throughout the execution of the code (probe_max)
+                        ○ the number of times the table has been resized (rehash_count)
         :complexity: O(1)
         """
-        return self.conflict_count, self.probe_total, self.probe_max
+        return self.conflict_count, self.probe_total, self.probe_max, self.rehash_count
+
+    def cache_statistics(self) -> tuple:
+        """ "Accessor" of statistics of the hash cache.
+        :return:     Returns a tuple of 2 values:
+                        ○ the number of hashes answered by the hash cache (cache_hits)
+                        ○ the number of hashes computed while the hash cache is enabled (cache_misses)
+        :complexity: O(1)
+        """
+        return self.cache_hits, self.cache_misses
 
     def __len__(self) -> int:
         """
@@ -127,77 +358,249 @@ class LinearProbePotionTable(Generic[T]):
         """
         return self.count
 
+    # Protected Method
+    def _probe_sequence(self, key: str):
+        """
+        Generates the positions probed for this key, starting from its hash, along the sequence of probe_strategy.
+        The step of double hashing is only computed once the home position of the key is taken.
+        :complexity: O(K) for the first position, where K is the size of the key, then O(1) per position
+                     (O(K) once for the second position of double hashing)
+        """
+        position = self.hash(key)  # get the position using hash
+        yield position
+
+        step = 1
+        for probe_local in range(1, len(self.table)):
+            if self.probe_strategy == "quadratic":  # the gaps between consecutive squares are the odd numbers
+                step = 2 * probe_local - 1
+            elif self.probe_strategy == "double" and probe_local == 1:
+                step = Potion.step_hash_unchecked(key, len(self.table))
+            position = (position + step) % len(self.table)
+            yield position
+
     # Private Method
-    def __linear_probe(self, key: str, is_insert: bool) -> int:
+    def __probe(self, key: str) -> tuple:
         """
-        Find the correct position for this key in the hash table using linear probing
+        Find the position of this key in the hash table, or the position it would be inserted at, in a single pass
+        along its probe sequence.
+        Tombstones are probed past, as the key may sit further along the sequence, and the first one passed is the
+        position a new key is inserted at. The key of a slot is only compared when its fingerprint matches.
         :complexity best: O(K) first position is empty
                           where K is the size of the key
         :complexity worst: O(K + N) when we've searched the entire table
                            where N is the table_size
-        :raises KeyError: When a position can't be found
+        :return: Returns a tuple of 3 values:
+                    ○ the position of the key, or the first free position of its sequence (-1 if there is none)
+                    ○ whether the key was found
+                    ○ the number of probes made to reach the free position
         """
-        position = self.hash(key)  # get the position using hash
-        probe_local = 0
-        probe_start = False
-        if is_insert and self.is_full():
-            raise KeyError(key)
+        fingerprint = self.fingerprint(key)
+        free_position = -1
+        free_probe = 0
 
-        for _ in range(len(self.table)):  # start traversing
+        for probe_local, position in enumerate(self._probe_sequence(key)):  # start traversing
+            if probe_local > 0:
+                self.probe_total += 1
 
-            if self.table[position] is None:  # found empty slot
-                if is_insert:
-                    self.probe_max = max(probe_local, self.probe_max)
-                    self.conflict_count += probe_start
-                    return position
-                else:
-                    raise KeyError(key)  # so the key is not in
+            item = self.table[position]
+            if item is None:  # found empty slot, so the key is not in
+                if free_position == -1:
+                    free_position, free_probe = position, probe_local
+                return free_position, False, free_probe
 
-            elif self.table[position][0] == key:  # found key
-                return position
+            elif item[2] == fingerprint and item[0] == key:  # found key
+                return position, True, probe_local
 
-            else:  # there is something but not the key, try next
-                position = (position + 1) % len(self.table)
-                self.probe_total += 1
-                probe_local += 1
-                probe_start = True
+            elif free_position == -1 and item is self.DELETED:  # there is something but not the key
+                free_position, free_probe = position, probe_local
 
-        raise KeyError(key)
+        return free_position, False, free_probe
 
     def __contains__(self, key: str) -> bool:
         """
         Checks to see if the given key is in the Hash Table
-        :see: #self.__getitem__(self, key: str)
+        :see: #self.__probe(key: str)
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self.__probe(key)[1]
 
     def __getitem__(self, key: str) -> T:
         """
         Get the item at a certain key
-        :see: #self.__linear_probe(key: str, is_insert: bool)
+        :see: #self.__probe(key: str)
         :raises KeyError: when the item doesn't exist
         """
-        position = self.__linear_probe(key, False)
+        position, found, _ = self.__probe(key)
+        if not found:
+            raise KeyError(key)
         return self.table[position][1]
 
+    def get(self, key: str, default: T = None) -> T:
+        """
+        Get the item at a certain key, or default when the key is not in the Hash Table
+        :complexity: O(K + N), where K is the size of the key and N is the length of its probe chain
+        :see: #self.__probe(key: str)
+        """
+        position, found, _ = self.__probe(key)
+        return self.table[position][1] if found else default
+
     def __setitem__(self, key: str, data: T) -> None:
         """
         Set an (key, data) pair in our hash table
-        :see: #self.__linear_probe(key: str, is_insert: bool)
-        :see: #self.__contains__(key: str)
+        The key is looked up and its free position found in the same probe. The table is resized first when
+        inserting a new key would push the load factor past max_load_factor, or when the probe sequence of the key
+        has no free position left.
+        :see: #self.__probe(key: str)
+        :see: #self._resize_for_insert()
+        :see: #self._grow()
+        :raises ValueError: When a new key is inserted into a full table that cannot grow
         """
-        if len(self) == len(self.table) and key not in self:
-            raise ValueError("Cannot insert into a full table.")
-        position = self.__linear_probe(key, True)
+        position, found, probe_local = self.__probe(key)
+
+        if not found:
+            if self._resize_for_insert():
+                position, found, probe_local = self.__probe(key)
+
+            # The probe sequence ran out of free positions, which a quadratic one can do before the table is full
+            while position == -1:
+                self._grow()
+                position, found, probe_local = self.__probe(key)
 
-        if self.table[position] is None:
+            self.probe_max = max(probe_local, self.probe_max)
+            self.conflict_count += probe_local > 0
+            if self.table[position] is self.DELETED:
+                self.deleted_count -= 1
             self.count += 1
-        self.table[position] = (key, data)
+        self.table[position] = (key, data, self.fingerprint(key))
+
+    # Protected Method
+    def _resize_for_insert(self) -> bool:
+        """
+        Resize the table before a new key is inserted, if the key would push the load factor past max_load_factor.
+        The table grows, or only has its tombstones compacted if the live keys still fit.
+        :complexity: O(1) when the table is not resized, otherwise the complexity of _rehash()
+        :return: Returns whether the table was resized, in which case the position of the key must be found again
+        """
+        if len(self) + self.deleted_count + 1 > self.max_load_factor * len(self.table):
+            new_size = len(self.table)
+            if len(self) + 1 > self.max_load_factor * len(self.table):
+                new_size = max(self.prime_below(min(len(self.table) * 2 + 1, MAX_SIZE)), new_size)
+
+            if new_size > len(self.table) or self.deleted_count > 0:
+                self._rehash(new_size)
+                return True
+        return False
+
+    # Protected Method
+    def _grow(self) -> None:
+        """
+        Resize the table to the largest prime below twice its tablesize.
+        :complexity: the complexity of _rehash()
+        :raises ValueError: When the table cannot grow any larger
+        """
+        new_size = self.prime_below(min(len(self.table) * 2 + 1, MAX_SIZE))
+        if new_size <= len(self.table):
+            raise ValueError("Cannot insert into a full table.")
+        self._rehash(new_size)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete the (key, data) pair of key from our hash table, leaving a tombstone in its slot.
+        The table is compacted once the tombstones take up more than MAX_DELETED_FACTOR of it.
+        :complexity: O(K + N) amortised, where K is the size of the key and N is the length of its probe chain
+        :see: #self.__probe(key: str)
+        :raises KeyError: When the key is not in the table
+        """
+        position, found, _ = self.__probe(key)
+        if not found:
+            raise KeyError(key)
+        self.table[position] = self.DELETED
+        self.count -= 1
+        self.deleted_count += 1
+
+        if self.deleted_count > self.MAX_DELETED_FACTOR * len(self.table):
+            self._rehash(len(self.table))
+
+    # Protected Method
+    def _load(self, items: list[tuple[str, T]]) -> None:
+        """
+        Place every (key, data) pair of items into the table, which must already be large enough to hold them all.
+        Without tombstones to look past, each key is placed at the first empty position of its probe sequence.
+        :complexity: O(N * K) when there are no conflicts, where N is the number of pairs and K is the size of the keys
+        :see: #self.__load_item(key: str, data: T)
+        :raises ValueError: When a probe sequence has no empty position left and the table cannot grow
+        """
+        for key, data in items:
+            # The probe sequence ran out of empty positions, which a quadratic one can do before the table is full
+            while not self.__load_item(key, data):
+                self._grow()
+
+    # Private Method
+    def __load_item(self, key: str, data: T) -> bool:
+        """
+        Place a (key, data) pair at the position of its key, or the first empty position of its probe sequence,
+        updating the statistics as __setitem__() does.
+        :complexity best: O(K) first position is empty
+                          where K is the size of the key
+        :complexity worst: O(K + N) when we've searched the entire table
+                           where N is the table_size
+        :return: Returns whether the pair was placed
+        """
+        fingerprint = self.fingerprint(key)
+
+        for probe_local, position in enumerate(self._probe_sequence(key)):  # start traversing
+            if probe_local > 0:
+                self.probe_total += 1
+
+            item = self.table[position]
+            if item is None:  # found empty slot, so the key is new
+                self.probe_max = max(probe_local, self.probe_max)
+                self.conflict_count += probe_local > 0
+                self.count += 1
+                self.table[position] = (key, data, fingerprint)
+                return True
+
+            elif item[2] == fingerprint and item[0] == key:  # found key, its data is replaced
+                self.table[position] = (key, data, fingerprint)
+                return True
+
+        return False
+
+    # Protected Method
+    def _rehash(self, tablesize: int) -> None:
+        """
+        Resize the hash table to tablesize and place every (key, data) pair again, dropping the tombstones.
+        If the probe sequence of a pair has no empty position left, the next larger prime tablesize is tried instead.
+        The probes made while placing the pairs are not counted in the statistics.
+        :complexity: O(N + M) when there are no conflicts, where N is the old table size and M is tablesize
+        :complexity worst: O(N * M) when every pair lands in the same cluster
+        :raises ValueError: When the pairs cannot be placed in a table of MAX_SIZE
+        """
+        old_table = self.table
+
+        while True:
+            self.table_size = tablesize
+            self.hash_cache.clear()
+            self.initalise_with_tablesize(tablesize)
+
+            for item in old_table:
+                if item is not None and item is not self.DELETED:
+                    for position in self._probe_sequence(item[0]):
+                        if self.table[position] is None:
+                            self.table[position] = item
+                            self.count += 1
+                            break
+                    else:
+                        break
+            else:
+                break
+
+            # A pair could not be placed, so the pairs are placed again in a larger table
+            new_size = self.prime_below(min(tablesize * 2 + 1, MAX_SIZE))
+            if new_size <= tablesize:
+                raise ValueError("Cannot place the items of the table in a table of MAX_SIZE.")
+            tablesize = new_size
+
+        self.rehash_count += 1
 
     def initalise_with_tablesize(self, tablesize: int) -> None:
         """
@@ -205,6 +608,7 @@ class LinearProbePotionTable(Generic[T]):
         Complexity: O(n), where n is len(tablesize)
         """
         self.count = 0
+        self.deleted_count = 0
         self.table = ArrayR(tablesize)
 
     def is_empty(self):
@@ -235,7 +639,438 @@ class LinearProbePotionTable(Generic[T]):
         """
         result = ""
         for item in self.table:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + ", " + str(value) + ")\n"
+            if item is not None and item is not self.DELETED:
+                result += "(" + str(item[0]) + ", " + str(item[1]) + ")\n"
+        return result
+
+
+class CompactLinearProbePotionTable(LinearProbePotionTable[T]):
+    """
+    Compact Linear Probe Potion Table
+
+    A Linear Probe Potion Table storing its slots as a struct of arrays: the keys, the data and the fingerprints of
+    the keys are kept in parallel arrays, instead of a (key, data, fingerprint) tuple per slot. Inserting a key does
+    not allocate a tuple, and the fingerprints take 4 bytes per slot in a compact array.
+
+    attributes:
+        fingerprints (array): fingerprint of the key in the same slot of keys, as unsigned 32 bit integers
+        keys (ArrayR): the key in each slot, None when the slot is empty, DELETED when it holds a tombstone
+        table (ArrayR): the same array as keys
+        values (ArrayR): the data of the key in the same slot of keys
+        (See the other attributes in LinearProbePotionTable)
+
+    Class Variables:
+        None
+    """
+
+    # Private Method
+    def __probe(self, key: str, fingerprint: int) -> tuple:
+        """
+        Find the position of this key in the hash table, or the position it would be inserted at, in a single pass
+        along its probe sequence. The strings are only compared when the fingerprints are equal.
+        :complexity best: O(K) first position is empty
+                          where K is the size of the key
+        :complexity worst: O(K + N) when we've searched the entire table
+                           where N is the table_size
+        :return: Returns a tuple of 3 values:
+                    ○ the position of the key, or the first free position of its sequence (-1 if there is none)
+                    ○ whether the key was found
+                    ○ the number of probes made to reach the free position
+        :see: #LinearProbePotionTable.__probe(key: str)
+        """
+        free_position = -1
+        free_probe = 0
+
+        for probe_local, position in enumerate(self._probe_sequence(key)):  # start traversing
+            if probe_local > 0:
+                self.probe_total += 1
+
+            slot_key = self.keys[position]
+            if slot_key is None:  # found empty slot, so the key is not in
+                if free_position == -1:
+                    free_position, free_probe = position, probe_local
+                return free_position, False, free_probe
+
+            elif self.fingerprints[position] == fingerprint and slot_key == key:  # found key
+                return position, True, probe_local
+
+            elif free_position == -1 and slot_key is self.DELETED:  # there is something but not the key
+                free_position, free_probe = position, probe_local
+
+        return free_position, False, free_probe
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+        :see: #self.__probe(key: str, fingerprint: int)
+        """
+        return self.__probe(key, self.fingerprint(key))[1]
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :see: #self.__probe(key: str, fingerprint: int)
+        :raises KeyError: when the item doesn't exist
+        """
+        position, found, _ = self.__probe(key, self.fingerprint(key))
+        if not found:
+            raise KeyError(key)
+        return self.values[position]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+        Get the item at a certain key, or default when the key is not in the Hash Table
+        :see: #self.__probe(key: str, fingerprint: int)
+        """
+        position, found, _ = self.__probe(key, self.fingerprint(key))
+        return self.values[position] if found else default
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        :see: #LinearProbePotionTable.__setitem__(key: str, data: T)
+        :raises ValueError: When a new key is inserted into a full table that cannot grow
+        """
+        fingerprint = self.fingerprint(key)
+        position, found, probe_local = self.__probe(key, fingerprint)
+
+        if not found:
+            if self._resize_for_insert():
+                position, found, probe_local = self.__probe(key, fingerprint)
+
+            # The probe sequence ran out of free positions, which a quadratic one can do before the table is full
+            while position == -1:
+                self._grow()
+                position, found, probe_local = self.__probe(key, fingerprint)
+
+            self.probe_max = max(probe_local, self.probe_max)
+            self.conflict_count += probe_local > 0
+            if self.keys[position] is self.DELETED:
+                self.deleted_count -= 1
+            self.count += 1
+            self.keys[position] = key
+            self.fingerprints[position] = fingerprint
+        self.values[position] = data
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete the (key, data) pair of key from our hash table, leaving a tombstone in its slot.
+        :see: #LinearProbePotionTable.__delitem__(key: str)
+        :raises KeyError: When the key is not in the table
+        """
+        position, found, _ = self.__probe(key, self.fingerprint(key))
+        if not found:
+            raise KeyError(key)
+        self.keys[position] = self.DELETED
+        self.values[position] = None
+        self.count -= 1
+        self.deleted_count += 1
+
+        if self.deleted_count > self.MAX_DELETED_FACTOR * len(self.table):
+            self._rehash(len(self.table))
+
+    # Protected Method
+    def _load(self, items: list[tuple[str, T]]) -> None:
+        """
+        Place every (key, data) pair of items into the table, which must already be large enough to hold them all.
+        :complexity: O(N * K) when there are no conflicts, where N is the number of pairs and K is the size of the keys
+        :see: #LinearProbePotionTable._load(items: list[tuple[str, T]])
+        :see: #self.__load_item(key: str, data: T)
+        :raises ValueError: When a probe sequence has no empty position left and the table cannot grow
+        """
+        for key, data in items:
+            # The probe sequence ran out of empty positions, which a quadratic one can do before the table is full
+            while not self.__load_item(key, data):
+                self._grow()
+
+    # Private Method
+    def __load_item(self, key: str, data: T) -> bool:
+        """
+        Place a (key, data) pair at the position of its key, or the first empty position of its probe sequence,
+        updating the statistics as __setitem__() does.
+        :complexity best: O(K) first position is empty
+                          where K is the size of the key
+        :complexity worst: O(K + N) when we've searched the entire table
+                           where N is the table_size
+        :return: Returns whether the pair was placed
+        """
+        fingerprint = self.fingerprint(key)
+
+        for probe_local, position in enumerate(self._probe_sequence(key)):  # start traversing
+            if probe_local > 0:
+                self.probe_total += 1
+
+            slot_key = self.keys[position]
+            if slot_key is None:  # found empty slot, so the key is new
+                self.probe_max = max(probe_local, self.probe_max)
+                self.conflict_count += probe_local > 0
+                self.count += 1
+                self.keys[position] = key
+                self.fingerprints[position] = fingerprint
+                self.values[position] = data
+                return True
+
+            elif self.fingerprints[position] == fingerprint and slot_key == key:  # found key, its data is replaced
+                self.values[position] = data
+                return True
+
+        return False
+
+    # Protected Method
+    def _rehash(self, tablesize: int) -> None:
+        """
+        Resize the hash table to tablesize and place every (key, data) pair again, dropping the tombstones.
+        The fingerprints are moved along with their keys instead of being computed again.
+        :see: #LinearProbePotionTable._rehash(tablesize: int)
+        :raises ValueError: When the pairs cannot be placed in a table of MAX_SIZE
+        """
+        old_keys, old_values, old_fingerprints = self.keys, self.values, self.fingerprints
+
+        while True:
+            self.table_size = tablesize
+            self.hash_cache.clear()
+            self.initalise_with_tablesize(tablesize)
+
+            for index in range(len(old_keys)):
+                key = old_keys[index]
+                if key is not None and key is not self.DELETED:
+                    for position in self._probe_sequence(key):
+                        if self.keys[position] is None:
+                            self.keys[position] = key
+                            self.values[position] = old_values[index]
+                            self.fingerprints[position] = old_fingerprints[index]
+                            self.count += 1
+                            break
+                    else:
+                        break
+            else:
+                break
+
+            # A pair could not be placed, so the pairs are placed again in a larger table
+            new_size = self.prime_below(min(tablesize * 2 + 1, MAX_SIZE))
+            if new_size <= tablesize:
+                raise ValueError("Cannot place the items of the table in a table of MAX_SIZE.")
+            tablesize = new_size
+
+        self.rehash_count += 1
+
+    def initalise_with_tablesize(self, tablesize: int) -> None:
+        """
+        Initialise new arrays of keys, data and fingerprints, with table size given by tablesize.
+        Complexity: O(n), where n is len(tablesize)
+        """
+        self.count = 0
+        self.deleted_count = 0
+        self.keys = self.table = ArrayR(tablesize)
+        self.values = ArrayR(tablesize)
+        self.fingerprints = array('I', bytes(4 * tablesize))
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular order)
+        :complexity: O(N) where N is the table size
+        """
+        result = ""
+        for index in range(len(self.keys)):
+            key = self.keys[index]
+            if key is not None and key is not self.DELETED:
+                result += "(" + str(key) + ", " + str(self.values[index]) + ")\n"
         return result
+
+
+class RobinHoodPotionTable(LinearProbePotionTable[T]):
+    """
+    Robin Hood Potion Table
+
+    A Linear Probe Potion Table where a key being inserted takes the slot of any key closer to its home position,
+    which then carries on probing in its place. This bounds the variance of the probe lengths, and lets a lookup
+    stop as soon as it passes a key closer to its home than the key looked up would be.
+    Deleted keys are removed by shifting the rest of their cluster back, so no tombstones are left.
+
+    attributes:
+        homes (ArrayR): home position of the key in the same slot of table
+        (See the other attributes in LinearProbePotionTable)
+
+    Class Variables:
+        PROBE_STRATEGIES (tuple): Robin Hood hashing compares distances along a linear probe sequence only
+    """
+    PROBE_STRATEGIES = ("linear",)
+
+    # Private Method
+    def __distance(self, position: int) -> int:
+        """
+        Returns how far the key at position is from its home position
+        :complexity: O(1)
+        """
+        return (position - self.homes[position]) % len(self.table)
+
+    # Private Method
+    def __robin_hood_probe(self, key: str) -> tuple:
+        """
+        Find the position of this key in the hash table, or the position it would be inserted at, in a single pass.
+        The probe stops at the first empty slot or the first key closer to its home than this key would be.
+        The key of a slot is only compared when its fingerprint matches.
+        :complexity best: O(K) first position is empty
+                          where K is the size of the key
+        :complexity worst: O(K + N) when we've searched the entire table
+                           where N is the table_size
+        :return: Returns a tuple of 3 values:
+                    ○ the position of the key, or the position it would be inserted at (-1 if there is none)
+                    ○ whether the key was found
+                    ○ the distance of that position from the home position of the key
+        """
+        fingerprint = self.fingerprint(key)
+        position = self.hash(key)  # get the position using hash
+
+        for distance in range(len(self.table)):  # start traversing
+            item = self.table[position]
+
+            if item is None or self.__distance(position) < distance:  # the key is not in
+                return position, False, distance
+
+            elif item[2] == fingerprint and item[0] == key:  # found key
+                return position, True, distance
+
+            else:  # there is something but not the key, try next
+                position = (position + 1) % len(self.table)
+                self.probe_total += 1
+
+        return -1, False, 0
+
+    # Private Method
+    def __place(self, item: tuple, home: int, position: int, distance: int, count_probes: bool) -> None:
+        """
+        Place a new (key, data) pair at position, displacing the keys closer to their home further along the cluster.
+        :complexity: O(N) where N is the length of the cluster from position
+        :pre: The table must have an empty slot
+        """
+        while self.table[position] is not None:
+            if self.__distance(position) < distance:
+                if count_probes:
+                    self.probe_max = max(distance, self.probe_max)
+                distance = self.__distance(position)
+                item, self.table[position] = self.table[position], item
+                home, self.homes[position] = self.homes[position], home
+
+            position = (position + 1) % len(self.table)
+            distance += 1
+            if count_probes:
+                self.probe_total += 1
+
+        if count_probes:
+            self.probe_max = max(distance, self.probe_max)
+        self.table[position] = item
+        self.homes[position] = home
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+        :see: #self.__robin_hood_probe(key: str)
+        """
+        return self.__robin_hood_probe(key)[1]
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :see: #self.__robin_hood_probe(key: str)
+        :raises KeyError: when the item doesn't exist
+        """
+        position, found, _ = self.__robin_hood_probe(key)
+        if not found:
+            raise KeyError(key)
+        return self.table[position][1]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+        Get the item at a certain key, or default when the key is not in the Hash Table
+        :see: #self.__robin_hood_probe(key: str)
+        """
+        position, found, _ = self.__robin_hood_probe(key)
+        return self.table[position][1] if found else default
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        The table is resized first when inserting a new key would push the load factor past max_load_factor.
+        conflict_count counts the new keys not placed at their home position, and probe_max covers the keys displaced.
+        :see: #self.__robin_hood_probe(key: str)
+        :see: #self.__place(item: tuple, home: int, position: int, distance: int, count_probes: bool)
+        :raises ValueError: When a new key is inserted into a full table that cannot grow
+        """
+        position, found, distance = self.__robin_hood_probe(key)
+
+        if found:
+            self.table[position] = (key, data, self.fingerprint(key))
+            return
+
+        if len(self) + 1 > self.max_load_factor * len(self.table):
+            new_size = max(self.prime_below(min(len(self.table) * 2 + 1, MAX_SIZE)), len(self.table))
+            if new_size > len(self.table):
+                self._rehash(new_size)
+                position, found, distance = self.__robin_hood_probe(key)
+
+        if position == -1 or self.is_full():
+            raise ValueError("Cannot insert into a full table.")
+
+        self.conflict_count += distance > 0
+        home = (position - distance) % len(self.table)
+        self.__place((key, data, self.fingerprint(key)), home, position, distance, True)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete the (key, data) pair of key from our hash table, shifting the rest of its cluster back by one slot.
+        :complexity: O(K + N), where K is the size of the key and N is the length of its cluster
+        :see: #self.__robin_hood_probe(key: str)
+        :raises KeyError: When the key is not in the table
+        """
+        position, found, _ = self.__robin_hood_probe(key)
+        if not found:
+            raise KeyError(key)
+
+        following = (position + 1) % len(self.table)
+        while self.table[following] is not None and self.__distance(following) > 0:
+            self.table[position], self.homes[position] = self.table[following], self.homes[following]
+            position, following = following, (following + 1) % len(self.table)
+        self.table[position] = None
+        self.homes[position] = None
+        self.count -= 1
+
+    # Protected Method
+    def _load(self, items: list[tuple[str, T]]) -> None:
+        """
+        Place every (key, data) pair of items into the table, which must already be large enough to hold them all.
+        The pairs are inserted one at a time, as a new key may displace the keys already placed.
+        :complexity: O(N * K) when there are no conflicts, where N is the number of pairs and K is the size of the keys
+        :see: #self.__setitem__(key: str, data: T)
+        """
+        for key, data in items:
+            self[key] = data
+
+    # Protected Method
+    def _rehash(self, tablesize: int) -> None:
+        """
+        Resize the hash table to tablesize and place every (key, data) pair again.
+        The probes made while placing the pairs are not counted in the statistics.
+        :complexity: O(N + M) when there are no conflicts, where N is the old table size and M is tablesize
+        :complexity worst: O(N * M) when every pair lands in the same cluster
+        """
+        old_table = self.table
+        self.table_size = tablesize
+        self.hash_cache.clear()
+        self.initalise_with_tablesize(tablesize)
+
+        for item in old_table:
+            if item is not None:
+                home = self.hash(item[0])
+                self.__place(item, home, home, 0, False)
+
+        self.rehash_count += 1
+
+    def initalise_with_tablesize(self, tablesize: int) -> None:
+        """
+        Initialise new arrays of keys and home positions, with table size given by tablesize.
+        Complexity: O(n), where n is len(tablesize)
+        """
+        LinearProbePotionTable.initalise_with_tablesize(self, tablesize)
+        self.homes = ArrayR(tablesize)
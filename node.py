@@ -21,12 +21,15 @@ class ListNode(Generic[T]):
 
 class TreeNode(Generic[K, I]):
     """ Node class represent BST nodes.
+        The attributes are kept in __slots__ instead of a __dict__ per node, as a tree may hold millions of them.
+
         Attributes:
             key (int):          The key value used to determine the position of the node in the Tree.
             item (T):           The item stored in the node.
             left (TreeNode):    The left child node of the TreeNode instance.
             right (TreeNode):   The right child node of the TreeNode instance.
     """
+    __slots__ = ('key', 'item', 'left', 'right')
 
     def __init__(self, key: K, item: I = None) -> None:
         """
@@ -56,7 +59,9 @@ class TreeNode(Generic[K, I]):
 
 class AVLTreeNode(TreeNode, Generic[K, I]):
     """ Node class for AVL trees.
-        Objects of this class have an additional variable - height.
+        Objects of this class have additional variables - height, right_count and size.
+        The mutators check their input, AVLTree updates the attributes of its nodes directly instead, as it only
+        writes valid heights, right counts and sizes.
 
         Attributes:
             key (int):          The key value used to determine the position of the node in the Tree.
@@ -65,10 +70,12 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
             right (TreeNode):   The right child node of the AVLTreeNode instance.
             height (int):       The height of the tree rooted at the AVLTreeNode instance.
             right_count (int):  The number of nodes attached to the right of the AVLTreeNode instance.
+            size (int):         The number of nodes in the tree rooted at the AVLTreeNode instance.
 
         Class Variables:
             None
     """
+    __slots__ = ('height', 'right_count', 'size')
 
     def __init__(self, key: K, item: I = None) -> None:
         """
@@ -84,19 +91,20 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
         METHODS CALLED                  |   COMPLEXITY  |   REMARKS
         --------------------------------|---------------|--------------
         TreeNode.__init__()             |   O(1)        |
-        AVLTreeNode.set_height()        |   O(1)        |
-        AVLTreeNode.set_right_count()   |   O(1)        |
         --------------------------------|---------------|--------------
         ---------------------------------------------------------------
         """
 
-        super(AVLTreeNode, self).__init__(key, item)
-        self.set_height(1)
+        TreeNode.__init__(self, key, item)
+        self.height = 1
 
         # Additional AVL Tree Node attributes: right_count
         # This attribute keeps track of how many nodes are on the right side of the AVL Tree Node
         # right_count is used to find the k-th largest node in the entire AVL Tree
-        self.set_right_count(0)
+        self.right_count = 0
+
+        # size counts the node itself and every node below it, for the order statistics of the AVL Tree
+        self.size = 1
 
     # Mutator Methods
     def set_height(self, height: int) -> None:
@@ -148,6 +156,31 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
         # Initialising AVLTreeNode's right_count attribute
         self.right_count = right_count
 
+    def set_size(self, size: int) -> None:
+        """ Mutator method for size attribute of an AVLTreeNode.
+        :param size:        Number of nodes in the tree rooted at an AVLTreeNode, itself included
+        :return:            None
+        :complexity:        O(1)
+        :pre:               Input size must be a positive integer.
+        :raises TypeError:  When input size is not an integer.
+        :raises ValueError: When input size is not positive.
+
+        -------------------------------------------------------------------------------------------------
+        METHODS CALLED  |   COMPLEXITY  |   REMARKS
+        ----------------|---------------|----------------------------------------------------------------
+        isinstance()    |   O(IsIns)    |   Unknown complexity for built-in functions. Assumed to be O(1)
+        ----------------|---------------|----------------------------------------------------------------
+        -------------------------------------------------------------------------------------------------
+        """
+        # Checking pre condition(s)
+        if isinstance(size, bool) or not isinstance(size, int):
+            raise TypeError("".join(["Parameter size must be an integer: size = ", str(size)]))
+        elif size <= 0:
+            raise ValueError("".join(["Parameter size must be positive: size = ", str(size)]))
+
+        # Initialising AVLTreeNode's size attribute
+        self.size = size
+
     # Accessor Methods
     def get_height(self) -> int:
         """ Accessor method for height attribute of an AVLTreeNode.
@@ -161,4 +194,11 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
         :return:     The right_count of the Node
         :complexity: O(1)
         """
-        return self.right_count
\ No newline at end of file
+        return self.right_count
+
+    def get_size(self) -> int:
+        """ Accessor method for size attribute of an AVLTreeNode.
+        :return:     The size of the Node
+        :complexity: O(1)
+        """
+        return self.size
@@ -0,0 +1,289 @@
+""" Hash Table ADT
+
+Defines a frozen Hash Table over a fixed set of keys, using a minimal perfect hash function built with the
+CHD (Compress, Hash and Displace) algorithm.
+The keys are spread over small buckets by a first hash. Starting from the largest bucket, each bucket is given
+a displacement which sends all of its keys to free positions of the table, so every key ends up with a position of its
+own, and the table has exactly one slot per key.
+The free positions are kept in a list: a bucket is only tried with the displacements sending its first key to one of
+them, for a bounded number of shifts, and the buckets of a single key, which come last, take a free position directly.
+So the build stays linear even though the table ends up full, rather than scanning the table for the last buckets.
+A lookup then costs one hash of the key, and one comparison with the key stored at its position.
+"""
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar, Generic
+
+from referential_array import ArrayR
+
+T = TypeVar('T')
+
+
+class PerfectHashPotionTable(Generic[T]):
+    """
+    Perfect Hash Potion Table
+
+    The keys are fixed when the table is built: the data of a key can be replaced, but new keys cannot be inserted
+    and keys cannot be deleted. Shares the accessors and the statistics of LinearProbePotionTable, which stay at 0
+    as no position is ever probed, apart from rehash_count which counts the seeds tried by the build.
+
+    attributes:
+        conflict_count (int): always 0
+        count (int): number of elements in the hash table
+        displacements (ArrayR): the displacement of each bucket of keys
+        probe_max (int): always 0
+        probe_total (int): always 0
+        rehash_count (int): number of seeds which failed to give every key a position of its own
+        seed (int): the seed of the hash function the table was built with
+        table (ArrayR): used to represent our internal array, with one (key, data) pair per slot
+        table_size (int): current size of the hash table, equal to the number of keys
+
+    Class Variables:
+        BUCKET_SIZE (int): average number of keys per bucket
+        MAX_SHIFTS (int): number of shifts tried for a bucket before the build is retried with the next seed
+    """
+    BUCKET_SIZE = 3
+    MAX_SHIFTS = 256
+
+    def __init__(self, items: list[tuple[str, T]], seed: int = 0) -> None:
+        """ Builds the table over the keys of items.
+            If a key appears several times, its last data is kept.
+        :param items:       A list of (key, data) tuples.
+        :param seed:        The first seed tried for the hash function.
+        :return:            None
+        :complexity:        O(N) expected, where N is len(items)
+        :pre:               Input items must be a non-empty list of tuples with a string key.
+        :raises TypeError:  When items is not a list, or one of its keys is not a string.
+        :raises ValueError: When items is empty.
+        """
+        # Checking pre condition(s)
+        if not isinstance(items, list):
+            raise TypeError("".join(["Parameter items must be a list: items = ", str(items)]))
+        elif len(items) == 0:
+            raise ValueError("Parameter items must not be empty.")
+        for key, _ in items:
+            if not isinstance(key, str):
+                raise TypeError("".join(["Keys of parameter items must be strings: key = ", str(key)]))
+
+        # Statistic setting
+        self.conflict_count = 0
+        self.probe_max = 0
+        self.probe_total = 0
+        self.rehash_count = 0
+
+        self.seed = seed
+        while not self.__build(items):
+            self.seed += 1
+            self.rehash_count += 1
+
+    def hash(self, potion_name: str) -> tuple:
+        """ Method to produce the hash values of an item, from a single 64 bit FNV-1a hash seeded with seed.
+        :param potion_name: The name of the Potion used as an input for the hash function.
+        :return:            Returns a tuple of 3 values:
+                                ○ the bucket of the Potion
+                                ○ the position of the Potion for a displacement of 0
+                                ○ the step added to that position by the displacement
+        :complexity:        O(len(potion_name))
+        """
+        value = 14695981039346656037 ^ self.seed
+        for char_value in map(ord, potion_name):
+            value = (value ^ char_value) * 1099511628211 & 0xFFFFFFFFFFFFFFFF
+
+        # Mixing every bit of the hash into every other (the SplitMix64 finaliser), as names differing in their last
+        #   characters only differ in a few bits of value, then taking the position and the step from its two halves
+        mixed = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+        mixed = (mixed ^ (mixed >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+        mixed ^= mixed >> 31
+
+        # The bucket is taken from one more multiplication, so that it does not depend on the same bits as either
+        bucket = (mixed * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF) >> 32
+        return bucket % len(self.displacements), (mixed >> 32) % self.table_size, mixed % self.table_size
+
+    # Private Method
+    def __build(self, items: list[tuple[str, T]]) -> bool:
+        """
+        Try to build the table with the current seed.
+        The free slots are kept in a list, so a bucket is only tried against displacements which send its first key
+        to a free slot, and a bucket of a single key takes the first free slot straight away.
+        :complexity: O(N) expected, where N is len(items)
+        :return: Returns whether every key was given a position of its own
+        """
+        # Finding the distinct keys, the last data of a key replacing the previous ones
+        catalogue = {}
+        for key, data in items:
+            catalogue[key] = data
+        self.count = self.table_size = len(catalogue)
+        self.displacements = ArrayR(max(1, -(-self.count // self.BUCKET_SIZE)))
+        self.table = ArrayR(self.table_size)
+
+        # Spreading the keys over the buckets
+        buckets = [[] for _ in range(len(self.displacements))]
+        for key, data in catalogue.items():
+            bucket, position, step = self.hash(key)
+            buckets[bucket].append((position, step, (key, data)))
+
+        # The free slots, and the index of each slot in that list, so a slot is removed from it in O(1)
+        free = list(range(self.table_size))
+        free_index = list(range(self.table_size))
+        taken = bytearray(self.table_size)
+
+        # Displacing the largest buckets first, while most of the table is free
+        for bucket in sorted(range(len(buckets)), key=lambda index: len(buckets[index]), reverse=True):
+            if len(buckets[bucket]) == 0:
+                self.displacements[bucket] = 0
+                continue
+
+            displacement = self.__displacement(buckets[bucket], free, taken)
+            if displacement == -1:
+                return False
+
+            self.displacements[bucket] = displacement
+            shift, offset = divmod(displacement, self.table_size)
+            for position, step, item in buckets[bucket]:
+                slot = (position + shift * step + offset) % self.table_size
+                self.table[slot] = item
+                taken[slot] = 1
+
+                # Swapping the slot with the last free slot, before removing it from the list
+                last = free.pop()
+                if last != slot:
+                    free[free_index[slot]] = last
+                    free_index[last] = free_index[slot]
+        return True
+
+    # Private Method
+    def __displacement(self, bucket: list[tuple[int, int, tuple[str, T]]], free: list[int], taken: bytearray) -> int:
+        """
+        Find a displacement sending every key of a bucket to a free slot of its own, taken marking the used slots.
+        For each shift of MAX_SHIFTS, the offsets tried are those which send the first key to one of the free slots.
+        :complexity: O(S x F x B) in the worst case, where S is MAX_SHIFTS, F is the number of free slots and B is
+                        the size of the bucket, O(B) expected while the table is mostly free
+        :return: Returns the displacement, shift * table_size + offset, or -1 if no displacement was found
+        """
+        # A single key can take any free slot
+        if len(bucket) == 1:
+            position, _, _ = bucket[0]
+            return (free[0] - position) % self.table_size
+
+        tried = set()
+        for shift in range(min(self.MAX_SHIFTS, self.table_size)):
+            # The positions of the keys for this shift and an offset of 0, which must all differ
+            positions = [(position + shift * step) % self.table_size for position, step, _ in bucket]
+            if len(set(positions)) < len(positions):
+                continue
+
+            # Shifts placing the keys at the same distances from the first key have the same offsets to try
+            # Keys with the same step, for instance, keep their distances for every shift
+            distances = tuple((position - positions[0]) % self.table_size for position in positions)
+            if distances in tried:
+                continue
+            tried.add(distances)
+
+            for slot in free:
+                offset = (slot - positions[0]) % self.table_size
+                if not any(taken[(position + offset) % self.table_size] for position in positions[1:]):
+                    return shift * self.table_size + offset
+        return -1
+
+    # Private Method
+    def __position(self, key: str) -> int:
+        """
+        Find the position of this key in the hash table.
+        :complexity: O(K) where K is the size of the key
+        :return: Returns the position of the key, -1 if the key is not in the table
+        """
+        bucket, position, step = self.hash(key)
+        shift, offset = divmod(self.displacements[bucket], self.table_size)
+        position = (position + shift * step + offset) % self.table_size
+        return position if self.table[position][0] == key else -1
+
+    def statistics(self) -> tuple:
+        """ "Accessor" of statistics of the hash table.
+        :return:     Returns a tuple of 4 values: conflict_count, probe_total, probe_max and rehash_count
+        :complexity: O(1)
+        """
+        return self.conflict_count, self.probe_total, self.probe_max, self.rehash_count
+
+    def get_table_size(self) -> int:
+        """ Accessor for tablesize attribute of a PerfectHashPotionTable.
+        :return:     Returns the tablesize of the table, which is the number of keys
+        :complexity: O(1)
+        """
+        return self.table_size
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        :complexity: O(1)
+        """
+        return self.count
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+        :see: #self.__position(key: str)
+        """
+        return self.__position(key) != -1
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :complexity: O(K) where K is the size of the key
+        :see: #self.__position(key: str)
+        :raises KeyError: when the item doesn't exist
+        """
+        position = self.__position(key)
+        if position == -1:
+            raise KeyError(key)
+        return self.table[position][1]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+        Get the item at a certain key, or default when the key is not in the Hash Table
+        :see: #self.__position(key: str)
+        """
+        position = self.__position(key)
+        return self.table[position][1] if position != -1 else default
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Replace the data of a key of the hash table
+        :complexity: O(K) where K is the size of the key
+        :see: #self.__position(key: str)
+        :raises KeyError: When the key is not in the table, as the keys are fixed once the table is built
+        """
+        position = self.__position(key)
+        if position == -1:
+            raise KeyError(key)
+        self.table[position] = (key, data)
+
+    def insert(self, key: str, data: T) -> None:
+        """
+        Utility method to call our setitem method
+        :see: #__setitem__(self, key: str, data: T)
+        """
+        self[key] = data
+
+    def is_empty(self):
+        """
+        Returns whether the hash table is empty, which a built table never is
+        :complexity: O(1)
+        """
+        return False
+
+    def is_full(self):
+        """
+        Returns whether the hash table is full, which a built table always is
+        :complexity: O(1)
+        """
+        return True
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular order)
+        :complexity: O(N) where N is the table size
+        """
+        result = ""
+        for (key, value) in self.table:
+            result += "(" + str(key) + ", " + str(value) + ")\n"
+        return result
@@ -221,20 +221,54 @@ class Potion:
         elif tablesize < 1:
             raise ValueError("".join(["tablesize must be a positive integer: tablesize = ", str(tablesize)]))
 
+        return cls.good_hash_unchecked(potion_name, tablesize)
+
+    @staticmethod
+    def good_hash_unchecked(potion_name: str, tablesize: int, coefficients: list[int] = None) -> int:
+        """ Good hashing function, without checking its pre conditions.
+            Used by hash tables, which check their own tablesize once instead of on every call.
+        :param potion_name:     The Potion name being hashed.
+        :param tablesize:       The size of the hash table which the Potion is added to.
+        :param coefficients:    The multipliers of good_hash_coefficients() for tablesize, if already computed.
+        :return:                The hash value of the Potion.
+        :complexity:            O(len(potion_name))
+        :pre:                   Input potion_name must be a string.
+        :pre:                   Input tablesize must be a positive integer.
+        :pre:                   Input coefficients must be None, or hold at least len(potion_name) multipliers.
+        """
         # Hashing potion_name
         value = 0
-        a = 31415
-        b = 27183
 
         # For each iteration, value gets multiplied with some pseudo random integer.
         # Each time the hash function is called, it will produce the same i-th integer every time.
         # However, the pseudo randomness encourages uniformity as well as
         #   extreme changes in the hash value for small changes in the key value.
-        for char in potion_name:
-            value = (ord(char) + a * value) % tablesize
-            a = a * b % (tablesize - 1)
+        if coefficients is None:
+            coefficients = Potion.good_hash_coefficients(tablesize, len(potion_name))
+        for a, char_value in zip(coefficients, map(ord, potion_name)):
+            value = (char_value + a * value) % tablesize
         return value
 
+    @staticmethod
+    def good_hash_coefficients(tablesize: int, length: int) -> list[int]:
+        """ The pseudo random multipliers used by good_hash() for the first length characters of a Potion name.
+            These only depend on the tablesize, so a hash table can compute them once and reuse them.
+        :param tablesize:   The size of the hash table which the Potion is added to.
+        :param length:      The number of multipliers needed.
+        :return:            A list of the length first multipliers.
+        :complexity:        O(length)
+        :pre:               Input tablesize must be a positive integer.
+        """
+        a = 31415
+        b = 27183
+        modulus = tablesize - 1
+        coefficients = []
+
+        for _ in range(length):
+            coefficients.append(a)
+            a = a * b % modulus
+        return coefficients
+
     @classmethod
     def bad_hash(cls, potion_name: str, tablesize: int) -> int:
         """ Bad hashing function
@@ -266,6 +300,62 @@ class Potion:
         elif tablesize < 1:
             raise ValueError("".join(["Parameter tablesize must be a positive integer: tablesize = ", str(tablesize)]))
 
+        return cls.bad_hash_unchecked(potion_name, tablesize)
+
+    @staticmethod
+    def bad_hash_unchecked(potion_name: str, tablesize: int) -> int:
+        """ Bad hashing function, without checking its pre conditions.
+            Used by hash tables, which check their own tablesize once instead of on every call.
+        :param potion_name: The Potion name being hashed.
+        :param tablesize:   The size of the hash table which the Potion is added to.
+        :return:            The hash value of the Potion.
+        :complexity:        O(1)
+        :pre:               Input potion_name must be a non-empty string.
+        :pre:               Input tablesize must be a positive integer.
+        """
         # Hashing potion_name (terribly)
         a = 2
         return ord(potion_name[0]) * a % tablesize
+
+    @classmethod
+    def step_hash(cls, potion_name: str, tablesize: int) -> int:
+        """ Second hashing function, used as the probe step of double hashing.
+            It is independent of good_hash() and bad_hash(), and never 0, so that every probe moves to a new position.
+        :param potion_name: The Potion name being hashed.
+        :param tablesize:   The size of the hash table which the Potion is added to.
+        :return:            The probe step of the Potion, in [1, tablesize - 1] (1 when tablesize <= 2).
+        :complexity:        O(IsIns + len(potion_name))
+        :pre:               Input potion_name must be a string.
+        :pre:               Input tablesize must be a positive integer.
+        :raises TypeError:  When potion_name is not a string or tablesize is not an integer.
+        :raises ValueError: When tablesize is non-positive.
+        """
+        # Checking pre condition(s)
+        if not isinstance(potion_name, str):
+            raise TypeError("".join(["Parameter potion_name must be a string: potion_name = ", str(potion_name)]))
+        elif isinstance(tablesize, bool) or not isinstance(tablesize, int):
+            raise TypeError("".join(["Parameter tablesize must be an integer: tablesize = ", str(tablesize)]))
+        elif tablesize < 1:
+            raise ValueError("".join(["Parameter tablesize must be a positive integer: tablesize = ", str(tablesize)]))
+
+        return cls.step_hash_unchecked(potion_name, tablesize)
+
+    @staticmethod
+    def step_hash_unchecked(potion_name: str, tablesize: int) -> int:
+        """ Second hashing function, without checking its pre conditions.
+            Used by hash tables, which check their own tablesize once instead of on every call.
+        :param potion_name: The Potion name being hashed.
+        :param tablesize:   The size of the hash table which the Potion is added to.
+        :return:            The probe step of the Potion, in [1, tablesize - 1] (1 when tablesize <= 2).
+        :complexity:        O(len(potion_name))
+        :pre:               Input potion_name must be a string.
+        :pre:               Input tablesize must be a positive integer.
+        """
+        if tablesize <= 2:
+            return 1
+
+        # Hashing potion_name with a fixed base, modulo tablesize - 1 so that the step is coprime with a prime tablesize
+        value = 0
+        for char_value in map(ord, potion_name):
+            value = (char_value + 131 * value) % (tablesize - 1)
+        return value + 1
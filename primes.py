@@ -2,36 +2,234 @@
 Description:
     This file contains the method largest_prime().
     This method is used to determine the best tablesize in LinearProbePotionTable class, in hash_table.py file.
+    The primes below CACHE_LIMIT are sieved lazily, once, into a module level cache which grows on demand.
+
+    It also contains previous_prime() and next_prime(), which test each candidate with a deterministic
+    Miller-Rabin test instead, so they need no memory proportional to k. These are used for large tables.
 """
 __author__ = 'Benjamin Leong Tjen Ho'
 
-MAX_SIZE = 100000
+from bisect import bisect_left
+
+MAX_SIZE = 2 ** 31
+SEGMENT_SIZE = 100000
+CACHE_LIMIT = 2 ** 20
+MIN_CACHE_SIZE = 1024
+
+# Bases for which the Miller-Rabin test is deterministic, for all n below the bound they are paired with
+MILLER_RABIN_BASES = [(2047, (2,)), (1373653, (2, 3)), (25326001, (2, 3, 5)), (3215031751, (2, 3, 5, 7)),
+                      (2152302898747, (2, 3, 5, 7, 11)), (3474749660383, (2, 3, 5, 7, 11, 13)),
+                      (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+                      (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41))]
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Every prime below _cache_limit, in ascending order
+_prime_cache: list[int] = []
+_cache_limit: int = 0
 
 
 def largest_prime(k: int) -> int:
     """ Method to produce the largest prime number smaller than k
     :param k:           The upper limit where the returning prime number must be lesser than (exclusive).
     :return:            The largest prime number, strictly lesser than k.
-    :complexity:        O(k)
-    :pre:               Input k must be a positive integer larger than 2 and smaller or equal to 100000.
+    :complexity:        O(log P) when k <= CACHE_LIMIT and the primes below k are already cached,
+                            where P is the number of cached primes.
+                        O(SEGMENT_SIZE) otherwise, as only the segment of numbers just below k is sieved.
+                        Growing the cache costs O(k) amortised over the calls.
+    :pre:               Input k must be a positive integer larger than 2 and smaller or equal to MAX_SIZE.
     :raises TypeError:  When input k is not an integer.
-    :raises ValueError: When input k is less than 3 or larger than 100000.
+    :raises ValueError: When input k is less than 3 or larger than MAX_SIZE.
 
     -------------------------------------------------------------------------------------------------
     METHODS CALLED    | COMPLEXITY  |   REMARKS
     ------------------|-------------|----------------------------------------------------------------
     isinstance()      | O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
+    cached_primes()   | O(1)        |   Amortised, as the cache only grows when k passes its limit.
+    bisect_left()     | O(log P)    |   Where P is the number of cached primes.
+    sieve_segment()   | O(S)        |   Where S = SEGMENT_SIZE. Only called when k > CACHE_LIMIT.
     list.__getitem__()| O(1)        |
-    list.__setitem__()| O(1)        |
     ------------------|-------------|----------------------------------------------------------------
     -------------------------------------------------------------------------------------------------
+
+    Note:
+        The largest gap between consecutive primes below 2^31 is less than 300,
+            so the first segment below k almost always contains the answer.
     """
     # Checking pre condition(s)
     if isinstance(k, bool) or not isinstance(k, int):
         raise TypeError("".join(["Input k must be an integer: k = ", str(k)]))
     elif k < 3 or k > MAX_SIZE:
-        raise ValueError("".join(["Input k must be between 3 and 100000 (inclusive): k = ", str(k)]))
+        raise ValueError("".join(["Input k must be between 3 and ", str(MAX_SIZE), " (inclusive): k = ", str(k)]))
+
+    # Small k, the largest prime below k is found by binary searching the cached primes
+    if k <= CACHE_LIMIT:
+        prime_cache = cached_primes(k)
+        return prime_cache[bisect_left(prime_cache, k) - 1]
+
+    # Large k, only the segments just below k are sieved, using the cached primes up to sqrt(k)
+    else:
+        base_primes = cached_primes(int(k ** 0.5) + 2)
+
+        high = k
+        while high > 2:
+            low = max(2, high - SEGMENT_SIZE)
+            segment = sieve_segment(low, high, base_primes)
+            for j in range(high - low - 1, -1, -1):
+                if segment[j]:
+                    return low + j
+            high = low
+
+    raise ValueError("Largest prime smaller than k not found")
+
+
+def is_prime(n: int) -> bool:
+    """ Method to check if n is prime, using trial division by small primes and then a deterministic Miller-Rabin test
+    :param n:           The number to be checked.
+    :return:            True if n is prime, False otherwise.
+    :complexity:        O(log^3 n)
+    :pre:               Input n must be an integer smaller than 3317044064679887385961981.
+    :raises TypeError:  When input n is not an integer.
+    :raises ValueError: When input n is too large for the test to be deterministic.
+
+    -------------------------------------------------------------------------------------------------
+    METHODS CALLED    | COMPLEXITY  |   REMARKS
+    ------------------|-------------|----------------------------------------------------------------
+    isinstance()      | O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
+    pow()             | O(log^3 n)  |   Modular exponentiation of log n bit numbers.
+    ------------------|-------------|----------------------------------------------------------------
+    -------------------------------------------------------------------------------------------------
+    """
+    # Checking pre condition(s)
+    if isinstance(n, bool) or not isinstance(n, int):
+        raise TypeError("".join(["Input n must be an integer: n = ", str(n)]))
+    elif n >= MILLER_RABIN_BASES[-1][0]:
+        raise ValueError("".join(["Input n is too large to be tested deterministically: n = ", str(n)]))
+
+    if n < 2:
+        return False
+
+    # Trial division by the small primes catches most composites quickly
+    for prime in SMALL_PRIMES:
+        if n % prime == 0:
+            return n == prime
+
+    # Writing n - 1 as d * 2^s where d is odd
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
 
+    # Finding the smallest set of bases which is deterministic for n
+    bases = next(bases for bound, bases in MILLER_RABIN_BASES if n < bound)
+
+    # n is composite if any base is a witness to it
+    for base in bases:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def previous_prime(k: int) -> int:
+    """ Method to produce the largest prime number smaller than k, without sieving
+    :param k:           The upper limit where the returning prime number must be lesser than (exclusive).
+    :return:            The largest prime number, strictly lesser than k.
+    :complexity:        O(G log^3 k), where G is the gap between k and the prime returned.
+    :pre:               Input k must be an integer larger than 2.
+    :raises TypeError:  When input k is not an integer.
+    :raises ValueError: When input k is less than 3.
+
+    -------------------------------------------------------------------------------------------------
+    METHODS CALLED    | COMPLEXITY  |   REMARKS
+    ------------------|-------------|----------------------------------------------------------------
+    isinstance()      | O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
+    is_prime()        | O(log^3 k)  |
+    ------------------|-------------|----------------------------------------------------------------
+    -------------------------------------------------------------------------------------------------
+    """
+    # Checking pre condition(s)
+    if isinstance(k, bool) or not isinstance(k, int):
+        raise TypeError("".join(["Input k must be an integer: k = ", str(k)]))
+    elif k < 3:
+        raise ValueError("".join(["Input k must be larger than 2: k = ", str(k)]))
+
+    if k == 3:
+        return 2
+
+    # Stepping down from k through the odd numbers only
+    candidate = k - 1 if k % 2 == 0 else k - 2
+    while not is_prime(candidate):
+        candidate -= 2
+    return candidate
+
+
+def next_prime(k: int) -> int:
+    """ Method to produce the smallest prime number larger than k, without sieving
+    :param k:           The lower limit where the returning prime number must be greater than (exclusive).
+    :return:            The smallest prime number, strictly greater than k.
+    :complexity:        O(G log^3 k), where G is the gap between k and the prime returned.
+    :pre:               Input k must be an integer.
+    :raises TypeError:  When input k is not an integer.
+
+    -------------------------------------------------------------------------------------------------
+    METHODS CALLED    | COMPLEXITY  |   REMARKS
+    ------------------|-------------|----------------------------------------------------------------
+    isinstance()      | O(IsIns)    |   Unknown complexity for built-in function. Assumed to be O(1).
+    is_prime()        | O(log^3 k)  |
+    ------------------|-------------|----------------------------------------------------------------
+    -------------------------------------------------------------------------------------------------
+    """
+    # Checking pre condition(s)
+    if isinstance(k, bool) or not isinstance(k, int):
+        raise TypeError("".join(["Input k must be an integer: k = ", str(k)]))
+
+    if k < 2:
+        return 2
+
+    # Stepping up from k through the odd numbers only
+    candidate = k + 1 if k % 2 == 0 else k + 2
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
+
+
+def cached_primes(k: int) -> list[int]:
+    """ Accessor for the module level cache of primes, which is grown to hold every prime below k first.
+    :param k:       The upper limit (exclusive) that the cache must cover. Must be at most CACHE_LIMIT.
+    :return:        The cached list of primes, in ascending order. It must not be modified by the caller.
+    :complexity:    O(1) when the cache already covers k.
+                    O(L) otherwise, where L is the new limit of the cache, which is at least double the old one.
+    """
+    global _cache_limit
+
+    if k > _cache_limit:
+        new_limit = min(max(k, 2 * _cache_limit, MIN_CACHE_SIZE), CACHE_LIMIT)
+
+        # The cached primes are enough to sieve the next segment, if they go past sqrt(new_limit)
+        if _cache_limit * _cache_limit >= new_limit:
+            segment = sieve_segment(_cache_limit, new_limit, _prime_cache)
+            _prime_cache.extend(_cache_limit + i for i in range(len(segment)) if segment[i])
+        else:
+            prime_list = sieve(new_limit)
+            _prime_cache[:] = [i for i in range(new_limit) if prime_list[i]]
+        _cache_limit = new_limit
+
+    return _prime_cache
+
+
+def sieve(k: int) -> list[bool]:
+    """ Sieve of Eratosthenes over the numbers 0 to k-1
+    :param k:       The number of elements of the returning list.
+    :return:        A list of k elements, True at index i if i is prime, False otherwise.
+    :complexity:    O(k log log k)
+    """
     # Creating a list of k elements representing numbers 0 to k-1
     # True if the index is prime, False otherwise
     prime_list = [True] * k  # 0 to k exclusive
@@ -40,23 +238,33 @@ def largest_prime(k: int) -> int:
     prime_list[0] = prime_list[1] = False
 
     # Looping through the elements of the list until the square root of k
-    for i in range(2, int(k ** 0.5 // 1)):
-        num = i ** 2
-        # Going through all multiples of i
-        # starting from it's square until it reaches k
+    # and crossing out all multiples of i starting from it's square until it reaches k
+    for i in range(2, int(k ** 0.5) + 1):
         if prime_list[i]:
-            while num < k:
-                prime_list[num] = False
-                num += i
+            prime_list[i * i::i] = [False] * len(range(i * i, k, i))
 
-    # Finding the largest prime smaller than k
-    # This is done by traversing the list from the end to the start
-    #   and then returning the first index found where the element is True.
-    for j in range(k - 1, -1, -1):
-        if prime_list[j]:
-            return j
+    return prime_list
 
-    raise ValueError("Largest prime smaller than k not found")
+
+def sieve_segment(low: int, high: int, base_primes: list[int]) -> list[bool]:
+    """ Sieve of Eratosthenes over the numbers low to high-1
+    :param low:         The smallest number of the segment (inclusive). Must be at least 2.
+    :param high:        The largest number of the segment (exclusive).
+    :param base_primes: Every prime up to sqrt(high), in ascending order.
+    :return:            A list of (high - low) elements, True at index i if low + i is prime, False otherwise.
+    :complexity:        O((high - low) log log high + len(base_primes))
+    """
+    segment = [True] * (high - low)
+
+    for prime in base_primes:
+        if prime * prime >= high:
+            break
+
+        # Crossing out the multiples of prime inside the segment, but never prime itself
+        start = max(prime * prime, (low + prime - 1) // prime * prime)
+        segment[start - low::prime] = [False] * len(range(start, high, prime))
+
+    return segment
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+import unittest
+
+from array_avl import ArrayAVLTree
+from tester_base import TesterBase
+
+
+class TestArrayAVL(TesterBase):
+
+    def check(self, tree, index):
+        # Returns the height and size of the subtree of index, checking its height, size and balance
+        if index == ArrayAVLTree.NIL:
+            return -1, 0
+        left_height, left_size = self.check(tree, tree.lefts[index])
+        right_height, right_size = self.check(tree, tree.rights[index])
+        self.assertEqual((tree.heights[index], tree.sizes[index]),
+                         (max(left_height, right_height) + 1, left_size + right_size + 1))
+        self.assertLessEqual(abs(right_height - left_height), 1)
+        return tree.heights[index], tree.sizes[index]
+
+    def test_updates(self):
+        """ Testing __setitem__(), __delitem__(), __getitem__() and iteration against a dictionary.
+        Test 1: Heights and sizes stay correct through inserts and deletes, and the keys are iterated in order.
+        Test 2: Inserting a duplicate or deleting a missing key raises a ValueError and leaves the tree unchanged.
+        Test 3: Getting a missing key raises a KeyError.
+        """
+        # Test 1
+        tree = ArrayAVLTree()
+        expected = {}
+        keys = [float((i * 7919) % 3000) for i in range(3000)]
+        for key in keys:
+            tree[key] = str(key)
+            expected[key] = str(key)
+        for key in keys[::3]:
+            del tree[key]
+            del expected[key]
+        self.assertEqual(self.check(tree, tree.root)[1], len(tree))
+        self.assertEqual(len(tree), len(expected))
+        self.assertEqual(list(tree), sorted(expected))
+        self.assertTrue(all(tree[key] == item for key, item in expected.items()))
+        self.assertFalse(keys[0] in tree)
+
+        # Test 2
+        state = (tree.root, len(tree), list(tree))
+        self.assertRaises(ValueError, tree.__setitem__, keys[1], "again")
+        self.assertRaises(ValueError, tree.__delitem__, keys[0])
+        self.assertEqual((tree.root, len(tree), list(tree)), state)
+
+        # Test 3
+        self.assertRaises(KeyError, tree.__getitem__, keys[0])
+        self.assertRaises(KeyError, ArrayAVLTree().__getitem__, 1.0)
+
+    def test_free_list(self):
+        """ Testing that the slots of deleted nodes are reused by later inserts, and that clear() empties the pool.
+        The pool holds one slot more than the nodes of the tree, for the NIL sentinel.
+        An insert which fails on a key which is not a float leaves its slot in the free list.
+        """
+        tree = ArrayAVLTree()
+        for key in range(100):
+            tree[key] = key
+        for key in range(0, 100, 2):
+            del tree[key]
+        self.assertEqual(len(tree.keys), 101)
+        for key in range(100, 150):
+            tree[key] = key
+        self.assertEqual((len(tree.keys), tree.free), (101, ArrayAVLTree.NIL))
+        self.assertEqual(list(tree), list(range(1, 100, 2)) + list(range(100, 150)))
+        self.assertEqual(self.check(tree, tree.root)[1], 100)
+
+        # A key which is not a float raises without taking a slot from the free list
+        del tree[1]
+        free = tree.free
+        self.assertRaises(OverflowError, tree.__setitem__, 10 ** 400, "a")
+        self.assertEqual((tree.free, len(tree)), (free, 99))
+        tree[1.5] = 1.5
+        self.assertEqual((len(tree.keys), tree.free, tree[1.5]), (101, ArrayAVLTree.NIL, 1.5))
+
+        tree.clear()
+        self.assertTrue(tree.is_empty())
+        self.assertEqual((len(tree), len(tree.keys), list(tree)), (0, 1, []))
+
+    def test_kth_largest(self):
+        """ Testing kth_largest() method.
+        Test 1: The kth largest key and item are returned, for every k.
+        Test 2: A k which is not a positive integer, or larger than the number of nodes, raises an error.
+        """
+        # Test 1
+        tree = ArrayAVLTree()
+        for key in [15, 10, 20, 17, 5, 3, 4, 22]:
+            tree[key] = str(key)
+        for k, key in enumerate([22, 20, 17, 15, 10, 5, 4, 3], 1):
+            node = tree.kth_largest(k)
+            self.assertEqual((node.key, node.item), (key, str(key)))
+
+        # Test 2
+        self.assertRaises(TypeError, tree.kth_largest, 1.0)
+        self.assertRaises(TypeError, tree.kth_largest, True)
+        self.assertRaises(ValueError, tree.kth_largest, 0)
+        self.assertRaises(ValueError, tree.kth_largest, 9)
+        self.assertRaises(ValueError, ArrayAVLTree().kth_largest, 1)
+
+    def test_order_statistics(self):
+        """ Testing kth_smallest(), select(), rank() and count_range() methods against a sorted list. """
+        tree = ArrayAVLTree()
+        keys = [float((i * 7919) % 1000) for i in range(1000)]
+        for key in keys:
+            tree[key] = key
+        for key in keys[::4]:
+            del tree[key]
+        expected = sorted(set(keys) - set(keys[::4]))
+        for index in range(0, len(expected), 7):
+            key = expected[index]
+            self.assertEqual(tree.kth_smallest(index + 1).key, key)
+            self.assertEqual(tree.select(index), (key, key))
+            self.assertEqual(tree.rank(key), index)
+        for low, high in [(-5, 3000), (100, 200), (100.5, 200.5), (1, 1), (300, 200)]:
+            self.assertEqual(tree.count_range(low, high), len([key for key in expected if low <= key <= high]))
+        self.assertRaises(ValueError, tree.kth_smallest, len(tree) + 1)
+        self.assertRaises(IndexError, tree.select, len(tree))
+
+    def test_from_sorted(self):
+        """ Testing from_sorted() and bulk_load() methods, which fill the pool in order and empty the free list.
+        A bulk_load() which fails, on a duplicate key or a key which is not a float, leaves the tree unchanged.
+        """
+        tree = ArrayAVLTree.from_sorted([(float(key), key) for key in range(99, -1, -2)])
+        del tree[1.0]
+        tree.bulk_load([(float(key), key) for key in range(0, 100, 2)])
+        self.assertEqual(self.check(tree, tree.root), (6, 99))
+        self.assertEqual((list(tree.keys[1:]), tree.free), ([key for key in tree], ArrayAVLTree.NIL))
+        self.assertEqual([tree[key] for key in tree], [0] + list(range(2, 100)))
+
+        self.assertRaises(ValueError, ArrayAVLTree.from_sorted, [(1.0, "a"), (1.0, "b")])
+        self.assertRaises(ValueError, tree.bulk_load, [(200.0, "a"), (3.0, "b")])
+        self.assertEqual(len(tree), 99)
+        self.assertFalse(200.0 in tree)
+
+        self.assertRaises(OverflowError, tree.bulk_load, [(10 ** 400, "a")])
+        self.assertRaises(TypeError, tree.bulk_load, [("a", "a")])
+        self.assertEqual((len(tree), list(tree)), (99, [float(key) for key in [0] + list(range(2, 100))]))
+        self.assertEqual(self.check(tree, tree.root), (6, 99))
+
+    def test_copy(self):
+        """ Testing that copy() returns a snapshot, which is not changed by later updates of the tree. """
+        tree = ArrayAVLTree()
+        for key in range(10):
+            tree[key] = key
+        snapshot = tree.copy()
+        del tree[5]
+        tree[20] = 20
+        self.assertEqual(list(snapshot), list(range(10)))
+        self.assertEqual(snapshot.kth_largest(1).key, 9)
+        self.assertEqual(list(tree), [0, 1, 2, 3, 4, 6, 7, 8, 9, 20])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from bisect import bisect_left
 
 from avl import AVLTree
 from node import AVLTreeNode
@@ -340,6 +341,127 @@ class TestAVL(TesterBase):
             except AssertionError as e:
                 self.verificationErrors.append(str(e))
 
+    def test_iterative_updates(self):
+        """ Testing the iterative insert_aux(), delete_aux() and kth_largest_aux() methods.
+        Test 1: Heights and right counts stay correct through inserts and deletes of a large tree.
+        Test 2: Inserting a duplicate or deleting a missing key raises a ValueError and leaves the tree unchanged.
+        Test 3: A k larger than the number of nodes raises a ValueError.
+        """
+        def check(node):
+            # Returns the height and size of the subtree of node, checking its height, right count and balance
+            if node is None:
+                return -1, 0
+            left_height, left_size = check(node.left)
+            right_height, right_size = check(node.right)
+            self.assertEqual((node.height, node.right_count), (max(left_height, right_height) + 1, right_size))
+            self.assertLessEqual(abs(right_height - left_height), 1)
+            return node.height, left_size + right_size + 1
+
+        # Test 1
+        tree = AVLTree()
+        keys = [(i * 7919) % 5000 for i in range(5000)]
+        for key in keys:
+            tree[key] = str(key)
+        for key in keys[::3]:
+            del tree[key]
+        remaining = sorted(set(keys) - set(keys[::3]), reverse=True)
+        self.assertEqual(check(tree.root)[1], len(tree))
+        self.assertEqual([tree.kth_largest(k).key for k in range(1, len(tree) + 1)], remaining)
+
+        # Test 2
+        heights = (tree.root.height, tree.root.right_count, len(tree))
+        self.assertRaises(ValueError, tree.__setitem__, remaining[0], "again")
+        self.assertRaises(ValueError, tree.__delitem__, keys[0])
+        self.assertEqual((tree.root.height, tree.root.right_count, len(tree)), heights)
+        self.assertEqual(check(tree.root)[1], len(tree))
+
+        # Test 3
+        self.assertRaises(ValueError, tree.kth_largest, len(tree) + 1)
+        self.assertRaises(ValueError, AVLTree().kth_largest, 1)
+
+    def test_order_statistics(self):
+        """ Testing kth_smallest(), select(), rank() and count_range() methods against a sorted list.
+        Test 1: Every node keeps the size of its subtree through inserts and deletes.
+        Test 2: The order statistics match those of the sorted keys, for keys in the tree and between them.
+        Test 3: Invalid k and index values raise errors.
+        """
+        def check(node):
+            # Returns the size of the subtree of node, checking the size of each node
+            if node is None:
+                return 0
+            size = check(node.left) + check(node.right) + 1
+            self.assertEqual(node.size, size)
+            return size
+
+        # Test 1
+        tree = AVLTree()
+        keys = [(i * 7919) % 2000 for i in range(2000)]
+        for key in keys:
+            tree[key] = str(key)
+        for key in keys[::4]:
+            del tree[key]
+        expected = sorted(set(keys) - set(keys[::4]))
+        self.assertEqual(check(tree.root), len(expected))
+
+        # Test 2
+        for index in range(0, len(expected), 7):
+            key = expected[index]
+            self.assertEqual(tree.kth_smallest(index + 1).key, key)
+            self.assertEqual(tree.select(index), (key, str(key)))
+            self.assertEqual(tree.rank(key), index)
+            self.assertEqual(tree.rank(key + 0.5), bisect_left(expected, key + 0.5))
+        for low, high in [(-5, 3000), (100, 200), (100.5, 200.5), (0, 0), (1, 1), (300, 200)]:
+            self.assertEqual(tree.count_range(low, high), len([key for key in expected if low <= key <= high]))
+        self.assertEqual(AVLTree().count_range(0, 10), 0)
+
+        # Test 3
+        self.assertRaises(TypeError, tree.kth_smallest, 1.0)
+        self.assertRaises(ValueError, tree.kth_smallest, 0)
+        self.assertRaises(ValueError, tree.kth_smallest, len(tree) + 1)
+        self.assertRaises(TypeError, tree.select, True)
+        self.assertRaises(IndexError, tree.select, -1)
+        self.assertRaises(IndexError, tree.select, len(tree))
+
+    def test_from_sorted(self):
+        """ Testing from_sorted() and bulk_load() methods.
+        Test 1: The tree built is perfectly balanced, with correct heights, right counts and sizes.
+        Test 2: Unsorted pairs are sorted first, and pairs loaded into a tree are merged with its nodes.
+        Test 3: Duplicate keys raise a ValueError and leave the tree unchanged.
+        """
+        def check(node):
+            # Returns the height and size of the subtree of node, checking its height, right count and size
+            if node is None:
+                return -1, 0
+            left_height, left_size = check(node.left)
+            right_height, right_size = check(node.right)
+            self.assertEqual((node.height, node.right_count, node.size),
+                             (max(left_height, right_height) + 1, right_size, left_size + right_size + 1))
+            self.assertLessEqual(abs(right_height - left_height), 1)
+            return node.height, node.size
+
+        # Test 1
+        tree = AVLTree.from_sorted([(key, str(key)) for key in range(1000)])
+        self.assertEqual(check(tree.root), (9, 1000))
+        self.assertEqual((len(tree), list(tree), tree[500]), (1000, list(range(1000)), "500"))
+        self.assertEqual(tree.kth_largest(1).key, 999)
+        self.assertTrue(AVLTree.from_sorted([]).is_empty())
+
+        # Test 2
+        tree = AVLTree.from_sorted([(key, str(key)) for key in range(99, -1, -2)])
+        tree[0] = "0"
+        tree.bulk_load([(key, str(key)) for key in range(2, 100, 2)])
+        self.assertEqual(check(tree.root)[1], 100)
+        self.assertEqual([tree[key] for key in tree], [str(key) for key in range(100)])
+        tree[100] = "100"
+        del tree[50]
+        self.assertEqual(check(tree.root)[1], 100)
+
+        # Test 3
+        self.assertRaises(ValueError, AVLTree.from_sorted, [(1, "a"), (2, "b"), (1, "c")])
+        self.assertRaises(ValueError, tree.bulk_load, [(200, "a"), (100, "b")])
+        self.assertEqual((len(tree), tree[100]), (100, "100"))
+        self.assertFalse(200 in tree)
+
     # Not included in submission
     # def test_delete(self):
     #     t = AVLTree()
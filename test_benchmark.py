@@ -0,0 +1,61 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+
+from benchmark import benchmark, hash_counts, load_corpus, main, standard_deviation
+from hash_table import LinearProbePotionTable
+from tester_base import TesterBase
+
+
+class TestBenchmark(TesterBase):
+
+    def test_benchmark(self):
+        """ Testing benchmark() function.
+        Test 1: The statistics are those of a table built from the same keys, before the lookups.
+        Test 2: A custom hash function is used by the table and for the distribution.
+        Test 3: Invalid table types and empty corpora raise a ValueError.
+        """
+        keys = ["Potion of " + str(i) for i in range(200)]
+
+        # Test 1
+        results = benchmark(keys, False, "quadratic", 401)
+        table = LinearProbePotionTable(len(keys), False, 401, 1.0, 0, "quadratic")
+        for key in keys:
+            table[key] = key
+        stats = ["conflict_count", "probe_total", "probe_max", "rehash_count"]
+        self.assertEqual(tuple(results[stat] for stat in stats), table.statistics())
+        self.assertEqual((results["table_size"], results["hash"], results["corpus_size"]), (401, "bad", 200))
+        self.assertGreater(results["inserts_per_second"], 0)
+        self.assertGreater(results["lookups_per_second"], 0)
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+        # Test 2: every key hashed to position 0 gives a single cluster of 200 keys
+        results = benchmark(keys, tablesize_override=401, hash_function=lambda key, tablesize: 0)
+        self.assertEqual((results["hash"], results["probe_max"], results["distribution_range"]), ("custom", 199, 200))
+        self.assertAlmostEqual(results["distribution_sd"], standard_deviation([200] + [0] * 400))
+
+        # Test 3
+        self.assertRaises(ValueError, benchmark, keys, table_type="unknown")
+        self.assertRaises(ValueError, benchmark, [])
+
+    def test_hash_counts(self):
+        """ Testing hash_counts() and standard_deviation() functions. """
+        counts = hash_counts(["a", "b", "ab", "c"], lambda key, tablesize: len(key) % tablesize, 3)
+        self.assertEqual(counts, [0, 3, 1])
+        self.assertAlmostEqual(standard_deviation(counts), (14 / 9) ** 0.5)
+        self.assertEqual(standard_deviation([2, 2, 2]), 0)
+
+    def test_main(self):
+        """ Testing main() function, which prints the results of a benchmark on a corpus as JSON. """
+        output = io.StringIO()
+        with redirect_stdout(output):
+            results = main(["--corpus", "words.txt", "--hash", "bad", "--probe-strategy", "double",
+                            "--max-load-factor", "0.5", "--table-type", "compact"])
+        self.assertEqual(json.loads(output.getvalue()), results)
+        self.assertEqual(results["corpus_size"], len(load_corpus("words.txt")))
+        self.assertLessEqual(results["load_factor"], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
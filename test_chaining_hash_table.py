@@ -0,0 +1,60 @@
+import unittest
+
+from chaining_hash_table import ChainingPotionTable
+from tester_base import TesterBase
+
+
+class TestChainingTable(TesterBase):
+
+    def test_buckets(self):
+        """ Testing the buckets of a ChainingPotionTable.
+        Test 1: Colliding keys share a bucket, and the statistics count the pairs passed over.
+        Test 2: Deleting a key removes it from its bucket without disturbing the others.
+        """
+        lookup = {"s1": 5, "s2": 5, "s3": 5, "s4": 7}
+        saved = ChainingPotionTable.hash
+        ChainingPotionTable.hash = lambda self, k: lookup.get(k, 5)
+        try:
+            table = ChainingPotionTable(10, True, 10)
+            for key in lookup:
+                table[key] = key
+
+            # Test 1
+            self.assertEqual((len(table.table[5]), len(table.table[7]), len(table)), (3, 1, 4))
+            self.assertEqual((table["s3"], table.get("s5", -1), "s5" in table), ("s3", -1, False))
+            self.assertEqual(table.statistics(), (2, 3 + 2 + 3 + 3, 2, 0))
+
+            # Test 2
+            del table["s1"]
+            self.assertEqual((table["s2"], table["s3"], len(table), len(table.table[5])), ("s2", "s3", 3, 2))
+            self.assertRaises(KeyError, table.__delitem__, "s1")
+            del table["s4"]
+            self.assertIsNone(table.table[7])
+        finally:
+            ChainingPotionTable.hash = saved
+
+    def test_load_factor(self):
+        """ Testing the resizing of a ChainingPotionTable.
+        Test 1: The table grows once the load factor passes max_load_factor, which may be larger than 1.
+        Test 2: A table is never full, its buckets grow longer instead.
+        """
+        # Test 1
+        table = ChainingPotionTable(5, True, -1, 3)
+        for i in range(200):
+            table[str(i)] = i
+            self.assertLessEqual(len(table), 3 * len(table.table))
+        self.assertEqual([table[str(i)] for i in range(200)], list(range(200)))
+        self.assertGreater(table.statistics()[3], 0)
+        self.assertRaises(ValueError, ChainingPotionTable, 5, True, -1, 0)
+
+        # Test 2
+        table = ChainingPotionTable(1, True, 2, 100)
+        for i in range(50):
+            table[str(i)] = i
+        self.assertEqual((len(table.table), len(table), table.is_full()), (2, 50, False))
+        self.assertEqual([table[str(i)] for i in range(50)], list(range(50)))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestChainingTable)
+    unittest.TextTestRunner(verbosity=0).run(suite)
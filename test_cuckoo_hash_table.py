@@ -0,0 +1,69 @@
+import unittest
+
+from cuckoo_hash_table import CuckooPotionTable
+from tester_base import TesterBase
+
+
+class TestCuckooTable(TesterBase):
+
+    def test_evictions(self):
+        """ Testing the two positions of the keys of a CuckooPotionTable.
+        Test 1: A key whose first position is taken goes to its second position.
+        Test 2: A key whose positions are both taken evicts a key to its other position.
+        Test 3: A lookup makes at most one probe past the first position.
+        """
+        first, second = {"a": 1, "b": 1, "c": 3}, {"a": 2, "b": 3, "c": 1}
+        saved_hash, saved_second_hash = CuckooPotionTable.hash, CuckooPotionTable.second_hash
+        CuckooPotionTable.hash = lambda self, k: first.get(k, 0)
+        CuckooPotionTable.second_hash = lambda self, k: second.get(k, 0)
+        try:
+            table = CuckooPotionTable(10, True, 10)
+
+            # Test 1
+            table["a"], table["b"] = "a", "b"
+            self.assertEqual((table.table[1], table.table[3]), (("a", "a"), ("b", "b")))
+
+            # Test 2: c evicts a from position 1, which moves to its second position 2
+            table["c"] = "c"
+            self.assertEqual([table.table[i] and table.table[i][0] for i in range(1, 4)], ["c", "a", "b"])
+            self.assertEqual(table.statistics(), (2, 6, 2, 0))
+
+            # Test 3
+            self.assertEqual((table["a"], table.get("d", -1), "d" in table), ("a", -1, False))
+            self.assertEqual(table.statistics()[1], 9)
+
+            del table["c"]
+            self.assertEqual((len(table), table.table[1], table.get("c")), (2, None, None))
+        finally:
+            CuckooPotionTable.hash, CuckooPotionTable.second_hash = saved_hash, saved_second_hash
+
+    def test_rebuild(self):
+        """ Testing the rebuilds of a CuckooPotionTable.
+        Test 1: An insert whose evictions do not end rebuilds the table with a new seed.
+        Test 2: Every key can still be found after the table has been rebuilt or resized.
+        """
+        # Test 1: three keys cannot share the same two positions, until the seed changes
+        saved_hash, saved_second_hash = CuckooPotionTable.hash, CuckooPotionTable.second_hash
+        CuckooPotionTable.hash = lambda self, k: 0
+        CuckooPotionTable.second_hash = lambda self, k: 1 if self.seed == 0 else ord(k)
+        try:
+            table = CuckooPotionTable(3, True, 101)
+            for i in range(3):
+                table[str(i)] = i
+            self.assertEqual(([table[str(i)] for i in range(3)], len(table)), ([0, 1, 2], 3))
+            self.assertGreater(table.seed, 0)
+            self.assertEqual(table.statistics()[3], 1)
+        finally:
+            CuckooPotionTable.hash, CuckooPotionTable.second_hash = saved_hash, saved_second_hash
+
+        # Test 2
+        table = CuckooPotionTable(5, True, -1, 0.5)
+        for i in range(300):
+            table["Potion " + str(i)] = i
+        self.assertEqual([table["Potion " + str(i)] for i in range(300)], list(range(300)))
+        self.assertGreater(table.statistics()[3], 0)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCuckooTable)
+    unittest.TextTestRunner(verbosity=0).run(suite)
@@ -1,6 +1,11 @@
 import unittest
 
-from game import Game
+from array_avl import ArrayAVLTree
+from chaining_hash_table import ChainingPotionTable
+from cuckoo_hash_table import CuckooPotionTable
+from game import Game, np
+from hash_table import CompactLinearProbePotionTable, RobinHoodPotionTable
+from perfect_hash_table import PerfectHashPotionTable
 from tester_base import TesterBase
 
 
@@ -64,6 +69,157 @@ class TestGame(TesterBase):
         self.assertEqual(results, [37.5, 90, 142.5])
 
 
+    def test_solve_game(self):
+        """ Testing solve_game() method, which answers each day with a bisect over the cumulative costs.
+        Test 1: Potions are bought in order of yield, the last one partially, at the boundaries between potions too.
+        Test 2: With no profitable potions, the money of each day is kept as it is.
+        """
+        # Test 1
+        G = Game()
+        G.set_total_potion_data([
+            ['Health', 'Potion of Health Regeneration', 20],
+            ['Buff', 'Potion of Extreme Speed', 10],
+            ['Health', 'Potion of Instant Health', 5],
+            ['Buff', 'Potion of Increased Stamina', 25],
+        ])
+        G.add_potions_to_inventory([
+            ("Potion of Health Regeneration", 4),
+            ("Potion of Extreme Speed", 5),
+            ("Potion of Instant Health", 3),
+            ("Potion of Increased Stamina", 10),
+        ])
+        full_vendor_info = [
+            ("Potion of Health Regeneration", 30),
+            ("Potion of Extreme Speed", 15),
+            ("Potion of Instant Health", 15),
+            ("Potion of Increased Stamina", 20),
+        ]
+        # Instant Health costs 15 in total, Extreme Speed 50 and Health Regeneration 80; Increased Stamina is a loss
+        results = G.solve_game(full_vendor_info, [0, 15, 40, 65, 145, 1000])
+        self.assertEqual(results, [0, 45, 82.5, 120, 240, 1095])
+
+        # Test 2
+        self.assertEqual(G.solve_game([], [0, 12.5]), [0, 12.5])
+        self.assertEqual(G.solve_game([("Potion of Increased Stamina", 20)], [50]), [50])
+
+    def test_solve_game_batch(self):
+        G = Game()
+        G.set_total_potion_data([
+            ['Health', 'Potion of Health Regeneration', 20],
+            ['Buff', 'Potion of Extreme Speed', 10],
+            ['Damage', 'Potion of Deadly Poison', 45],
+            ['Health', 'Potion of Instant Health', 5],
+            ['Buff', 'Potion of Increased Stamina', 25],
+            ['Damage', 'Potion of Untenable Odour', 1]
+        ])
+        G.add_potions_to_inventory([
+            ("Potion of Health Regeneration", 4),
+            ("Potion of Extreme Speed", 5),
+            ("Potion of Instant Health", 3),
+            ("Potion of Increased Stamina", 10),
+            ("Potion of Untenable Odour", 5),
+        ])
+        full_vendor_info = [
+            ("Potion of Health Regeneration", 30),
+            ("Potion of Extreme Speed", 15),
+            ("Potion of Instant Health", 15),
+            ("Potion of Increased Stamina", 20),
+        ]
+
+        # Batch mode sorts the starting money internally but answers in the original order
+        starting_money = [80, 0, 12.5, 1000, 45]
+        results = G.solve_game(full_vendor_info, starting_money, batch=True)
+        self.assertEqual(results, G.solve_game(full_vendor_info, starting_money))
+        self.assertEqual(results[:3], [142.5, 0, 37.5])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_solve_game_numpy(self):
+        G = Game()
+        G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 101)])
+        G.add_potions_to_inventory([(str(x), x % 7) for x in range(1, 101)])
+        full_vendor_info = [(str(x), x * (1 + x % 5) / 3) for x in range(1, 101, 2)]
+        starting_money = [-1, 0, 0.5, 37.5, 1200, 5000.25, 10 ** 6]
+
+        expected = G.solve_game(full_vendor_info, starting_money)
+        results = G.solve_game(full_vendor_info, starting_money, use_numpy=True)
+        self.assertEqual(len(results), len(expected))
+        for result, output in zip(results, expected):
+            self.assertAlmostEqual(result, output, places=6)
+
+    def test_solve_game_duplicate_names(self):
+        G = Game()
+        G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 11)])
+        G.add_potions_to_inventory([(str(x), x) for x in range(1, 11)])
+
+        # A potion valued twice raises a ValueError in every mode, whether it is profitable or not
+        for full_vendor_info in [[("2", 5), ("3", 9), ("2", 7)], [("2", 1), ("3", 9), ("2", 1)]]:
+            for batch, use_numpy in [(False, False), (True, False), (False, True)]:
+                self.assertRaises(ValueError, G.solve_game, full_vendor_info, [10, 100], batch, use_numpy)
+            if np is not None:
+                self.assertRaises(ValueError, G.solve_game_numpy, full_vendor_info, [10, 100])
+
+    def test_set_read_table_type(self):
+        G = Game()
+        G.set_read_table(10, table_type="robin_hood")
+        self.assertIsInstance(G.read_table, RobinHoodPotionTable)
+
+        # The table type is kept when the potion data replaces the table
+        G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 21)])
+        self.assertIsInstance(G.read_table, RobinHoodPotionTable)
+        G.add_potions_to_inventory([(str(x), x) for x in range(1, 21)])
+        full_vendor_info = [(str(x), 2 * x) for x in range(1, 21, 3)]
+        self.assertEqual(G.solve_game(full_vendor_info, [30, 500]), [60, 1000])
+
+        G.set_read_table(10, True, -1, 2.5, "chaining")
+        self.assertIsInstance(G.read_table, ChainingPotionTable)
+        G.set_read_table(10, table_type="cuckoo")
+        self.assertIsInstance(G.read_table, CuckooPotionTable)
+        G.set_read_table(10, table_type="compact")
+        self.assertIsInstance(G.read_table, CompactLinearProbePotionTable)
+        self.assertRaises(ValueError, G.set_read_table, 10, table_type="unknown")
+        self.assertRaises(TypeError, G.set_read_table, 10, table_type=1)
+
+    def test_set_total_potion_data_frozen(self):
+        G = Game()
+        G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 21)], frozen=True)
+        self.assertIsInstance(G.read_table, PerfectHashPotionTable)
+        self.assertEqual(len(G.read_table.table), 20)
+        G.add_potions_to_inventory([(str(x), x) for x in range(1, 21)])
+        full_vendor_info = [(str(x), 2 * x) for x in range(1, 21, 3)]
+        self.assertEqual(G.solve_game(full_vendor_info, [30, 500]), [60, 1000])
+
+    def test_compact_inventory(self):
+        games = [Game(seed=7), Game(seed=7, compact_inventory=True)]
+        self.assertIsInstance(games[1].inventory, ArrayAVLTree)
+        for G in games:
+            G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 101)])
+            G.add_potions_to_inventory([(str(x), x) for x in range(2, 101)])
+
+        # The vendors choose the same potions from either inventory, which is left unchanged
+        for num_vendors in [1, 50, 99]:
+            self.assertEqual(games[0].choose_potions_for_vendors(num_vendors),
+                             games[1].choose_potions_for_vendors(num_vendors))
+        self.assertEqual(list(games[1].inventory), [float(x) for x in range(2, 101)])
+        self.assertRaises(TypeError, Game, 0, 1)
+
+    def test_add_potions_to_inventory_bulk(self):
+        for compact_inventory in [False, True]:
+            G = Game(compact_inventory=compact_inventory)
+            G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 101)])
+
+            # The first potions are bulk loaded, the last ones are inserted into the larger inventory
+            G.add_potions_to_inventory([(str(x), x) for x in range(100, 1, -2)])
+            G.add_potions_to_inventory([(str(x), x) for x in range(1, 40, 2)])
+            G.add_potions_to_inventory([(str(x), x) for x in range(41, 100, 2)])
+            self.assertEqual(list(G.inventory), list(range(1, 101)))
+            self.assertEqual(G.inventory.kth_largest(1).item, ("100", 100))
+
+            # A duplicate buy_price raises a ValueError, before any quantity is changed
+            G = Game(compact_inventory=compact_inventory)
+            G.set_total_potion_data([(str(x), str(x), x) for x in range(1, 11)])
+            self.assertRaises(ValueError, G.add_potions_to_inventory, [("1", 5), ("2", 5), ("1", 6)])
+            self.assertEqual((len(G.inventory), G.read_table["1"].get_quantity()), (0, 0))
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestGame)
     unittest.TextTestRunner(verbosity=0).run(suite)
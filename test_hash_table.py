@@ -1,6 +1,7 @@
 import unittest
 
-from hash_table import LinearProbePotionTable
+from hash_table import CompactLinearProbePotionTable, LinearProbePotionTable, RobinHoodPotionTable
+from potion import Potion
 from tester_base import TesterBase
 
 
@@ -109,6 +110,18 @@ class TestTable(TesterBase):
             except AssertionError as e:
                 self.verificationErrors.append(str(e))
 
+    def test_get(self):
+        """ Testing get() method.
+        Test 1: Present keys return their item.
+        Test 2: Missing keys return the default instead of raising, including in a full table.
+        """
+        table = LinearProbePotionTable(1, True, 2)
+        table.insert("0", 0)
+        self.assertEqual((table.get("0"), table.get("1"), table.get("1", -1)), (0, None, -1))
+        table.insert("1", 1)
+        self.assertTrue(table.is_full())
+        self.assertEqual((table.get("1"), table.get("2", -1), "2" in table), (1, -1, False))
+
     def test___getitem__(self):
         """ Testing __getitem__() method.
         Test 1: Testing valid keys.
@@ -146,6 +159,39 @@ class TestTable(TesterBase):
             except AssertionError:
                 self.verificationErrors.append("__getitem__() method does not handle invalid keys properly.")
 
+    def test___delitem__(self):
+        """ Testing __delitem__() method.
+        Test 1: Deleted keys can no longer be found, but keys further along their cluster still can.
+        Test 2: Deleting a missing key raises a KeyError.
+        Test 3: Tombstones are reused by inserts and compacted away once there are too many.
+        """
+        lookup = {"s1": 5, "s2": 5, "s3": 5, "s4": 7}
+        saved = LinearProbePotionTable.hash
+        LinearProbePotionTable.hash = lambda self, k: lookup.get(k, 0)
+        try:
+            table = LinearProbePotionTable(10, True, 10)
+            for key in lookup:
+                table[key] = key
+
+            # Test 1: s2 sits in the middle of the cluster starting at position 5
+            del table["s2"]
+            self.assertFalse("s2" in table)
+            self.assertEqual((table["s3"], table["s4"], len(table), table.deleted_count), ("s3", "s4", 3, 1))
+
+            # Test 2
+            self.assertRaises(KeyError, table.__delitem__, "s2")
+
+            # Test 3
+            table["s2"] = "again"
+            self.assertEqual((table.table[6], table.deleted_count), (("s2", "again", table.fingerprint("s2")), 0))
+            for key in ["s1", "s2", "s3"]:
+                del table[key]
+
+            self.assertEqual((len(table), table.deleted_count, table["s4"]), (1, 0, "s4"))
+            self.assertEqual(table.statistics()[3], 1)
+        finally:
+            LinearProbePotionTable.hash = saved
+
     def test_initialise_with_tablesize(self):
         """ Testing initialise_with_tablesize() method.
         Test 1: Testing method call.
@@ -354,7 +400,223 @@ class TestTable(TesterBase):
         l["s4"] = "s4"
         LinearProbePotionTable.hash = saved
 
-        self.assertEqual(l.statistics(), (3, 4, 2))
+        self.assertEqual(l.statistics(), (3, 4, 2, 0))
+
+    def test_rehash(self):
+        """ Testing that the table grows once the load factor passes max_load_factor.
+        Test 1: Every key can still be found after the table has been resized.
+        Test 2: The load factor never passes max_load_factor.
+        Test 3: A full table grows instead of rejecting the insert.
+        """
+        table = LinearProbePotionTable(5, True, -1, 0.5)
+        for i in range(200):
+            table.insert(str(i), i)
+            self.assertLessEqual(len(table), 0.5 * len(table.table))
+        self.assertEqual([table[str(i)] for i in range(200)], list(range(200)))
+        self.assertEqual(len(table), 200)
+        self.assertGreater(table.statistics()[3], 0)
+
+        full_table = LinearProbePotionTable(1, True, 2)
+        full_table.insert("0", 0)
+        full_table.insert("1", 1)
+        self.assertTrue(full_table.is_full())
+        full_table.insert("2", 2)
+        self.assertEqual((len(full_table), len(full_table.table), full_table.statistics()[3]), (3, 3, 1))
+        self.assertEqual([full_table[str(i)] for i in range(3)], [0, 1, 2])
+        self.assertRaises(ValueError, LinearProbePotionTable, 5, True, -1, 0)
+        self.assertRaises(TypeError, LinearProbePotionTable, 5, True, -1, "0.5")
+
+    def test_robin_hood(self):
+        """ Testing RobinHoodPotionTable.
+        Test 1: A key far from its home takes the slot of a key closer to its home.
+        Test 2: Deleting a key shifts the rest of its cluster back, leaving no tombstone.
+        Test 3: Every key can still be found after the table has been resized.
+        """
+        lookup = {"s1": 5, "s2": 5, "s3": 6, "s4": 5}
+        saved = RobinHoodPotionTable.hash
+        RobinHoodPotionTable.hash = lambda self, k: lookup.get(k, 6)
+        try:
+            table = RobinHoodPotionTable(10, True, 10)
+            for key in lookup:
+                table[key] = key
+
+            # Test 1: s4 is 2 away from its home at position 7, so it displaces s3 which is only 1 away
+            self.assertEqual([table.table[i][0] for i in range(5, 9)], ["s1", "s2", "s4", "s3"])
+            self.assertEqual(table.statistics(), (3, 5, 2, 0))
+            self.assertFalse("s5" in table)
+
+            # Test 2
+            del table["s2"]
+            self.assertEqual([table.table[i] and table.table[i][0] for i in range(5, 9)], ["s1", "s4", "s3", None])
+            self.assertEqual((table["s3"], len(table), table.deleted_count), ("s3", 3, 0))
+            self.assertRaises(KeyError, table.__delitem__, "s2")
+        finally:
+            RobinHoodPotionTable.hash = saved
+
+        # Test 3
+        table = RobinHoodPotionTable(5, False, -1, 0.5)
+        for i in range(200):
+            table[str(i)] = i
+        self.assertEqual([table.get(str(i)) for i in range(201)], list(range(200)) + [None])
+        self.assertGreater(table.statistics()[3], 0)
+
+    def test_from_items(self):
+        """ Testing from_items() method.
+        Test 1: The table and its statistics are the same as inserting the pairs one by one into a table of that size.
+        Test 2: The last data of a duplicate key is kept.
+        Test 3: The table is sized once for max_load_factor, so it is never resized while loading.
+        """
+        items = [("Potion of " + str(i), i) for i in range(300)]
+        for table_type in [LinearProbePotionTable, CompactLinearProbePotionTable, RobinHoodPotionTable]:
+            for probe_strategy in table_type.PROBE_STRATEGIES:
+                # Test 1
+                table = table_type.from_items(iter(items), False, 1.0, 0, probe_strategy)
+                expected = table_type(len(items), False, -1, 1.0, 0, probe_strategy)
+                for key, data in items:
+                    expected[key] = data
+                self.assertEqual((str(table), len(table)), (str(expected), len(expected)))
+                self.assertEqual(table.statistics(), expected.statistics())
+                self.assertGreater(table.statistics()[0], 0)
+
+        # Test 2
+        table = LinearProbePotionTable.from_items([("a", 1), ("b", 2), ("a", 3)])
+        self.assertEqual((len(table), table["a"], table["b"]), (2, 3, 2))
+
+        # Test 3
+        table = LinearProbePotionTable.from_items(items, True, 0.5)
+        self.assertLessEqual(len(table), 0.5 * table.get_table_size())
+        self.assertEqual(table.statistics()[3], 0)
+        self.assertEqual([table[key] for key, _ in items], list(range(300)))
+        self.assertRaises(ValueError, LinearProbePotionTable.from_items, [])
+        self.assertRaises(TypeError, LinearProbePotionTable.from_items, 1)
+
+    def test_fingerprint(self):
+        """ Testing the fingerprints stored with the keys.
+        Test 1: The fingerprint of a key is a 32 bit integer which does not depend on the tablesize.
+        Test 2: Keys with the same fingerprint are still told apart by comparing them.
+        """
+        # Test 1
+        table = LinearProbePotionTable(5, True, -1, 0.5)
+        table["Potion of Healing"] = 1
+        fingerprint = table.table[table.hash("Potion of Healing")][2]
+        self.assertEqual(fingerprint, table.fingerprint("Potion of Healing"))
+        self.assertTrue(0 <= fingerprint <= 0xFFFFFFFF)
+        for i in range(20):
+            table[str(i)] = i
+        self.assertGreater(table.statistics()[3], 0)
+        self.assertEqual(table.table[table.hash("Potion of Healing")][2], fingerprint)
+
+        # Test 2
+        for table_type in [LinearProbePotionTable, CompactLinearProbePotionTable, RobinHoodPotionTable]:
+            saved = table_type.fingerprint
+            table_type.fingerprint = classmethod(lambda cls, k: 7)
+            try:
+                table = table_type(10, False)
+                for key in ["Potion of Fire", "Potion of Frost", "Potion of Fury"]:
+                    table[key] = key[10:]
+                self.assertEqual([table.get(key) for key in ["Potion of Frost", "Potion of Fury", "Potion of Fame"]],
+                                 ["Frost", "Fury", None])
+            finally:
+                table_type.fingerprint = saved
+
+    def test_compact(self):
+        """ Testing CompactLinearProbePotionTable.
+        Test 1: Keys, data and fingerprints are kept in parallel arrays, with the same statistics as linear probing.
+        Test 2: Deleting a key leaves a tombstone which a new key can reuse.
+        Test 3: Every key can still be found after the table has been resized, with any probe strategy.
+        """
+        saved = CompactLinearProbePotionTable.hash
+        CompactLinearProbePotionTable.hash = lambda self, k: 5
+        try:
+            # Test 1
+            table = CompactLinearProbePotionTable(10, True, 10)
+            for key in ["s1", "s2", "s3"]:
+                table[key] = key.upper()
+            self.assertEqual([table.keys[i] for i in range(5, 9)], ["s1", "s2", "s3", None])
+            self.assertEqual([table.values[i] for i in range(5, 8)], ["S1", "S2", "S3"])
+            self.assertEqual([table.fingerprints[i] for i in range(5, 8)],
+                             [table.fingerprint(key) for key in ["s1", "s2", "s3"]])
+            self.assertEqual(table.statistics(), (2, 3, 2, 0))
+            self.assertEqual((table["s3"], table.get("s4", 0), "s4" in table), ("S3", 0, False))
+
+            # Test 2
+            del table["s2"]
+            self.assertIs(table.keys[6], table.DELETED)
+            self.assertEqual((table["s3"], len(table), table.deleted_count), ("S3", 2, 1))
+            self.assertRaises(KeyError, table.__getitem__, "s2")
+            table["s4"] = "S4"
+            self.assertEqual((table.keys[6], table.deleted_count), ("s4", 0))
+        finally:
+            CompactLinearProbePotionTable.hash = saved
+
+        # Test 3
+        for probe_strategy in CompactLinearProbePotionTable.PROBE_STRATEGIES:
+            table = CompactLinearProbePotionTable(5, False, -1, 0.5, 0, probe_strategy)
+            for i in range(200):
+                table[str(i)] = i
+            for i in range(0, 200, 2):
+                del table[str(i)]
+            self.assertEqual([table.get(str(i)) for i in range(200)], [None if i % 2 == 0 else i for i in range(200)])
+            self.assertGreater(table.statistics()[3], 0)
+
+    def test_probe_strategy(self):
+        """ Testing the quadratic and double hashing probe strategies.
+        Test 1: Colliding keys are placed along the probe sequence of the strategy.
+        Test 2: Changing the strategy places the items again.
+        Test 3: A quadratic sequence running out of empty slots grows the table.
+        """
+        saved = LinearProbePotionTable.hash
+        LinearProbePotionTable.hash = lambda self, k: 2
+        try:
+            # Test 1
+            table = LinearProbePotionTable(10, True, 11, 1.0, 0, "quadratic")
+            for key in ["s1", "s2", "s3", "s4"]:
+                table[key] = key
+            self.assertEqual([table.table[i] and table.table[i][0] for i in [2, 3, 6, 0]], ["s1", "s2", "s3", "s4"])
+            self.assertEqual(table.statistics(), (3, 6, 3, 0))
+
+            step = Potion.step_hash("s2", 11)
+            table = LinearProbePotionTable(10, True, 11, 1.0, 0, "double")
+            table["s1"], table["s2"] = "s1", "s2"
+            self.assertEqual(table.table[(2 + step) % 11][:2], ("s2", "s2"))
+
+            # Test 2
+            table.set_probe_strategy("linear")
+            self.assertEqual((table.table[3][:2], table["s2"], table.statistics()[3]), (("s2", "s2"), "s2", 1))
+            self.assertRaises(ValueError, table.set_probe_strategy, "cubic")
+            self.assertRaises(ValueError, RobinHoodPotionTable, 10, True, -1, 1.0, 0, "double")
+
+            # Test 3: the squares modulo 7 only reach 4 positions from the hash
+            table = LinearProbePotionTable(3, True, 7, 1.0, 0, "quadratic")
+            for i in range(5):
+                table[str(i)] = i
+            self.assertEqual((len(table.table), [table[str(i)] for i in range(5)]), (13, list(range(5))))
+        finally:
+            LinearProbePotionTable.hash = saved
+
+    def test_hash_cache(self):
+        """ Testing the LRU cache of home positions.
+        Test 1: Repeated lookups are answered by the cache and agree with the uncached hash.
+        Test 2: The least recently used name is evicted once the cache is full.
+        Test 3: The cache is cleared when the tablesize or the hash function changes.
+        """
+        table = LinearProbePotionTable(10, True, -1, 1.0, 2)
+        table["a"] = 1
+        table["b"] = 2
+        self.assertEqual((table["a"], table["b"]), (1, 2))
+        self.assertEqual(table.cache_statistics(), (2, 2))
+        self.assertEqual(table.hash("a"), table.hash_uncached("a"))
+
+        table["c"] = 3
+        self.assertEqual(list(table.hash_cache), ["a", "c"])
+
+        table.set_good_hash(False)
+        self.assertEqual(len(table.hash_cache), 0)
+        table.hash("a")
+        table.set_table_size(20, -1)
+        self.assertEqual(len(table.hash_cache), 0)
+        self.assertRaises(ValueError, table.set_hash_cache_size, -1)
+        self.assertRaises(TypeError, table.set_hash_cache_size, "2")
 
     # We are putting the testers for Mutator and Accessor Methods at the bottom
     # as they are relatively insignificant compared to the other methods in the class.
@@ -530,8 +792,8 @@ class TestTable(TesterBase):
             for key in lst:
                 # Inserting the keys into the selected table
                 table.insert(key, key)
-        good_conflict_count, good_probe_total, good_probe_max = good_table.statistics()
-        bad_conflict_count, bad_probe_total, bad_probe_max = bad_table.statistics()
+        good_conflict_count, good_probe_total, good_probe_max, _ = good_table.statistics()
+        bad_conflict_count, bad_probe_total, bad_probe_max, _ = bad_table.statistics()
         print("".join(["---------------------\n",
                        "GOOD TABLE",
                        "\n---------------------",
@@ -0,0 +1,43 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+
+from memory_benchmark import DictAVLTreeNode, bytes_per_node, main, memory_benchmark
+from node import AVLTreeNode, TreeNode
+from tester_base import TesterBase
+
+
+class TestMemoryBenchmark(TesterBase):
+
+    def test_slots(self):
+        """ Testing that the tree nodes keep their attributes in __slots__.
+        Test 1: The nodes have no __dict__, so no attribute outside of the slots can be set.
+        Test 2: A slotted node takes less memory than a node holding the same attributes, size included, in a __dict__.
+        """
+        # Test 1
+        for node in [TreeNode(1, "a"), AVLTreeNode(1, "a")]:
+            self.assertFalse(hasattr(node, "__dict__"))
+            self.assertRaises(AttributeError, setattr, node, "parent", None)
+        node = AVLTreeNode(1, "a")
+        self.assertEqual((node.key, node.item, node.left, node.right, node.height, node.right_count, node.size),
+                         (1, "a", None, None, 1, 0, 1))
+
+        # Test 2
+        self.assertLess(bytes_per_node(AVLTreeNode, 1000), bytes_per_node(DictAVLTreeNode, 1000))
+        self.assertEqual(set(vars(DictAVLTreeNode(1, "a"))), set(TreeNode.__slots__ + AVLTreeNode.__slots__))
+
+    def test_main(self):
+        """ Testing main() function, which prints the results of the memory benchmark as JSON. """
+        output = io.StringIO()
+        with redirect_stdout(output):
+            results = main(["--nodes", "1000"])
+        self.assertEqual(json.loads(output.getvalue()), results)
+        self.assertEqual(results["node_count"], 1000)
+        self.assertGreater(results["saving"], 0)
+        self.assertLess(results["array_avl_tree_bytes_per_node"], results["avl_tree_bytes_per_node"])
+        self.assertRaises(ValueError, memory_benchmark, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
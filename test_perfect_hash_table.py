@@ -0,0 +1,54 @@
+import unittest
+
+from perfect_hash_table import PerfectHashPotionTable
+from tester_base import TesterBase
+
+
+class TestPerfectHashTable(TesterBase):
+
+    def test_build(self):
+        """ Testing the building of a PerfectHashPotionTable.
+        Test 1: Every key has a slot of its own, and the table has no empty slot.
+        Test 2: Keys which are not in the table are not found.
+        Test 3: The last data of a repeated key is kept.
+        Test 4: A larger table is still built with one slot per key, the last buckets taking the free slots left.
+        """
+        names = ["Potion of " + str(i) for i in range(500)]
+        table = PerfectHashPotionTable([(name, i) for i, name in enumerate(names)])
+
+        # Test 1
+        self.assertEqual((len(table), len(table.table)), (500, 500))
+        self.assertEqual([table[name] for name in names], list(range(500)))
+        self.assertEqual(table.statistics()[:3], (0, 0, 0))
+
+        # Test 2
+        self.assertEqual((table.get("Potion of 500", -1), "Potion of 500" in table), (-1, False))
+        self.assertRaises(KeyError, table.__getitem__, "Potion of 500")
+
+        # Test 3
+        table = PerfectHashPotionTable([("a", 1), ("b", 2), ("a", 3)])
+        self.assertEqual((len(table), table["a"], table["b"]), (2, 3, 2))
+        self.assertRaises(ValueError, PerfectHashPotionTable, [])
+        self.assertRaises(TypeError, PerfectHashPotionTable, [(1, 1)])
+
+        # Test 4
+        names = ["Potion of " + str(i) for i in range(20000)]
+        table = PerfectHashPotionTable([(name, i) for i, name in enumerate(names)])
+        self.assertEqual((len(table), len(table.table)), (20000, 20000))
+        self.assertEqual([table[name] for name in names], list(range(20000)))
+        self.assertLessEqual(table.rehash_count, 2)
+
+    def test___setitem__(self):
+        """ Testing __setitem__() method.
+        Test 1: The data of a key can be replaced.
+        Test 2: New keys cannot be inserted.
+        """
+        table = PerfectHashPotionTable([("a", 1), ("b", 2)])
+        table["a"] = 5
+        self.assertEqual((table["a"], len(table)), (5, 2))
+        self.assertRaises(KeyError, table.__setitem__, "c", 3)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPerfectHashTable)
+    unittest.TextTestRunner(verbosity=0).run(suite)
@@ -399,6 +399,23 @@ class TestPotion(TesterBase):
             except AssertionError as e:
                 self.verificationErrors.append(str(e))
 
+    def test_good_hash_unchecked(self):
+        """ Testing good_hash_unchecked() and good_hash_coefficients() methods.
+        Test 1: The multipliers are those listed in test_good_hash().
+        Test 2: The unchecked hash matches good_hash(), with and without precomputed multipliers.
+        Test 3: good_hash() still checks its pre conditions.
+        """
+        tablesize = 47
+        coefficients = Potion.good_hash_coefficients(tablesize, 5)
+        self.assertEqual(coefficients, [31415, 9, 19, 35, 33])
+
+        for potion_name, hash_value in zip(["hello", "aloha", ""], [46, 17, 0]):
+            self.assertEqual(Potion.good_hash_unchecked(potion_name, tablesize), hash_value)
+            self.assertEqual(Potion.good_hash_unchecked(potion_name, tablesize, coefficients), hash_value)
+
+        self.assertRaises(TypeError, Potion.good_hash, 5, tablesize)
+        self.assertRaises(ValueError, Potion.good_hash, "hello", 0)
+
     def test_bad_hash(self):
         """ Testing bad_hash() method.
         Test 1: Testing if the method can be invoked.
@@ -1,6 +1,7 @@
 import unittest
 
-from primes import largest_prime
+import primes
+from primes import largest_prime, next_prime, previous_prime, is_prime, MAX_SIZE
 from tester_base import TesterBase
 
 
@@ -11,8 +12,8 @@ class TestPrimes(TesterBase):
         Test 1: Testing method call.
         Test 2: Testing if the correct value was returned.
         """
-        inputs = [3, 20, 47]
-        outputs = [2, 19, 43]
+        inputs = [3, 20, 47, 100001, 10 ** 9, MAX_SIZE]
+        outputs = [2, 19, 43, 99991, 999999937, 2147483647]
         for i, o in zip(inputs, outputs):
             try:
                 p = largest_prime(i)
@@ -27,7 +28,7 @@ class TestPrimes(TesterBase):
 
     def test_some_invalid_values(self):
         """ Testing with Invalid Numerical Input Values. """
-        bad_input_values = [-1, 0, 2, 100001]
+        bad_input_values = [-1, 0, 2, MAX_SIZE + 1]
         for bad_input in bad_input_values:
             try:
                 self.assertRaises(ValueError, largest_prime, bad_input)
@@ -44,6 +45,29 @@ class TestPrimes(TesterBase):
                 self.verificationErrors.append("largest_prime() method does not handle incorrect types of k properly.")
 
 
+    def test_prime_cache(self):
+        """ Testing that the cache of primes grows on demand and stays sorted and complete. """
+        largest_prime(20)
+        limit = primes._cache_limit
+        self.assertGreaterEqual(limit, 20)
+
+        largest_prime(limit * 3)
+        self.assertGreaterEqual(primes._cache_limit, limit * 3)
+
+        prime_list = primes.sieve(primes._cache_limit)
+        self.assertEqual(primes.cached_primes(limit), [i for i in range(len(prime_list)) if prime_list[i]])
+
+    def test_miller_rabin(self):
+        """ Testing is_prime(), previous_prime() and next_prime() against the sieve. """
+        prime_list = primes.sieve(20000)
+        self.assertEqual([is_prime(i) for i in range(20000)], prime_list)
+        self.assertEqual([previous_prime(k) for k in [3, 20, 47, 100001, 10 ** 9, MAX_SIZE]],
+                         [2, 19, 43, 99991, 999999937, 2147483647])
+        self.assertEqual([next_prime(k) for k in [-5, 2, 19, 99991, 2147483647]], [2, 3, 23, 100003, 2147483659])
+        self.assertFalse(is_prime(3215031751))  # strong pseudoprime to the bases 2, 3, 5 and 7
+        self.assertRaises(ValueError, previous_prime, 2)
+        self.assertRaises(TypeError, next_prime, 2.5)
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestPrimes)
     unittest.TextTestRunner(verbosity=0).run(suite)